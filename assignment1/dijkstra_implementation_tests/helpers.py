@@ -0,0 +1,20 @@
+from typing import Any
+
+from xcollections.graph import Graph, Vertex
+
+
+def path_weight(g: Graph, path: list[Vertex]) -> Any:
+    """Sum of the edge weights along path."""
+    return sum(g.get_edge(u, v).element() for u, v in zip(path, path[1:]))
+
+
+def assert_shortest_path(
+    g: Graph, path: list[Vertex], distance: Any, src: Vertex, dest: Vertex
+) -> None:
+    """path runs from src to dest, weighs distance, and no path is shorter.
+
+    The reference distance comes from a full Dijkstra run on g.
+    """
+    assert path[0] is src and path[-1] is dest
+    assert path_weight(g, path) == distance
+    assert distance == g.dijkstra(src, dest, early_stop=False)[1]
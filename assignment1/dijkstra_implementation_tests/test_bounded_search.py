@@ -0,0 +1,108 @@
+import random
+
+from helpers import assert_shortest_path
+from xcollections.graph import Graph
+from xcollections.pq import IndexedAdaptablePQ, PairingHeapPQ, RadixHeapPQ
+
+
+def test_within_radius_matches_full_tree():
+    g = Graph()
+    m = g.generate_seeded_random_graph(15, 15, seed=24)
+    rng = random.Random(24)
+    for _ in range(10):
+        src = m[rng.randrange(15)][rng.randrange(15)]
+        tree = g.shortest_path_tree(src)
+        for radius in [0, 5, 17.5, 1000]:
+            ball = list(g.within_radius(src, radius))
+            distances = [d for _, d in ball]
+            assert ball[0] == (src, 0)
+            assert distances == sorted(distances)
+            assert dict(ball) == {v: d for v, d in tree.dist.items() if d <= radius}
+
+
+def test_k_nearest_matches_full_tree():
+    g = Graph()
+    m = g.generate_seeded_random_graph(12, 12, seed=25)
+    src = m[3][8]
+    everything = sorted(g.shortest_path_tree(src).dist.values())
+    for k in [1, 10, 144, 500]:
+        search = g.k_nearest(src, k)
+        nearest = list(search)
+        assert nearest[0] == (src, 0)
+        assert [d for _, d in nearest] == everything[:k]
+        assert len({v for v, _ in nearest}) == min(k, 144)
+        # same search object as within_radius, bounded by the settle count
+        assert search.dist == dict(nearest)
+        v, distance = nearest[-1]
+        assert_shortest_path(g, search.path(v), distance, src, v)
+
+    search = g.k_nearest(src, 3)
+    assert search.settle(m[0][0]) == float("inf")
+    assert len(search) == 3 and search.path(m[0][0]) == []
+
+
+def test_bounded_search_is_lazy_and_local():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 1.5)
+    g.add_edge(b, c, 2)
+
+    assert list(g.within_radius(a, 3)) == [(a, 0), (b, 1.5)]
+    assert list(g.within_radius(a, -1)) == []
+    assert list(g.k_nearest(a, 10)) == [(a, 0), (b, 1.5), (c, 3.5)]
+    assert list(g.k_nearest(d, 3)) == [(d, 0)]
+
+    # only the requested part is searched
+    search = g.within_radius(a, 10)
+    assert next(search) == (a, 0)
+    g.add_edge(b, d, 1)
+    assert list(search) == [(b, 1.5), (d, 2.5), (c, 3.5)]
+
+
+def test_bounded_search_zero_weights_and_ties():
+    # B is 0 from A, C and D tie at 2 and E sits exactly on the radius
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    e = g.add_vertex("E")
+    g.add_edge(a, b, 0)
+    g.add_edge(b, c, 2)
+    g.add_edge(a, d, 2)
+    g.add_edge(d, e, 1)
+
+    assert list(g.within_radius(a, 0)) == [(a, 0), (b, 0)]
+    assert dict(g.within_radius(a, 3)) == {a: 0, b: 0, c: 2, d: 2, e: 3}
+
+    # k cuts through the tie, settling only one of C and D
+    nearest = list(g.k_nearest(a, 3))
+    assert nearest[:2] == [(a, 0), (b, 0)] and nearest[2] in [(c, 2), (d, 2)]
+    assert list(g.k_nearest(a, 0)) == []
+
+
+def test_bounded_search_pq_factory():
+    g = Graph()
+    m = g.generate_seeded_random_graph(12, 12, seed=27)
+    src = m[5][5]
+    tree = g.shortest_path_tree(src)
+    ball = {v: d for v, d in tree.dist.items() if d <= 20}
+    for pq_factory in [IndexedAdaptablePQ, PairingHeapPQ, RadixHeapPQ]:
+        assert dict(g.within_radius(src, 20, pq_factory)) == ball
+        nearest = list(g.k_nearest(src, 30, pq_factory))
+        assert [d for _, d in nearest] == sorted(tree.dist.values())[:30]
+        search = g.dijkstra_iter(src, pq_factory)
+        assert dict(search) == tree.dist
+        path, distance = search.shortest_path(m[0][0])
+        assert_shortest_path(g, path, distance, src, m[0][0])
+
+
+if __name__ == "__main__":
+    test_within_radius_matches_full_tree()
+    test_k_nearest_matches_full_tree()
+    test_bounded_search_is_lazy_and_local()
+    test_bounded_search_zero_weights_and_ties()
+    test_bounded_search_pq_factory()
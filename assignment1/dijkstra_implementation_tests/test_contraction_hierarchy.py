@@ -0,0 +1,64 @@
+import random
+
+from helpers import assert_shortest_path
+from xcollections.contraction import ContractionHierarchy
+from xcollections.graph import Graph
+
+
+def test_ch_queries_match_dijkstra():
+    g = Graph()
+    m = g.generate_seeded_random_graph(20, 20, seed=14)
+    ch = ContractionHierarchy(g)
+    rng = random.Random(14)
+
+    assert sorted(ch.rank) == list(range(400))
+
+    for _ in range(40):
+        src = m[rng.randrange(20)][rng.randrange(20)]
+        dest = m[rng.randrange(20)][rng.randrange(20)]
+        path, distance = ch.shortest_path(src, dest)
+        # shortcuts are fully unpacked into original edges
+        assert_shortest_path(g, path, distance, src, dest)
+
+
+def test_ch_same_vertex_and_disconnected_graph():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    e = g.add_vertex("E")
+    g.add_edge(a, b, 1.5)
+    g.add_edge(b, c, 2)
+    g.add_edge(a, c, 5)
+    g.add_edge(d, e, 2.5)
+    g.add_edge(b, b, 0.5)  # self-loops never lie on a shortest path
+    ch = ContractionHierarchy(g)
+
+    assert ch.shortest_path(a, a) == ([a], 0)
+    assert ch.shortest_path(a, c) == ([a, b, c], 3.5)
+    assert ch.shortest_path(c, e) == ([], float("inf"))
+    assert ch.shortest_path(e, d) == ([e, d], 2.5)
+
+
+def test_ch_zero_weights_and_ties():
+    # a path 0 - 1 - ... - 5 whose middle vertices need shortcuts once
+    # contracted, plus an edge 0 - 3 that ties with the path 0 - 1 - 2 - 3
+    g = Graph()
+    vertices = [g.add_vertex(str(i)) for i in range(6)]
+    for (u, v), weight in zip(zip(vertices, vertices[1:]), [0, 2, 0, 2, 0]):
+        g.add_edge(u, v, weight)
+    g.add_edge(vertices[0], vertices[3], 2)
+    ch = ContractionHierarchy(g)
+
+    assert ch.num_shortcuts > 0
+    for src in vertices:
+        for dest in vertices:
+            path, distance = ch.shortest_path(src, dest)
+            assert_shortest_path(g, path, distance, src, dest)
+
+
+if __name__ == "__main__":
+    test_ch_queries_match_dijkstra()
+    test_ch_same_vertex_and_disconnected_graph()
+    test_ch_zero_weights_and_ties()
@@ -0,0 +1,106 @@
+import random
+
+from helpers import assert_shortest_path
+from xcollections.graph import Graph
+
+
+def test_csr_matches_adjacency_map():
+    random.seed(8)
+    g = Graph()
+    m = g.generate_random_graph(25, 20)
+    csr = g.freeze()
+
+    assert csr.num_vertices() == g.num_vertices()
+    assert 2 * csr.num_edges() == g.num_edges()
+
+    source = m[12][10]
+    for dest in [m[0][0], m[24][19], m[12][11]]:
+        for early_stop in [True, False]:
+            path, distance = csr.dijkstra(source, dest, early_stop=early_stop)
+            assert_shortest_path(g, path, distance, source, dest)
+
+    src = csr.index[source]
+    parent, level = csr.breadthfirstsearch(src)
+    marked, max_level = g.breadthfirstsearch(source)
+    assert level.max() == max_level
+    for v, mark in marked.items():
+        expected = 0 if mark is None else mark[1]
+        assert level[csr.index[v]] == expected
+
+    dfs_parent = csr.depthfirstsearch(src)
+    for v, e in g.depthfirstsearch(source).items():
+        expected = v if e is None else e.opposite(v)
+        assert csr.vertices[dfs_parent[csr.index[v]]] is expected
+
+
+def test_csr_dijkstra_stops_at_targets():
+    g = Graph()
+    g.generate_seeded_random_graph(15, 15, seed=8)
+    csr = g.freeze()
+    full, _ = csr.dijkstra_ids(0)
+    targets = [1, 15, 16]
+
+    dist, prev = csr.dijkstra_ids(0, targets=targets)
+    assert [dist[t] for t in targets] == [full[t] for t in targets]
+    assert csr.distances_to(0, targets) == [full[t] for t in targets]
+    assert csr.distances_to(0, []) == []
+    # settling the last target ends the search before the far corner
+    assert float("inf") in dist
+    assert csr.path_ids(prev, 16)[0] == 0
+
+
+def test_csr_vectorised_bfs():
+    g = Graph()
+    m = g.generate_seeded_random_graph(30, 25, seed=20)
+    csr = g.freeze()
+    src = csr.index[m[10][10]]
+
+    parent, level = csr.breadthfirstsearch(src)
+    fast_parent, fast_level = csr.breadthfirstsearch(src, vectorised=True)
+    assert (fast_level == level).all()
+    assert fast_parent[src] == src
+    for v in range(csr.num_vertices()):
+        if v != src:
+            # the parent is a neighbour one level closer to the source
+            assert fast_level[fast_parent[v]] == fast_level[v] - 1
+            assert fast_parent[v] in csr.neighbours(v)[0]
+
+
+def test_csr_unreachable_vertices():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 2.5)
+    csr = g.freeze()
+
+    # c has no edges, so its row is empty, and a float weight makes the array float
+    assert csr.indptr.tolist() == [0, 1, 2, 2]
+    assert csr.weights.dtype.kind == "f"
+    assert csr.degree(csr.index[c]) == 0
+    assert csr.dijkstra(a, c) == ([], float("inf"))
+    parent, level = csr.breadthfirstsearch(csr.index[a])
+    assert parent.tolist() == [0, 0, -1]
+    assert level.tolist() == [0, 1, -1]
+    parent, level = csr.breadthfirstsearch(csr.index[a], vectorised=True)
+    assert parent.tolist() == [0, 0, -1]
+    assert level.tolist() == [0, 1, -1]
+    assert csr.depthfirstsearch(csr.index[c]).tolist() == [-1, -1, 2]
+
+    # a frozen view is a read-only snapshot
+    g.add_edge(b, c, 0)
+    assert csr.dijkstra(a, c) == ([], float("inf"))
+    assert g.freeze().dijkstra(a, c) == ([a, b, c], 2.5)
+    try:
+        csr.weights[0] = 1
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("frozen weights are writable")
+
+
+if __name__ == "__main__":
+    test_csr_matches_adjacency_map()
+    test_csr_dijkstra_stops_at_targets()
+    test_csr_vectorised_bfs()
+    test_csr_unreachable_vertices()
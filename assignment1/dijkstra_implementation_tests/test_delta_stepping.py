@@ -0,0 +1,113 @@
+import numpy as np
+
+from xcollections import delta_stepping as delta_stepping_module
+from xcollections.delta_stepping import DeltaStepping, delta_stepping
+from xcollections.graph import Graph
+
+
+def test_delta_stepping_matches_dijkstra():
+    g = Graph()
+    g.generate_seeded_random_graph(20, 20, seed=17)
+    csr = g.freeze()
+    expected, _ = csr.dijkstra_ids(0)
+
+    for delta in [1, 3, 10, 1000, None]:
+        assert delta_stepping(csr, 0, delta).tolist() == expected
+
+
+def test_delta_stepping_reuses_instance():
+    g = Graph()
+    g.generate_seeded_random_graph(10, 10, seed=2)
+    csr = g.freeze()
+
+    with DeltaStepping(csr, delta=4) as engine:
+        for src in [0, 45, 99]:
+            assert engine.run(src).tolist() == csr.dijkstra_ids(src)[0]
+    try:
+        engine.run(0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected a ValueError after close()")
+
+
+def test_delta_stepping_workers():
+    g = Graph()
+    g.generate_seeded_random_graph(15, 15, seed=3)
+    csr = g.freeze()
+
+    # send every relaxation batch to the pool, however small
+    min_edges = delta_stepping_module.PARALLEL_MIN_EDGES
+    delta_stepping_module.PARALLEL_MIN_EDGES = 1
+    try:
+        dist = delta_stepping(csr, 7, 5, workers=2)
+    finally:
+        delta_stepping_module.PARALLEL_MIN_EDGES = min_edges
+    assert dist.tolist() == csr.dijkstra_ids(7)[0]
+
+
+def test_delta_stepping_float_weights_and_unreachable():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 0.5)
+    g.add_edge(b, c, 2.25)
+    g.add_edge(a, c, 3.0)
+    csr = g.freeze()
+
+    # many nearly empty buckets, a few mixed light and heavy ones, or a
+    # single bucket holding everything all give the same distances
+    for delta in [0.1, 1.0, 100.0]:
+        dist = delta_stepping(csr, csr.index[a], delta=delta)
+        assert dist.tolist() == [0, 0.5, 2.75, np.inf]
+
+
+def test_delta_stepping_zero_weights():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 0)
+    g.add_edge(b, c, 0)
+    engine = DeltaStepping(g.freeze())
+
+    assert engine.delta == 1.0
+    assert engine.run(0).tolist() == [0, 0, 0]
+    engine.close()
+
+    # zero weights behind a heavy edge are relaxed again within its bucket
+    d = g.add_vertex("D")
+    g.add_edge(c, d, 3)
+    g.add_edge(a, d, 5)
+    with DeltaStepping(g.freeze(), delta=2.0) as engine:
+        assert engine.run(3).tolist() == [3, 3, 3, 0]
+
+
+def test_delta_stepping_rejects_bad_delta():
+    g = Graph()
+    g.generate_seeded_random_graph(3, 3, seed=0)
+    try:
+        DeltaStepping(g.freeze(), delta=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected a ValueError")
+
+    g.add_edge(g.vertices()[0], g.vertices()[1], -1)
+    try:
+        DeltaStepping(g.freeze())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected a ValueError for a negative weight")
+
+
+if __name__ == "__main__":
+    test_delta_stepping_matches_dijkstra()
+    test_delta_stepping_reuses_instance()
+    test_delta_stepping_workers()
+    test_delta_stepping_float_weights_and_unreachable()
+    test_delta_stepping_zero_weights()
+    test_delta_stepping_rejects_bad_delta()
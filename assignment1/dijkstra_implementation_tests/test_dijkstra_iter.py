@@ -0,0 +1,82 @@
+from helpers import assert_shortest_path, path_weight
+from xcollections.graph import Graph
+
+
+def test_dijkstra_iter_settle_order_and_paths():
+    g = Graph()
+    m = g.generate_seeded_random_graph(12, 12, seed=25)
+    src = m[6][6]
+    tree = g.shortest_path_tree(src)
+    search = g.dijkstra_iter(src)
+
+    steps = list(search)
+    assert steps[0] == (src, 0)
+    assert [d for _, d in steps] == sorted(tree.dist.values())
+    assert dict(steps) == tree.dist
+    for row in m:
+        for dest in row:
+            path, distance = search.shortest_path(dest)
+            assert distance == tree.distance(dest)
+            assert path[0] is src and path[-1] is dest
+            assert path_weight(g, path) == distance
+
+
+def test_dijkstra_iter_stops_early():
+    g = Graph()
+    m = g.generate_seeded_random_graph(10, 10, seed=26)
+    src, dest = m[0][0], m[9][9]
+    search = g.dijkstra_iter(src)
+    assert search and len(search) == 0
+
+    first = [next(search) for _ in range(5)]
+    assert len(search) == 5
+    assert dest not in search
+    assert search.shortest_path(dest) == ([], float("inf"))
+
+    distance = search.settle(dest)
+    assert_shortest_path(g, search.path(dest), distance, src, dest)
+    # settling again does not advance the search
+    settled = len(search)
+    assert search.settle(first[-1][0]) == first[-1][1]
+    assert len(search) == settled
+
+
+def test_dijkstra_iter_unreachable():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 2.5)
+    search = g.dijkstra_iter(a)
+
+    assert search.settle(c) == float("inf")
+    assert list(search) == []
+    assert search.shortest_path(b) == ([a, b], 2.5)
+    assert search.path(c) == []
+
+
+def test_dijkstra_iter_zero_weights_and_ties():
+    # B is 0 from A, and D is 2 away through both B and C
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 0)
+    g.add_edge(a, c, 1)
+    g.add_edge(b, d, 2)
+    g.add_edge(c, d, 1)
+    search = g.dijkstra_iter(a)
+
+    assert search.settle(a) == 0 and len(search) == 1
+    assert next(search) == (b, 0)
+    assert search.shortest_path(b) == ([a, b], 0)
+    assert list(search) == [(c, 1), (d, 2)]
+    assert path_weight(g, search.path(d)) == 2
+
+
+if __name__ == "__main__":
+    test_dijkstra_iter_settle_order_and_paths()
+    test_dijkstra_iter_stops_early()
+    test_dijkstra_iter_unreachable()
+    test_dijkstra_iter_zero_weights_and_ties()
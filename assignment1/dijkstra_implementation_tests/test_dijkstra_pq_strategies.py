@@ -0,0 +1,70 @@
+import itertools
+import random
+
+from helpers import assert_shortest_path
+from xcollections.graph import Graph
+from xcollections.pq import (
+    AdaptablePQ,
+    AdaptablePQUnsortedList,
+    DaryHeapPQ,
+    IndexedAdaptablePQ,
+    PairingHeapPQ,
+    RadixHeapPQ,
+    SimplePQ,
+)
+
+PQ_STRATEGIES = [
+    AdaptablePQ,
+    AdaptablePQUnsortedList,
+    DaryHeapPQ,
+    IndexedAdaptablePQ,
+    PairingHeapPQ,
+    RadixHeapPQ,
+    SimplePQ,
+]
+
+
+def test_dijkstra_pq_strategies_agree():
+    random.seed(16)
+    g = Graph()
+    m = g.generate_random_graph(20, 20)
+    source = m[10][10]
+
+    for dest in [m[0][0], m[19][0], m[10][11]]:
+        _, expected_distance = g.dijkstra(source, dest)
+        for pq_factory in PQ_STRATEGIES:
+            for early_stop, lazy in itertools.product([True, False], repeat=2):
+                path, distance = g.dijkstra(
+                    source,
+                    dest,
+                    early_stop=early_stop,
+                    pq_factory=pq_factory,
+                    lazy=lazy,
+                )
+                assert distance == expected_distance, pq_factory.__name__
+                assert_shortest_path(g, path, distance, source, dest)
+
+
+def test_lazy_dijkstra_unreachable_destination():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 3)
+    g.add_edge(c, d, 0)
+
+    for pq_factory in PQ_STRATEGIES:
+        # the other component is never entered, with or without early stop
+        for early_stop in [True, False]:
+            result = g.dijkstra(
+                a, c, early_stop=early_stop, pq_factory=pq_factory, lazy=True
+            )
+            assert result == ([], float("inf")), pq_factory.__name__
+        assert g.dijkstra(c, d, pq_factory=pq_factory, lazy=True) == ([c, d], 0)
+    assert g.dijkstra(a, a, lazy=True) == ([a], 0)
+
+
+if __name__ == "__main__":
+    test_dijkstra_pq_strategies_agree()
+    test_lazy_dijkstra_unreachable_destination()
@@ -0,0 +1,66 @@
+import random
+
+from helpers import assert_shortest_path
+from xcollections.graph import RADIX_HEAP_MAX_WEIGHT, Graph
+
+
+def test_dijkstra_radix_heap_matches_binary_heap():
+    random.seed(2516)
+    g = Graph()
+    m = g.generate_random_graph(30, 30)
+    source = m[15][15]
+
+    assert g.small_int_weights
+
+    for dest in [m[0][0], m[29][29], m[15][16], m[15][15]]:
+        expected = g.dijkstra(source, dest)
+        path, distance = g.shortest_path(source, dest)
+        assert_shortest_path(g, path, distance, source, dest)
+
+        _, all_nodes_distance = g.dijkstra_radix_heap(source, dest, early_stop=False)
+        assert all_nodes_distance == expected[1]
+
+
+def test_shortest_path_float_and_large_weights():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 1.5)
+    g.add_edge(b, c, 2)
+    g.add_edge(a, c, 4)
+
+    assert not g.small_int_weights
+    assert g.shortest_path(a, c) == ([a, b, c], 3.5)
+
+    # integers past the radix heap's range are not small either
+    g.add_edge(a, b, RADIX_HEAP_MAX_WEIGHT + 1)
+    g.add_edge(b, c, 1)
+    assert not g.small_int_weights
+    g.add_edge(a, b, RADIX_HEAP_MAX_WEIGHT)
+    assert g.small_int_weights
+    assert g.shortest_path(a, c) == ([a, c], 4)
+
+
+def test_dijkstra_radix_heap_zero_weights_and_ties():
+    # a zero weight pushes a priority equal to the last popped one
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 0)
+    g.add_edge(b, c, 0)
+    g.add_edge(a, d, 3)
+    g.add_edge(c, d, 3)
+
+    assert g.dijkstra_radix_heap(a, c) == ([a, b, c], 0)
+    # two paths of weight 3 to d, either may come back
+    path, distance = g.dijkstra_radix_heap(a, d, early_stop=False)
+    assert distance == 3 and path in ([a, d], [a, b, c, d])
+
+
+if __name__ == "__main__":
+    test_dijkstra_radix_heap_matches_binary_heap()
+    test_shortest_path_float_and_large_weights()
+    test_dijkstra_radix_heap_zero_weights_and_ties()
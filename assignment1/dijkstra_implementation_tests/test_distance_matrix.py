@@ -0,0 +1,36 @@
+import numpy as np
+
+from xcollections.graph import Graph
+
+
+def test_distance_matrix_matches_dijkstra():
+    g = Graph()
+    m = g.generate_seeded_random_graph(12, 12, seed=16)
+    sources = [m[0][0], m[5][7], m[11][3]]
+    targets = [m[0][0], m[11][11], m[6][2], m[3][9], m[6][2]]
+
+    expected = np.array([[g.dijkstra(s, t)[1] for t in targets] for s in sources])
+    assert (g.distance_matrix(sources, targets, workers=1) == expected).all()
+    assert (g.distance_matrix(sources, targets, workers=2) == expected).all()
+
+
+def test_distance_matrix_unreachable_and_empty():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 1.5)
+    g.add_edge(b, d, 0)
+    inf = float("inf")
+
+    # c is isolated; more workers than sources, and a repeated target
+    result = g.distance_matrix([a, c], [b, c, d, b], workers=4)
+    assert result.tolist() == [[1.5, inf, 1.5, 1.5], [inf, 0, inf, inf]]
+    assert g.distance_matrix([], [a, b]).shape == (0, 2)
+    assert g.distance_matrix([a, b], [], workers=2).shape == (2, 0)
+
+
+if __name__ == "__main__":
+    test_distance_matrix_matches_dijkstra()
+    test_distance_matrix_unreachable_and_empty()
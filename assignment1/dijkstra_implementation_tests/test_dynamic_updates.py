@@ -0,0 +1,137 @@
+import random
+
+from helpers import assert_shortest_path
+from xcollections.dynamic import REMOVED, DynamicShortestPaths
+from xcollections.graph import Graph
+
+
+def test_remove_and_update_edges_keep_weight_stats():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 1)
+    g.add_edge(b, c, 2.5)
+    g.add_edge(a, c, 4)
+    assert not g.small_int_weights and g.min_weight == 1
+
+    g.update_weight(b, c, 3)
+    assert g.small_int_weights
+    assert g.dijkstra(a, c) == ([a, c], 4)
+
+    g.remove_edge(a, b)
+    assert g.min_weight == 3
+    assert b not in g.graph[a] and a not in g.graph[b]
+    assert g.dijkstra(a, b) == ([a, c, b], 7)
+
+    g.update_weights([(a, c, 2), (c, b, 2)])
+    assert g.min_weight == 2
+    assert g.get_edge(b, c).element() == 2
+
+
+def test_remove_self_loop_and_lightest_edges():
+    g = Graph()
+    a, b = g.add_vertex("A"), g.add_vertex("B")
+    g.add_edge(a, a, 1)
+    g.add_edge(a, b, 1)
+    g.add_edge(b, b, 0.5)
+
+    g.remove_edge(b, b)
+    assert b not in g.graph[b] and g.min_weight == 1
+    g.remove_edge(a, a)
+    assert g.graph[a] == {b: g.get_edge(a, b)} and g.min_weight == 1
+    g.update_weight(a, b, 6)
+    assert g.min_weight == 6
+    g.remove_edge(b, a)
+    assert g.min_weight == float("inf") and g.num_edges() == 0
+
+
+def test_updates_invalidate_tree_cache():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    g.add_edge(a, b, 5)
+    assert g.shortest_path_tree(a).distance(b) == 5
+
+    g.update_weight(a, b, 2)
+    assert g.shortest_path_tree(a).distance(b) == 2
+    g.remove_edge(b, a)
+    assert g.shortest_path_tree(a).distance(b) == float("inf")
+
+
+def test_incremental_repair_matches_recomputation():
+    g = Graph()
+    m = g.generate_seeded_random_graph(15, 15, seed=18)
+    src = m[7][7]
+    tree = DynamicShortestPaths(g, src)
+    edges = [(e.u, e.v) for e in g.edges()]
+    rng = random.Random(18)
+
+    for _ in range(100):
+        batch = []
+        for _ in range(rng.randint(1, 4)):
+            u, v = rng.choice(edges)
+            if rng.random() < 0.2 and v in g.graph[u]:
+                batch.append((u, v, REMOVED))
+            else:
+                batch.append((u, v, rng.randint(1, 10)))
+        tree.apply(batch)
+
+        expected = g.shortest_path_tree(src)
+        assert tree.dist == expected.dist
+        for v in rng.sample(list(tree.dist), 5):
+            assert_shortest_path(g, tree.path(v), tree.distance(v), src, v)
+
+
+def test_repair_across_components_zero_weights_and_ties():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    e = g.add_vertex("E")
+    g.add_edge(a, b, 1)
+    g.add_edge(a, c, 1)
+    g.add_edge(b, d, 1)
+    g.add_edge(c, d, 1)
+    tree = DynamicShortestPaths(g, a)
+    assert tree.distance(e) == float("inf")
+
+    # a zero weight edge joins E's component to the tree
+    tree.add_edge(d, e, 0)
+    assert tree.distance(e) == 2 and tree.path(e)[-2:] == [d, e]
+
+    # D hangs off one of two tied parents, cutting that one keeps its distance
+    tree.remove_edge(tree.prev[d], d)
+    assert tree.distance(d) == 2 and tree.distance(e) == 2
+    assert_shortest_path(g, tree.path(e), tree.distance(e), a, e)
+
+    # and cutting the other too splits the graph again
+    tree.apply([(tree.prev[d], d, REMOVED), (b, c, 0)])
+    assert tree.distance(d) == tree.distance(e) == float("inf")
+    assert tree.distance(b) == tree.distance(c) == 1
+
+
+def test_incremental_repair_is_local():
+    g = Graph()
+    m = g.generate_seeded_random_graph(20, 20, seed=4)
+    tree = DynamicShortestPaths(g, m[0][0])
+    leaf = max(tree.dist, key=tree.dist.get)
+    parent = tree.prev[leaf]
+
+    tree.update_weight(parent, leaf, g.get_edge(parent, leaf).element() + 1)
+    assert tree.last_repair_size < 10
+    tree.remove_edge(m[19][18], m[19][19])
+    tree.remove_edge(m[18][19], m[19][19])
+    assert tree.distance(m[19][19]) == float("inf")
+    tree.add_edge(m[19][19], m[0][1], 1)
+    assert tree.distance(m[19][19]) == tree.distance(m[0][1]) + 1
+
+
+if __name__ == "__main__":
+    test_remove_and_update_edges_keep_weight_stats()
+    test_remove_self_loop_and_lightest_edges()
+    test_updates_invalidate_tree_cache()
+    test_incremental_repair_matches_recomputation()
+    test_repair_across_components_zero_weights_and_ties()
+    test_incremental_repair_is_local()
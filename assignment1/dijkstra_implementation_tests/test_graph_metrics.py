@@ -0,0 +1,154 @@
+import random
+
+from xcollections import metrics
+from xcollections.graph import Graph
+
+
+def brute_force_eccentricities(g):
+    return {v: g.breadthfirstsearch(v)[1] for v in g}
+
+
+def test_metrics_on_grid():
+    g = Graph()
+    m = g.generate_seeded_random_graph(9, 12, seed=21)
+
+    assert g.eccentricity(m[0][0]) == 19
+    assert g.diameter() == 19
+    assert g.radius() == 10
+    assert set(g.center()) == {m[4][5], m[4][6]}
+
+
+def test_metrics_match_brute_force():
+    for seed in range(40):
+        rng = random.Random(seed)
+        g = Graph()
+        vertices = [g.add_vertex(f"v{i}") for i in range(rng.randint(2, 40))]
+        for _ in range(2 * len(vertices)):
+            u, v = rng.sample(vertices, 2)
+            g.add_edge(u, v, 1)
+
+        ecc = brute_force_eccentricities(g)
+        radius = min(ecc.values())
+        assert g.diameter() == max(ecc.values())
+        assert g.radius() == radius
+        assert set(g.center()) == {v for v in vertices if ecc[v] == radius}
+
+
+def test_multi_source_bfs_matches_single_source():
+    g = Graph()
+    m = g.generate_seeded_random_graph(12, 11, seed=22)
+    # more than one 64 source batch, with a repeated source
+    sources = [v for row in m for v in row][:70] + [m[0][0]]
+    targets = [m[11][10], m[5][5], m[0][0]]
+
+    ecc = g.eccentricities()
+    assert ecc == brute_force_eccentricities(g)
+    assert g.eccentricities(sources[:3]) == {v: ecc[v] for v in sources[:3]}
+
+    hops = g.hop_distances(sources, targets)
+    assert hops.shape == (71, 3)
+    for i, src in enumerate(sources):
+        marked, _ = g.breadthfirstsearch(src)
+        for j, dest in enumerate(targets):
+            assert hops[i, j] == (0 if dest is src else marked[dest][1])
+
+
+def test_multi_source_bfs_unreachable():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 7)
+
+    assert g.hop_distances([a, c], [a, b, c]).tolist() == [[0, 1, -1], [-1, -1, 0]]
+    assert g.eccentricities() == {a: 1, b: 1, c: 0}
+
+
+def test_multi_source_bfs_ignores_weights_and_self_loops():
+    # hops, not weights: the zero weight edge still counts as one hop, and
+    # D is two hops away along both of its tied routes
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 0)
+    g.add_edge(a, c, 9)
+    g.add_edge(b, d, 1)
+    g.add_edge(c, d, 1)
+    g.add_edge(d, d, 1)
+
+    assert g.hop_distances([a, d], [a, d]).tolist() == [[0, 2], [2, 0]]
+    assert g.eccentricities() == {a: 2, b: 2, c: 2, d: 2}
+
+
+def test_metrics_per_component():
+    # eccentricities only look at reachable vertices, like breadthfirstsearch
+    g = Graph()
+    path = [g.add_vertex(f"p{i}") for i in range(5)]
+    for u, v in zip(path, path[1:]):
+        g.add_edge(u, v, 1)
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    g.add_edge(a, b, 1)
+
+    assert g.eccentricity(path[0]) == 4
+    assert g.diameter() == 4
+    assert g.radius() == 1
+    assert set(g.center()) == {a, b}
+
+
+def test_metrics_many_components():
+    # large components go through the bound search, small ones are batched
+    rng = random.Random(21)
+    g = Graph()
+    m = g.generate_seeded_random_graph(9, 12, seed=21)
+    for size in [1, 2, 3, 4, 5, 70, 90] * 3:
+        vertices = [g.add_vertex(f"c{size}_{i}") for i in range(size)]
+        for i in range(1, size):
+            g.add_edge(vertices[i], vertices[rng.randrange(i)], 1)
+        for _ in range(size // 10):
+            u, v = rng.sample(vertices, 2)
+            g.add_edge(u, v, 1)
+
+    csr = g.freeze()
+    label = metrics.components(csr)
+    assert label.max() + 1 == 22
+    for v in [0, csr.num_vertices() - 1, csr.num_vertices() // 2]:
+        reached = csr.breadthfirstsearch(v)[1] >= 0
+        assert (reached == (label == label[v])).all()
+
+    ecc = brute_force_eccentricities(g)
+    radius = min(ecc.values())
+    assert g.diameter() == max(ecc.values()) == 19
+    assert g.radius() == radius == 0
+    assert set(g.center()) == {v for v in g if ecc[v] == 0}
+
+    g.add_edge(m[0][0], m[0][0], 1)  # a self loop does not make a hub
+    isolated = [v for v in g if ecc[v] == 0]
+    for v in isolated:
+        g.add_edge(v, m[0][1], 1)
+    ecc = brute_force_eccentricities(g)
+    radius = min(ecc.values())
+    assert g.radius() == radius
+    assert set(g.center()) == {v for v in g if ecc[v] == radius}
+
+
+def test_metrics_empty_graph():
+    try:
+        Graph().diameter()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected a ValueError")
+
+
+if __name__ == "__main__":
+    test_metrics_on_grid()
+    test_metrics_match_brute_force()
+    test_multi_source_bfs_matches_single_source()
+    test_multi_source_bfs_unreachable()
+    test_multi_source_bfs_ignores_weights_and_self_loops()
+    test_metrics_per_component()
+    test_metrics_many_components()
+    test_metrics_empty_graph()
@@ -0,0 +1,85 @@
+from xcollections.graph import Graph
+from xcollections.grid import GridGraph
+
+
+def test_grid_graph_matches_materialised_graph():
+    grid = GridGraph.random(15, 12, seed=42)
+    g, m = grid.to_graph()
+
+    assert grid.num_vertices() == g.num_vertices()
+    assert 2 * grid.num_edges() == g.num_edges()
+
+    source = (7, 6)
+    for dest in [(0, 0), (14, 11), (7, 7), (7, 6)]:
+        for early_stop in [True, False]:
+            path, distance = grid.dijkstra(source, dest, early_stop=early_stop)
+            expected = g.dijkstra(m[source[0]][source[1]], m[dest[0]][dest[1]])
+            assert distance == expected[1]
+            assert path[0] == source and path[-1] == dest
+
+    parent, level = grid.breadthfirstsearch(source)
+    marked, max_level = g.breadthfirstsearch(m[7][6])
+    assert level.max() == max_level
+    for row in range(15):
+        for col in range(12):
+            mark = marked[m[row][col]]
+            assert level[grid.vertex_id((row, col))] == (0 if mark is None else mark[1])
+
+    dfs_parent = grid.depthfirstsearch(source)
+    dfs_marked = g.depthfirstsearch(m[7][6])
+    for row in range(15):
+        for col in range(12):
+            v = m[row][col]
+            e = dfs_marked[v]
+            expected = v if e is None else e.opposite(v)
+            assert expected.element() == "v{}_{}".format(
+                *grid.cell(dfs_parent[grid.vertex_id((row, col))])
+            )
+
+
+def test_grid_graph_float_weights():
+    grid = GridGraph.random(8, 9, seed=9)
+    horizontal = grid.horizontal / 4
+    vertical = grid.vertical / 4
+    grid = GridGraph(horizontal, vertical)
+    g, m = grid.to_graph()
+
+    for dest in [(0, 0), (7, 8), (3, 5)]:
+        path, distance = grid.dijkstra((4, 4), dest)
+        assert distance == g.dijkstra(m[4][4], m[dest[0]][dest[1]])[1]
+        assert path[0] == (4, 4) and path[-1] == dest
+    dist, _ = grid.dijkstra_ids(0, 1)
+    assert dist[grid.num_vertices() - 1] == float("inf")
+
+
+def test_grid_graph_rejects_mismatched_weights():
+    grid = GridGraph.random(3, 4, seed=1)
+    try:
+        GridGraph(grid.horizontal, grid.vertical[:, :2])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected a ValueError")
+
+
+def test_seeded_random_graph_is_reproducible():
+    g1, g2 = Graph(), Graph()
+    m1 = g1.generate_seeded_random_graph(20, 30, seed=5)
+    m2 = g2.generate_seeded_random_graph(20, 30, seed=5)
+
+    assert len(m1) == 20 and len(m1[0]) == 30
+    assert g1.num_edges() == 2 * (20 * 29 + 19 * 30)
+    weights1 = [e.element() for e in g1.edges()]
+    assert weights1 == [e.element() for e in g2.edges()]
+    assert all(1 <= w <= 15 for w in weights1)
+    assert g1.small_int_weights
+
+    grid = GridGraph.random(20, 30, seed=5)
+    assert grid.dijkstra((0, 0), (19, 29))[1] == g1.dijkstra(m1[0][0], m1[19][29])[1]
+
+
+if __name__ == "__main__":
+    test_grid_graph_matches_materialised_graph()
+    test_grid_graph_float_weights()
+    test_grid_graph_rejects_mismatched_weights()
+    test_seeded_random_graph_is_reproducible()
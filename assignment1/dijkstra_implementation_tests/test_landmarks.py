@@ -0,0 +1,93 @@
+import os
+import random
+import tempfile
+
+from helpers import assert_shortest_path
+from xcollections.graph import Graph
+from xcollections.landmarks import Landmarks
+
+
+def test_alt_queries_match_dijkstra():
+    g = Graph()
+    m = g.generate_seeded_random_graph(25, 25, seed=13)
+    landmarks = Landmarks.build(g, k=4, seed=13)
+    rng = random.Random(13)
+
+    assert landmarks.distances.shape == (4, 625)
+    assert len(set(landmarks.landmarks.tolist())) == 4
+
+    for _ in range(30):
+        src = m[rng.randrange(25)][rng.randrange(25)]
+        dest = m[rng.randrange(25)][rng.randrange(25)]
+        _, expected = g.dijkstra(src, dest)
+        assert landmarks.heuristic(src, dest) <= expected
+        path, distance = landmarks.shortest_path(src, dest)
+        assert_shortest_path(g, path, distance, src, dest)
+
+
+def test_alt_save_and_load():
+    g = Graph()
+    m = g.generate_seeded_random_graph(10, 10, seed=3)
+    landmarks = Landmarks.build(g, k=3, seed=3)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "landmarks.npz")
+        landmarks.save(path)
+        loaded = Landmarks.load(path, g)
+
+    assert (loaded.landmarks == landmarks.landmarks).all()
+    assert (loaded.distances == landmarks.distances).all()
+    assert loaded.shortest_path(m[0][0], m[9][9])[1] == g.dijkstra(m[0][0], m[9][9])[1]
+
+
+def test_alt_disconnected_graph():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    e = g.add_vertex("E")
+    g.add_edge(a, b, 1.5)
+    g.add_edge(c, d, 2.5)
+    # three components, so at least one is left without a landmark
+    landmarks = Landmarks.build(g, k=2, seed=0)
+
+    assert landmarks.distances.dtype.kind == "f"
+    assert landmarks.heuristic(a, c) == float("inf")
+    assert landmarks.shortest_path(a, d) == ([], float("inf"))
+    assert landmarks.shortest_path(c, d) == ([c, d], 2.5)
+    assert landmarks.shortest_path(e, e) == ([e], 0)
+    # asking for more landmarks than vertices picks every vertex once
+    assert sorted(Landmarks.build(g, k=10, seed=0).landmarks.tolist()) == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+
+
+def test_alt_zero_weights_and_ties():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 0)
+    g.add_edge(b, d, 2)
+    g.add_edge(a, c, 1)
+    g.add_edge(c, d, 1)
+    landmarks = Landmarks.build(g, k=2, seed=1)
+
+    assert landmarks.distances.dtype.kind == "i"
+    assert landmarks.heuristic(a, b) == 0
+    # two paths of weight 2, either may come back
+    path, distance = landmarks.shortest_path(a, d)
+    assert distance == 2 and path in ([a, b, d], [a, c, d])
+
+
+if __name__ == "__main__":
+    test_alt_queries_match_dijkstra()
+    test_alt_save_and_load()
+    test_alt_disconnected_graph()
+    test_alt_zero_weights_and_ties()
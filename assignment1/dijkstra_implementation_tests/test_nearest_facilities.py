@@ -0,0 +1,131 @@
+import random
+
+from helpers import assert_shortest_path
+from xcollections.graph import Graph
+
+
+def test_voronoi_matches_single_source_trees():
+    g = Graph()
+    m = g.generate_seeded_random_graph(12, 12, seed=23)
+    rng = random.Random(23)
+    depots = [m[rng.randrange(12)][rng.randrange(12)] for _ in range(5)]
+    trees = [g.shortest_path_tree(d) for d in depots]
+    partition = g.multi_source_dijkstra(depots)
+
+    assert len(partition) == 144
+    for v in g.vertices():
+        distance = min(tree.distance(v) for tree in trees)
+        owner = partition.nearest(v)
+        assert partition.distance(v) == distance
+        assert g.shortest_path_tree(owner).distance(v) == distance
+        assert_shortest_path(g, partition.path(v), distance, owner, v)
+    assert sum(len(cell) for cell in partition.cells().values()) == 144
+
+
+def test_voronoi_unreachable_and_empty():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 1.5)
+    partition = g.multi_source_dijkstra([a, a])
+
+    assert partition.shortest_path(b) == ([a, b], 1.5)
+    assert partition.nearest(c) is None
+    assert partition.shortest_path(c) == ([], float("inf"))
+    assert partition.cells() == {a: [a, b]}
+
+    try:
+        g.multi_source_dijkstra([])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for no sources")
+
+
+def test_voronoi_zero_weights_and_ties():
+    # C is 0 from B through a zero weight edge, and D ties between A and B
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(b, c, 0)
+    g.add_edge(a, d, 2)
+    g.add_edge(c, d, 2)
+    partition = g.multi_source_dijkstra([a, b])
+
+    assert partition.nearest(c) is b and partition.distance(c) == 0
+    assert partition.distance(d) == 2 and partition.nearest(d) in (a, b)
+    owner = partition.nearest(d)
+    assert_shortest_path(g, partition.path(d), 2, owner, d)
+    assert sorted(len(cell) for cell in partition.cells().values()) in ([1, 3], [2, 2])
+
+
+def test_k_nearest_facilities_matches_brute_force():
+    g = Graph()
+    m = g.generate_seeded_random_graph(10, 10, seed=24)
+    rng = random.Random(24)
+    facilities = list(
+        dict.fromkeys(m[rng.randrange(10)][rng.randrange(10)] for _ in range(6))
+    )
+    trees = {f: g.shortest_path_tree(f) for f in facilities}
+    nearest = g.k_nearest_facilities(facilities, 3)
+
+    for v in g.vertices():
+        expected = sorted(tree.distance(v) for tree in trees.values())[:3]
+        labels = nearest[v]
+        assert [d for _, d in labels] == expected
+        assert len({f for f, _ in labels}) == 3
+        for f, d in labels:
+            assert trees[f].distance(v) == d
+
+
+def test_k_nearest_facilities_fewer_reachable():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 1)
+    g.add_edge(b, c, 2)
+
+    nearest = g.k_nearest_facilities([a, c, d], 2)
+    assert nearest[b] == [(a, 1), (c, 2)]
+    assert nearest[a] == [(a, 0), (c, 3)]
+    assert nearest[d] == [(d, 0)]
+
+
+def test_k_nearest_facilities_zero_weights_and_ties():
+    # B is 0 from facility A and 1 from both C and D, so one of the tied
+    # facilities fills its second slot
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 0)
+    g.add_edge(b, c, 1)
+    g.add_edge(b, d, 1)
+
+    nearest = g.k_nearest_facilities([a, a, c, d], 2)
+    assert nearest[b][0] == (a, 0)
+    assert nearest[b][1] in [(c, 1), (d, 1)]
+    assert nearest[a] == [(a, 0), nearest[b][1]]
+    assert nearest[c] == [(c, 0), (a, 1)]
+
+    try:
+        g.k_nearest_facilities([a], 0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for k < 1")
+
+
+if __name__ == "__main__":
+    test_voronoi_matches_single_source_trees()
+    test_voronoi_unreachable_and_empty()
+    test_voronoi_zero_weights_and_ties()
+    test_k_nearest_facilities_matches_brute_force()
+    test_k_nearest_facilities_fewer_reachable()
+    test_k_nearest_facilities_zero_weights_and_ties()
@@ -0,0 +1,168 @@
+import random
+
+from helpers import assert_shortest_path
+from xcollections.graph import Graph
+from xcollections.pq import RadixHeapPQ, SimplePQ
+
+
+def test_bidirectional_dijkstra_matches_dijkstra():
+    g = Graph()
+    m = g.generate_seeded_random_graph(25, 25, seed=11)
+    rng = random.Random(11)
+
+    for _ in range(30):
+        src = m[rng.randrange(25)][rng.randrange(25)]
+        dest = m[rng.randrange(25)][rng.randrange(25)]
+        for pq_factory in [None, RadixHeapPQ, SimplePQ]:
+            kwargs = {} if pq_factory is None else {"pq_factory": pq_factory}
+            path, distance = g.bidirectional_dijkstra(src, dest, **kwargs)
+            assert_shortest_path(g, path, distance, src, dest)
+
+
+def test_bidirectional_dijkstra_unreachable_and_trivial():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 4)
+    g.add_edge(b, b, 1)
+
+    assert g.bidirectional_dijkstra(a, c) == ([], float("inf"))
+    assert g.bidirectional_dijkstra(a, a) == ([a], 0)
+    assert g.bidirectional_dijkstra(a, b) == ([a, b], 4)
+
+
+def test_bidirectional_dijkstra_zero_weights_and_ties():
+    # the searches first meet at M, but the zero weight edges make the
+    # route through X and Y shorter; B and C tie on the way from X to D
+    g = Graph()
+    s = g.add_vertex("S")
+    m = g.add_vertex("M")
+    t = g.add_vertex("T")
+    x = g.add_vertex("X")
+    y = g.add_vertex("Y")
+    g.add_edge(s, m, 3)
+    g.add_edge(m, t, 3)
+    g.add_edge(s, x, 4)
+    g.add_edge(x, y, 0)
+    g.add_edge(y, t, 1)
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(x, b, 1)
+    g.add_edge(x, c, 1)
+    g.add_edge(b, d, 1)
+    g.add_edge(c, d, 1)
+
+    for src, dest in [(s, t), (t, s), (x, y), (x, d), (s, d)]:
+        for pq_factory in [RadixHeapPQ, SimplePQ]:
+            path, distance = g.bidirectional_dijkstra(src, dest, pq_factory=pq_factory)
+            assert_shortest_path(g, path, distance, src, dest)
+    assert g.bidirectional_dijkstra(s, t)[1] == 5
+
+
+def test_astar_manhattan_matches_dijkstra():
+    g = Graph()
+    m = g.generate_seeded_random_graph(30, 20, seed=12)
+    rng = random.Random(12)
+    heuristic = g.manhattan_heuristic()
+
+    assert g.unit_grid
+    assert g.coordinates[m[4][7]] == (4, 7)
+    assert heuristic(m[0][0], m[2][3]) == 5 * g.min_weight
+
+    for _ in range(30):
+        src = m[rng.randrange(30)][rng.randrange(20)]
+        dest = m[rng.randrange(30)][rng.randrange(20)]
+        for pq_factory in [RadixHeapPQ, SimplePQ]:
+            path, distance = g.astar(src, dest, pq_factory=pq_factory)
+            assert_shortest_path(g, path, distance, src, dest)
+
+
+def test_astar_custom_heuristic():
+    g = Graph()
+    a = g.add_vertex("A", (0, 0))
+    b = g.add_vertex("B", (3, 4))
+    c = g.add_vertex("C", (6, 0))
+    d = g.add_vertex("D", (9, 9))
+    g.add_edge(a, b, 5)
+    g.add_edge(b, c, 5)
+    g.add_edge(a, c, 12)
+
+    def euclidean(v, dest):
+        (x1, y1), (x2, y2) = g.coordinates[v], g.coordinates[dest]
+        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+
+    assert g.astar(a, c, euclidean) == ([a, b, c], 10)
+    assert g.astar(a, d, euclidean) == ([], float("inf"))
+
+
+def test_astar_default_heuristic_without_grid():
+    # coordinates that are not unit steps, or none at all, fall back to Dijkstra
+    g = Graph()
+    a = g.add_vertex("A", (0, 0))
+    b = g.add_vertex("B", (3, 4))
+    c = g.add_vertex("C", (6, 0))
+    g.add_edge(a, b, 5)
+    g.add_edge(b, c, 5)
+    g.add_edge(a, c, 12)
+    assert not g.unit_grid
+    assert g.astar(a, c) == g.dijkstra(a, c) == ([a, b, c], 10)
+
+    # no coordinates at all, with a zero weight and a vertex out of reach
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 0)
+    g.add_edge(b, c, 3)
+    g.add_edge(a, c, 6)
+    assert not g.unit_grid
+    assert g.astar(a, c) == ([a, b, c], 3)
+    assert g.astar(a, d) == ([], float("inf"))
+
+
+def test_unit_grid_flag_cleared_by_off_grid_edges():
+    g = Graph()
+    m = g.generate_seeded_random_graph(6, 6, seed=12)
+    assert g.unit_grid
+    g.add_edge(m[0][1], m[1][1], 1)  # reweighting a grid edge keeps it
+    assert g.unit_grid
+
+    # a shortcut across the grid would make the Manhattan estimate too high
+    g.add_edge(m[0][0], m[5][5], 1)
+    assert not g.unit_grid
+    assert g.astar(m[0][0], m[5][5]) == ([m[0][0], m[5][5]], 1)
+
+    g = Graph()
+    g.generate_random_graph(3, 3)
+    assert g.unit_grid
+    g.add_vertex("x")
+    assert not g.unit_grid
+
+
+def test_min_weight_counts_self_loops():
+    g = Graph()
+    a = g.add_vertex("A", (0, 0))
+    b = g.add_vertex("B", (0, 1))
+    g.add_edge(a, b, 1)
+    g.add_edge(a, a, 2)
+    assert g.min_weight == 1 and not g.unit_grid
+
+    # replacing the only lightest edge rescans, and the self-loop counts once
+    g.add_edge(a, b, 3)
+    assert (g.min_weight, g._min_weight_count) == (2, 1)
+    g.add_edge(a, a, 5)
+    assert (g.min_weight, g._min_weight_count) == (3, 1)
+
+
+if __name__ == "__main__":
+    test_bidirectional_dijkstra_matches_dijkstra()
+    test_bidirectional_dijkstra_unreachable_and_trivial()
+    test_bidirectional_dijkstra_zero_weights_and_ties()
+    test_astar_manhattan_matches_dijkstra()
+    test_astar_custom_heuristic()
+    test_astar_default_heuristic_without_grid()
+    test_unit_grid_flag_cleared_by_off_grid_edges()
+    test_min_weight_counts_self_loops()
@@ -0,0 +1,98 @@
+import random
+
+from helpers import assert_shortest_path
+from xcollections.graph import Graph
+
+
+def test_tree_matches_dijkstra():
+    g = Graph()
+    m = g.generate_seeded_random_graph(15, 15, seed=15)
+    rng = random.Random(15)
+    src = m[7][7]
+    tree = g.shortest_path_tree(src)
+
+    assert len(tree) == 225
+    for _ in range(30):
+        dest = m[rng.randrange(15)][rng.randrange(15)]
+        path, distance = tree.shortest_path(dest)
+        assert_shortest_path(g, path, distance, src, dest)
+
+
+def test_tree_unreachable_vertex():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    d = g.add_vertex("D")
+    g.add_edge(a, b, 2.5)
+    g.add_edge(b, d, 0)
+    tree = g.shortest_path_tree(a)
+
+    assert len(tree) == 3
+    assert tree.shortest_path(a) == ([a], 0)
+    assert tree.shortest_path(b) == ([a, b], 2.5)
+    assert tree.shortest_path(d) == ([a, b, d], 2.5)
+    assert c not in tree
+    assert tree.shortest_path(c) == ([], float("inf"))
+
+
+def test_tree_cache_hits_and_eviction():
+    g = Graph(tree_cache_size=2)
+    m = g.generate_seeded_random_graph(5, 5, seed=1)
+    a, b, c = m[0][0], m[2][2], m[4][4]
+
+    tree = g.shortest_path_tree(a)
+    assert g.shortest_path_tree(a) is tree
+    g.shortest_path_tree(b)
+    g.shortest_path_tree(a)  # a is now the most recently used
+    g.shortest_path_tree(c)  # evicts b
+    info = g.tree_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 3, 2, 2)
+
+    g.shortest_path_tree(b)
+    assert g.tree_cache_info().misses == 4
+    assert g.shortest_path_tree(c) is not None
+    assert g.tree_cache_info().hits == 3
+
+    g.clear_tree_cache()
+    assert g.tree_cache_info() == (0, 0, 2, 0)
+
+
+def test_tree_cache_invalidated_by_changes():
+    g = Graph()
+    a = g.add_vertex("A")
+    b = g.add_vertex("B")
+    c = g.add_vertex("C")
+    g.add_edge(a, b, 5)
+    g.add_edge(b, c, 5)
+    assert g.shortest_path_tree(a).distance(c) == 10
+
+    g.add_edge(a, c, 3)
+    assert g.shortest_path_tree(a).distance(c) == 3
+
+    d = g.add_vertex("D")
+    assert g.tree_cache_info().currsize == 0
+    assert g.shortest_path_tree(a).distance(d) == float("inf")
+    assert g.tree_cache_info().misses == 3
+
+    # a grid added next to the cached trees clears them too
+    g.generate_random_graph(2, 2)
+    assert g.tree_cache_info().currsize == 0
+
+
+def test_tree_cache_disabled():
+    g = Graph(tree_cache_size=0)
+    m = g.generate_seeded_random_graph(4, 4, seed=2)
+
+    first = g.shortest_path_tree(m[0][0])
+    assert g.shortest_path_tree(m[0][0]) is not first
+    assert first.dist == g.shortest_path_tree(m[0][0]).dist
+    assert g.tree_cache_info() == (0, 3, 0, 0)
+
+
+if __name__ == "__main__":
+    test_tree_matches_dijkstra()
+    test_tree_unreachable_vertex()
+    test_tree_cache_hits_and_eviction()
+    test_tree_cache_invalidated_by_changes()
+    test_tree_cache_disabled()
@@ -0,0 +1,77 @@
+import sys
+
+from xcollections.graph import Graph
+
+
+def recursive_dfs(g, v, marked):
+    # the recursive search Graph.depthfirstsearch used to run
+    for e in g.get_edges(v):
+        w = e.opposite(v)
+        if w not in marked:
+            marked[w] = e
+            recursive_dfs(g, w, marked)
+    return marked
+
+
+def test_dfs_matches_recursive_order():
+    g = Graph()
+    m = g.generate_seeded_random_graph(12, 12, seed=19)
+    source = m[5][5]
+
+    expected = recursive_dfs(g, source, {source: None})
+    marked = g.depthfirstsearch(source)
+    assert list(marked.items()) == list(expected.items())
+
+
+def test_dfs_deeper_than_recursion_limit():
+    g = Graph()
+    m = g.generate_seeded_random_graph(150, 150, seed=0)
+    marked = g.depthfirstsearch(m[0][0])
+
+    assert len(marked) == 150 * 150
+    assert max(depth for _, _, depth in g.iter_dfs(m[0][0])) > sys.getrecursionlimit()
+
+
+def test_iter_dfs_depths_follow_parent_edges():
+    g = Graph()
+    m = g.generate_seeded_random_graph(8, 8, seed=1)
+    depth_of = {}
+    for v, e, depth in g.iter_dfs(m[3][3]):
+        if e is None:
+            assert v is m[3][3] and depth == 0
+        else:
+            assert depth == depth_of[e.opposite(v)] + 1
+        depth_of[v] = depth
+
+
+def test_iter_bfs_matches_breadthfirstsearch():
+    g = Graph()
+    m = g.generate_seeded_random_graph(10, 10, seed=2)
+    marked, max_level = g.breadthfirstsearch(m[0][0])
+
+    steps = list(g.iter_bfs(m[0][0]))
+    assert steps[0] == (m[0][0], None, 0)
+    assert [(v, (e, depth)) for v, e, depth in steps[1:]] == list(marked.items())[1:]
+    assert steps[-1][2] == max_level == 18
+
+
+def test_iterators_stop_early():
+    g = Graph()
+    m = g.generate_seeded_random_graph(10, 10, seed=3)
+
+    for traversal in (g.iter_dfs, g.iter_bfs):
+        steps = traversal(m[4][4])
+        first = [next(steps) for _ in range(5)]
+        assert len({v for v, _, _ in first}) == 5
+
+    # the first vertex at depth 3 is found without visiting the rest
+    found = next(v for v, _, depth in g.iter_bfs(m[0][0]) if depth == 3)
+    assert sum(abs(a - b) for a, b in zip(g.coordinates[found], (0, 0))) == 3
+
+
+if __name__ == "__main__":
+    test_dfs_matches_recursive_order()
+    test_dfs_deeper_than_recursion_limit()
+    test_iter_dfs_depths_follow_parent_edges()
+    test_iter_bfs_matches_breadthfirstsearch()
+    test_iterators_stop_early()
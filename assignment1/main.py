@@ -1,9 +1,25 @@
 import sys
 import os
+import heapq
+import random
+from dataclasses import dataclass, field
+from typing import Any
 
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 from xcollections.graph import Graph
+from xcollections.contraction import ContractionHierarchy
+from xcollections.delta_stepping import DeltaStepping
+from xcollections.dynamic import DynamicShortestPaths
+from xcollections.landmarks import Landmarks
+from xcollections.pq import (
+    AdaptablePQ,
+    DaryHeapPQ,
+    IndexedAdaptablePQ,
+    PairingHeapPQ,
+    RadixHeapPQ,
+    SimplePQ,
+)
 from timeit import timeit
 from prettyplots.runtime import (
     plot_runtime_growth,
@@ -33,7 +49,7 @@ def run_q3():
         times_for_size = []
         for run in range(runs_per_size):
             g = Graph()
-            m = g.generate_random_graph(size, size)
+            m = g.generate_seeded_random_graph(size, size, seed=run)
 
             source = m[size // 2][size // 2]
             dest = m[0][0]
@@ -72,11 +88,14 @@ def run_q4():
 
     distances = [0, 25, 50, 75, 100, 125, 150, 175, 200, 225, 250]
     early_stop_times = []
+    lazy_early_stop_times = []
+    bidirectional_times = []
+    astar_times = []
     all_nodes_times = []
     path_lengths = []
 
     g = Graph()
-    m = g.generate_random_graph(grid_size, grid_size)
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
     source = m[center][center]
 
     for d in distances:
@@ -89,6 +108,15 @@ def run_q4():
         def early_stop_wrapper():
             return g.dijkstra(source, destination, False, early_stop=True)
 
+        def lazy_early_stop_wrapper():
+            return g.dijkstra(source, destination, False, early_stop=True, lazy=True)
+
+        def bidirectional_wrapper():
+            return g.bidirectional_dijkstra(source, destination)
+
+        def astar_wrapper():
+            return g.astar(source, destination)
+
         def all_nodes_wrapper():
             return g.dijkstra(source, destination, False, early_stop=False)
 
@@ -96,6 +124,18 @@ def run_q4():
         early_stop_avg = early_stop_time / iterations
         early_stop_times.append(early_stop_avg)
 
+        lazy_early_stop_time = timeit(lazy_early_stop_wrapper, number=iterations)
+        lazy_early_stop_avg = lazy_early_stop_time / iterations
+        lazy_early_stop_times.append(lazy_early_stop_avg)
+
+        bidirectional_time = timeit(bidirectional_wrapper, number=iterations)
+        bidirectional_avg = bidirectional_time / iterations
+        bidirectional_times.append(bidirectional_avg)
+
+        astar_time = timeit(astar_wrapper, number=iterations)
+        astar_avg = astar_time / iterations
+        astar_times.append(astar_avg)
+
         all_nodes_time = timeit(all_nodes_wrapper, number=iterations)
         all_nodes_avg = all_nodes_time / iterations
         all_nodes_times.append(all_nodes_avg)
@@ -109,11 +149,26 @@ def run_q4():
             f"Early stop time: {early_stop_avg:.6f}s, All nodes time: {all_nodes_avg:.6f}s"
         )
         logger.info(f"Speedup: {all_nodes_avg / early_stop_avg:.2f}x")
+        logger.info(
+            f"Lazy early stop time: {lazy_early_stop_avg:.6f}s, "
+            f"speedup over early stop: {early_stop_avg / lazy_early_stop_avg:.2f}x"
+        )
+        logger.info(
+            f"Bidirectional time: {bidirectional_avg:.6f}s, "
+            f"speedup over early stop: {early_stop_avg / bidirectional_avg:.2f}x"
+        )
+        logger.info(
+            f"A* (Manhattan) time: {astar_avg:.6f}s, "
+            f"speedup over early stop: {early_stop_avg / astar_avg:.2f}x"
+        )
 
     plot_dijkstra_comparison(
         distances=distances,
         early_stop_times=early_stop_times,
         all_nodes_times=all_nodes_times,
+        lazy_early_stop_times=lazy_early_stop_times,
+        bidirectional_times=bidirectional_times,
+        astar_times=astar_times,
     )
     logger.info("Q4 plot saved as 'dijkstra_comparison.png'")
     return distances, early_stop_times, all_nodes_times, path_lengths
@@ -131,7 +186,7 @@ def run_q5():
 
         for run in range(3):  # Run multiple instances for averaging
             g = Graph()
-            m = g.generate_random_graph(size, size)
+            m = g.generate_seeded_random_graph(size, size, seed=run)
 
             source = m[size // 2][size // 2]
             dest = m[0][0]
@@ -190,7 +245,7 @@ def run_q6():
 
         for run in range(3):  # Run multiple instances for averaging
             g = Graph()
-            m = g.generate_random_graph(size, size)
+            m = g.generate_seeded_random_graph(size, size, seed=run)
 
             source = m[size // 2][size // 2]
             dest = m[0][0]
@@ -245,9 +300,9 @@ def run_combined_comparison():
         unsorted_times = []
         simple_times = []
 
-        for _ in range(2):
+        for run in range(2):
             g = Graph()
-            m = g.generate_random_graph(size, size)
+            m = g.generate_seeded_random_graph(size, size, seed=run)
 
             source = m[size // 2][size // 2]
             dest = m[0][0]
@@ -298,6 +353,507 @@ def run_combined_comparison():
     return sizes, binary_heap_times, unsorted_list_times, simple_pq_times
 
 
+def run_pq_backends():
+    logger.info("Comparing priority queue backends of the Dijkstra engine")
+    sizes = [50, 100, 150, 200]
+    backends = [
+        AdaptablePQ,
+        IndexedAdaptablePQ,
+        DaryHeapPQ,
+        PairingHeapPQ,
+        RadixHeapPQ,
+        SimplePQ,
+    ]
+    iterations = 2
+
+    times = {backend.__name__: [] for backend in backends}
+    for size in sizes:
+        g = Graph()
+        m = g.generate_seeded_random_graph(size, size, seed=size)
+        source = m[size // 2][size // 2]
+        dest = m[0][0]
+
+        logger.info(f"Size {size}x{size}:")
+        for backend in backends:
+
+            def backend_wrapper():
+                return g.dijkstra(source, dest, False, pq_factory=backend)
+
+            avg = timeit(backend_wrapper, number=iterations) / iterations
+            times[backend.__name__].append(avg)
+            logger.info(f"  {backend.__name__}: {avg:.6f}s")
+
+    return sizes, times
+
+
+# the heap entry used by pq.py before entries became plain lists, kept here as
+# the baseline for run_pq_entries
+@dataclass(order=True)
+class LegacyPrioritizedItem:
+    priority: int | float
+    count: int = field(compare=True)
+    item: Any = field(compare=False)
+    REMOVED: bool = field(default=False, compare=False)
+
+
+def run_pq_entries():
+    logger.info("Microbenchmark: dataclass vs list heap entries (push + pop)")
+    n = 100_000
+    iterations = 5
+    priorities = [random.randint(1, 1000) for _ in range(n)]
+
+    def dataclass_entries():
+        heap = []
+        for count, priority in enumerate(priorities):
+            heapq.heappush(heap, LegacyPrioritizedItem(priority, count, count))
+        while heap:
+            heapq.heappop(heap)
+
+    def list_entries():
+        heap = []
+        for count, priority in enumerate(priorities):
+            heapq.heappush(heap, [priority, count, count, False])
+        while heap:
+            heapq.heappop(heap)
+
+    dataclass_time = timeit(dataclass_entries, number=iterations) / iterations
+    list_time = timeit(list_entries, number=iterations) / iterations
+
+    logger.info(f"Dataclass entries: {dataclass_time / n * 1e9:.1f} ns per push+pop")
+    logger.info(f"List entries: {list_time / n * 1e9:.1f} ns per push+pop")
+    logger.info(f"Speedup: {dataclass_time / list_time:.2f}x")
+    return dataclass_time, list_time
+
+
+def run_alt():
+    logger.info("Comparing ALT preprocessing cost against per-query speedup")
+    grid_size = 300
+    num_queries = 20
+    rng = random.Random(0)
+
+    g = Graph()
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    queries = [
+        (
+            m[rng.randrange(grid_size)][rng.randrange(grid_size)],
+            m[rng.randrange(grid_size)][rng.randrange(grid_size)],
+        )
+        for _ in range(num_queries)
+    ]
+
+    results = []
+    for k in [2, 4, 8, 16]:
+        landmarks = None
+
+        def build_wrapper():
+            nonlocal landmarks
+            landmarks = Landmarks.build(g, k=k, seed=0)
+
+        def dijkstra_wrapper():
+            return [g.dijkstra(s, t, False, lazy=True) for s, t in queries]
+
+        def alt_wrapper():
+            return [landmarks.shortest_path(s, t) for s, t in queries]
+
+        build_time = timeit(build_wrapper, number=1)
+        dijkstra_avg = timeit(dijkstra_wrapper, number=1) / num_queries
+        alt_avg = timeit(alt_wrapper, number=1) / num_queries
+        saved_per_query = dijkstra_avg - alt_avg
+        break_even = build_time / saved_per_query if saved_per_query > 0 else None
+        results.append((k, build_time, dijkstra_avg, alt_avg))
+
+        logger.info(f"{k} landmarks on {grid_size}x{grid_size}:")
+        logger.info(f"  Preprocessing: {build_time:.3f}s")
+        logger.info(f"  Dijkstra query: {dijkstra_avg:.6f}s, ALT query: {alt_avg:.6f}s")
+        logger.info(f"  Speedup: {dijkstra_avg / alt_avg:.2f}x")
+        if break_even is not None:
+            logger.info(f"  Preprocessing pays off after {break_even:.1f} queries")
+
+    return results
+
+
+def run_ch():
+    logger.info(
+        "Comparing contraction hierarchy preprocessing against per-query speedup"
+    )
+    # the build is pure Python and much slower than ALT's, so a smaller grid
+    grid_size = 100
+    num_queries = 50
+    rng = random.Random(0)
+
+    g = Graph()
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    queries = [
+        (
+            m[rng.randrange(grid_size)][rng.randrange(grid_size)],
+            m[rng.randrange(grid_size)][rng.randrange(grid_size)],
+        )
+        for _ in range(num_queries)
+    ]
+    ch = None
+
+    def build_wrapper():
+        nonlocal ch
+        ch = ContractionHierarchy(g)
+
+    def dijkstra_wrapper():
+        return [g.dijkstra(s, t, False, lazy=True) for s, t in queries]
+
+    def ch_wrapper():
+        return [ch.shortest_path(s, t) for s, t in queries]
+
+    build_time = timeit(build_wrapper, number=1)
+    dijkstra_avg = timeit(dijkstra_wrapper, number=1) / num_queries
+    ch_avg = timeit(ch_wrapper, number=1) / num_queries
+    saved_per_query = dijkstra_avg - ch_avg
+
+    logger.info(f"Contraction hierarchy on {grid_size}x{grid_size}:")
+    logger.info(f"  Preprocessing: {build_time:.3f}s, {ch.num_shortcuts} shortcuts")
+    logger.info(f"  Dijkstra query: {dijkstra_avg:.6f}s, CH query: {ch_avg:.6f}s")
+    logger.info(f"  Speedup: {dijkstra_avg / ch_avg:.2f}x")
+    if saved_per_query > 0:
+        logger.info(
+            f"  Preprocessing pays off after {build_time / saved_per_query:.1f} queries"
+        )
+
+    return build_time, dijkstra_avg, ch_avg
+
+
+def run_distance_matrix():
+    logger.info("Scaling of the parallel distance matrix with the number of workers")
+    grid_size = 200
+    num_sources = 64
+    num_targets = 1000
+    rng = random.Random(0)
+
+    g = Graph()
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    vertices = [v for row in m for v in row]
+    sources = rng.sample(vertices, num_sources)
+    targets = rng.sample(vertices, num_targets)
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    times = []
+    for workers in worker_counts:
+
+        def matrix_wrapper():
+            return g.distance_matrix(sources, targets, workers=workers)
+
+        elapsed = timeit(matrix_wrapper, number=1)
+        times.append(elapsed)
+        logger.info(
+            f"  {workers} workers: {elapsed:.3f}s, speedup {times[0] / elapsed:.2f}x"
+        )
+
+    return worker_counts, times
+
+
+def run_delta_stepping():
+    logger.info("Sweeping delta and worker count of delta-stepping against Dijkstra")
+    grid_size = 500
+    center = grid_size // 2
+    iterations = 3
+
+    g = Graph()
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    source = m[center][center]
+    csr = g.freeze()
+    src = csr.index[source]
+
+    def all_nodes_wrapper():
+        return g.dijkstra(source, m[0][0], False, early_stop=False)
+
+    def csr_wrapper():
+        return csr.dijkstra_ids(src)
+
+    all_nodes_avg = timeit(all_nodes_wrapper, number=1)
+    csr_avg = timeit(csr_wrapper, number=iterations) / iterations
+    logger.info(f"  Graph.dijkstra all nodes: {all_nodes_avg:.6f}s")
+    logger.info(f"  CSRGraph.dijkstra_ids: {csr_avg:.6f}s")
+
+    # edge weights are drawn from [1, grid_size // 2]
+    deltas = [5, 25, 125, 250, 1000]
+    worker_counts = sorted({1, 2, os.cpu_count() or 1})
+    times = {}
+    for workers in worker_counts:
+        for delta in deltas:
+            with DeltaStepping(csr, delta, workers) as engine:
+
+                def delta_stepping_wrapper():
+                    return engine.run(src)
+
+                avg = timeit(delta_stepping_wrapper, number=iterations) / iterations
+            times[(delta, workers)] = avg
+            logger.info(
+                f"  delta {delta}, {workers} workers: {avg:.6f}s "
+                f"({all_nodes_avg / avg:.2f}x vs Graph.dijkstra)"
+            )
+
+    return all_nodes_avg, csr_avg, times
+
+
+def run_dynamic():
+    logger.info("Comparing incremental shortest path repair against recomputation")
+    grid_size = 300
+    center = grid_size // 2
+    num_batches = 20
+    rng = random.Random(0)
+
+    g = Graph()
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    source = m[center][center]
+    edges = [(e.u, e.v) for e in g.edges()]
+    max_weight = grid_size // 2
+    tree = DynamicShortestPaths(g, source)
+
+    results = []
+    for batch_size in [1, 10, 100, 1000]:
+        batches = [
+            [
+                (*rng.choice(edges), rng.randint(1, max_weight))
+                for _ in range(batch_size)
+            ]
+            for _ in range(num_batches)
+        ]
+        repair_sizes = []
+
+        def repair_wrapper():
+            for batch in batches:
+                tree.apply(batch)
+                repair_sizes.append(tree.last_repair_size)
+
+        def recompute_wrapper():
+            g.clear_tree_cache()
+            return g.shortest_path_tree(source)
+
+        repair_avg = timeit(repair_wrapper, number=1) / num_batches
+        recompute_avg = timeit(recompute_wrapper, number=3) / 3
+        size_avg = sum(repair_sizes) / len(repair_sizes)
+        results.append((batch_size, repair_avg, recompute_avg, size_avg))
+
+        logger.info(f"Batches of {batch_size} weight updates:")
+        logger.info(f"  Repair: {repair_avg:.6f}s, {size_avg:.1f} vertices touched")
+        logger.info(f"  Recompute: {recompute_avg:.6f}s")
+        logger.info(f"  Speedup: {recompute_avg / repair_avg:.2f}x")
+
+    return results
+
+
+def run_bfs():
+    logger.info("Comparing whole-graph BFS engines on a 1000x1000 grid")
+    grid_size = 1000
+
+    g = Graph()
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    source = m[0][0]
+    csr = g.freeze()
+    src = csr.index[source]
+
+    def graph_wrapper():
+        return g.breadthfirstsearch(source)
+
+    def csr_wrapper():
+        return csr.breadthfirstsearch(src)
+
+    def vectorised_wrapper():
+        return csr.breadthfirstsearch(src, vectorised=True)
+
+    graph_time = timeit(graph_wrapper, number=1)
+    csr_time = timeit(csr_wrapper, number=1)
+    vectorised_time = timeit(vectorised_wrapper, number=1)
+
+    logger.info(f"  Graph.breadthfirstsearch: {graph_time:.3f}s")
+    logger.info(f"  CSRGraph.breadthfirstsearch: {csr_time:.3f}s")
+    logger.info(
+        f"  CSRGraph.breadthfirstsearch(vectorised=True): {vectorised_time:.3f}s "
+        f"({graph_time / vectorised_time:.2f}x vs Graph)"
+    )
+
+    return graph_time, csr_time, vectorised_time
+
+
+def run_center():
+    logger.info("Diameter and center by eccentricity bounds vs one BFS per vertex")
+    results = []
+    for grid_size in [100, 300, 500]:
+        g = Graph()
+        m = g.generate_seeded_random_graph(grid_size, grid_size, seed=grid_size)
+        num_vertices = grid_size * grid_size
+
+        def bfs_wrapper():
+            return g.breadthfirstsearch(m[0][0])
+
+        def diameter_wrapper():
+            return g.diameter()
+
+        def center_wrapper():
+            return g.center()
+
+        # BFS from every vertex, as lab5/main.py does, is extrapolated from one run
+        naive_time = timeit(bfs_wrapper, number=1) * num_vertices
+        diameter_time = timeit(diameter_wrapper, number=1)
+        center_time = timeit(center_wrapper, number=1)
+        results.append((grid_size, naive_time, diameter_time, center_time))
+
+        logger.info(f"Size {grid_size}x{grid_size}:")
+        logger.info(f"  BFS from every vertex (estimated): {naive_time:.1f}s")
+        logger.info(f"  Diameter: {diameter_time:.3f}s, center: {center_time:.3f}s")
+
+    return results
+
+
+def run_ms_bfs():
+    logger.info(
+        "Eccentricity of every vertex: one BFS per vertex vs bit-parallel MS-BFS"
+    )
+    grid_size = 70
+    g = Graph()
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    vertices = [v for row in m for v in row]
+    csr = g.freeze()
+
+    def graph_bfs_wrapper():
+        return [g.breadthfirstsearch(v)[1] for v in vertices]
+
+    def vectorised_bfs_wrapper():
+        return [
+            csr.breadthfirstsearch(i, vectorised=True)[1].max()
+            for i in range(len(vertices))
+        ]
+
+    def ms_bfs_wrapper():
+        return g.eccentricities()
+
+    graph_bfs_time = timeit(graph_bfs_wrapper, number=1)
+    vectorised_bfs_time = timeit(vectorised_bfs_wrapper, number=1)
+    ms_bfs_time = timeit(ms_bfs_wrapper, number=1)
+
+    logger.info(f"All {len(vertices)} eccentricities on {grid_size}x{grid_size}:")
+    logger.info(f"  Graph.breadthfirstsearch per vertex: {graph_bfs_time:.3f}s")
+    logger.info(f"  Vectorised CSR BFS per vertex: {vectorised_bfs_time:.3f}s")
+    logger.info(
+        f"  MS-BFS, 64 sources per sweep: {ms_bfs_time:.3f}s "
+        f"({graph_bfs_time / ms_bfs_time:.2f}x vs Graph, "
+        f"{vectorised_bfs_time / ms_bfs_time:.2f}x vs vectorised)"
+    )
+
+    return graph_bfs_time, vectorised_bfs_time, ms_bfs_time
+
+
+def run_nearest_facilities():
+    logger.info("Nearest of K depots for every vertex: K Dijkstra runs vs one")
+    grid_size = 200
+    g = Graph(tree_cache_size=0)
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    rng = random.Random(0)
+    results = []
+    for k in [4, 16, 64]:
+        depots = [
+            m[rng.randrange(grid_size)][rng.randrange(grid_size)] for _ in range(k)
+        ]
+
+        def per_depot_wrapper():
+            trees = [g.shortest_path_tree(d) for d in depots]
+            return {v: min(t.distance(v) for t in trees) for v in g.graph}
+
+        def multi_source_wrapper():
+            return g.multi_source_dijkstra(depots)
+
+        def k_nearest_wrapper():
+            return g.k_nearest_facilities(depots, 2)
+
+        per_depot_time = timeit(per_depot_wrapper, number=1)
+        multi_source_time = timeit(multi_source_wrapper, number=1)
+        k_nearest_time = timeit(k_nearest_wrapper, number=1)
+        results.append((k, per_depot_time, multi_source_time, k_nearest_time))
+
+        logger.info(f"{k} depots on {grid_size}x{grid_size}:")
+        logger.info(f"  One Dijkstra per depot: {per_depot_time:.3f}s")
+        logger.info(
+            f"  Multi-source Dijkstra: {multi_source_time:.3f}s "
+            f"({per_depot_time / multi_source_time:.2f}x)"
+        )
+        logger.info(f"  2 nearest depots: {k_nearest_time:.3f}s")
+
+    return results
+
+
+def run_bounded_search():
+    logger.info("Radius and k-nearest searches vs a full Dijkstra per query")
+    grid_size = 300
+    num_queries = 1000
+    g = Graph(tree_cache_size=0)
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    rng = random.Random(0)
+    sources = [
+        m[rng.randrange(grid_size)][rng.randrange(grid_size)]
+        for _ in range(num_queries)
+    ]
+    radius = 2 * grid_size
+    k = 100
+
+    def full_wrapper():
+        return g.shortest_path_tree(sources[0])
+
+    def radius_wrapper():
+        return [list(g.within_radius(src, radius)) for src in sources]
+
+    def k_nearest_wrapper():
+        return [list(g.k_nearest(src, k)) for src in sources]
+
+    # the full search is extrapolated from a single run
+    full_time = timeit(full_wrapper, number=1) * num_queries
+    radius_time = timeit(radius_wrapper, number=1)
+    k_nearest_time = timeit(k_nearest_wrapper, number=1)
+    ball_size = sum(len(list(g.within_radius(src, radius))) for src in sources[:50])
+
+    logger.info(f"{num_queries} queries on {grid_size}x{grid_size}:")
+    logger.info(f"  Full Dijkstra per query (estimated): {full_time:.1f}s")
+    logger.info(
+        f"  Within radius {radius} (~{ball_size // 50} vertices): "
+        f"{radius_time:.3f}s ({num_queries / radius_time:.0f} queries/s)"
+    )
+    logger.info(
+        f"  {k} nearest: {k_nearest_time:.3f}s "
+        f"({num_queries / k_nearest_time:.0f} queries/s)"
+    )
+
+    return full_time, radius_time, k_nearest_time
+
+
+def run_dijkstra_iter():
+    logger.info("Point to point queries: dijkstra() vs settling dijkstra_iter()")
+    grid_size = 300
+    num_queries = 200
+    g = Graph()
+    m = g.generate_seeded_random_graph(grid_size, grid_size, seed=0)
+    rng = random.Random(0)
+    queries = []
+    for _ in range(num_queries):
+        i, j = rng.randrange(grid_size - 20), rng.randrange(grid_size - 20)
+        queries.append((m[i][j], m[i + rng.randrange(20)][j + rng.randrange(20)]))
+
+    def dijkstra_wrapper():
+        return [g.dijkstra(src, dest) for src, dest in queries]
+
+    def shortest_path_wrapper():
+        return [g.shortest_path(src, dest) for src, dest in queries]
+
+    def dijkstra_iter_wrapper():
+        return [g.dijkstra_iter(src).settle(dest) for src, dest in queries]
+
+    dijkstra_time = timeit(dijkstra_wrapper, number=1)
+    shortest_path_time = timeit(shortest_path_wrapper, number=1)
+    dijkstra_iter_time = timeit(dijkstra_iter_wrapper, number=1)
+
+    logger.info(f"{num_queries} nearby queries on {grid_size}x{grid_size}:")
+    logger.info(f"  dijkstra (indexed PQ, eager setup): {dijkstra_time:.3f}s")
+    logger.info(f"  shortest_path (lazy): {shortest_path_time:.3f}s")
+    logger.info(f"  dijkstra_iter + settle, no path: {dijkstra_iter_time:.3f}s")
+
+    return dijkstra_time, shortest_path_time, dijkstra_iter_time
+
+
 def run_all():
     run_q3()
     run_q4()
@@ -318,11 +874,39 @@ if __name__ == "__main__":
             run_q6()
         elif sys.argv[1] == "combined":
             run_combined_comparison()
+        elif sys.argv[1] == "pq_backends":
+            run_pq_backends()
+        elif sys.argv[1] == "pq_entries":
+            run_pq_entries()
+        elif sys.argv[1] == "alt":
+            run_alt()
+        elif sys.argv[1] == "ch":
+            run_ch()
+        elif sys.argv[1] == "distance_matrix":
+            run_distance_matrix()
+        elif sys.argv[1] == "delta_stepping":
+            run_delta_stepping()
+        elif sys.argv[1] == "dynamic":
+            run_dynamic()
+        elif sys.argv[1] == "bfs":
+            run_bfs()
+        elif sys.argv[1] == "center":
+            run_center()
+        elif sys.argv[1] == "ms_bfs":
+            run_ms_bfs()
+        elif sys.argv[1] == "nearest_facilities":
+            run_nearest_facilities()
+        elif sys.argv[1] == "bounded_search":
+            run_bounded_search()
+        elif sys.argv[1] == "dijkstra_iter":
+            run_dijkstra_iter()
         elif sys.argv[1] == "all":
             run_all()
         else:
             print(f"Unknown argument: {sys.argv[1]}")
-            print("Usage: python3 main.py [q3|q4|q5|q6|combined|all]")
+            print(
+                "Usage: python3 main.py [q3|q4|q5|q6|combined|pq_backends|pq_entries|alt|ch|distance_matrix|delta_stepping|dynamic|bfs|center|ms_bfs|nearest_facilities|bounded_search|dijkstra_iter|all]"
+            )
     else:
         print("Running all evaluations...")
         run_all()
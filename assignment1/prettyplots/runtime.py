@@ -32,12 +32,21 @@ def plot_dijkstra_comparison(
     distances,
     early_stop_times,
     all_nodes_times,
+    lazy_early_stop_times=None,
+    bidirectional_times=None,
+    astar_times=None,
 ):
     fig = plt.figure(figsize=(15, 8))
 
     plt.subplot(2, 2, 1)
     plt.plot(distances, early_stop_times, "b-o", label="Early Stop")
     plt.plot(distances, all_nodes_times, "r-o", label="All Nodes")
+    if lazy_early_stop_times is not None:
+        plt.plot(distances, lazy_early_stop_times, "g-o", label="Lazy Early Stop")
+    if bidirectional_times is not None:
+        plt.plot(distances, bidirectional_times, "m-o", label="Bidirectional")
+    if astar_times is not None:
+        plt.plot(distances, astar_times, "c-o", label="A* (Manhattan)")
     plt.xlabel("Distance from Center (cells)")
     plt.ylabel("Runtime (seconds)")
     plt.title("Runtime Comparison")
@@ -1,5 +1,14 @@
+import random
 import unittest
-from pq import AdaptablePQ
+from pq import (
+    AdaptablePQ,
+    AdaptablePQUnsortedList,
+    DaryHeapPQ,
+    IndexedAdaptablePQ,
+    PairingHeapPQ,
+    RadixHeapPQ,
+    SimplePQ,
+)
 
 
 # The test below was generated by AI
@@ -101,6 +110,166 @@ class TestAdaptablePQ(unittest.TestCase):
         self.assertEqual(task, "Task 1")
         self.assertEqual(priority, 3)
 
+    def test_add_many_and_pop_many(self):
+        self.pq.add("Task 0", 4)
+        self.pq.add_many(
+            [("Task 1", 5), ("Task 2", 3), ("Task 3", 7), ("Task 0", 6), ("Task 4", 1)]
+        )
+        self.assertEqual(len(self.pq), 5)
+
+        self.assertEqual(self.pq.pop_many(2), [("Task 4", 1), ("Task 2", 3)])
+        self.assertEqual(
+            self.pq.pop_many(10), [("Task 1", 5), ("Task 0", 6), ("Task 3", 7)]
+        )
+        self.assertEqual(self.pq.pop_many(1), [])
+
+    def test_from_items(self):
+        pq = type(self.pq).from_items((f"Task {i}", (i * 7) % 10) for i in range(10))
+
+        self.assertEqual(len(pq), 10)
+        self.assertEqual([priority for _, priority in pq.pop_many(10)], list(range(10)))
+
+
+class TestAdaptablePQUnsortedList(TestAdaptablePQ):
+    def setUp(self):
+        self.pq = AdaptablePQUnsortedList()
+
+
+class TestTombstoneCompaction(unittest.TestCase):
+    def container(self, pq):
+        return pq.heap if isinstance(pq, AdaptablePQ) else pq.items
+
+    def test_compacts_when_stale_entries_pass_threshold(self):
+        for pq_class in [AdaptablePQ, AdaptablePQUnsortedList]:
+            pq = pq_class(compaction_threshold=0.5)
+            for i in range(10):
+                pq.add(i, 100)
+            for round in range(20):
+                for i in range(10):
+                    pq.update_priority(i, 100 - round)
+
+            self.assertEqual(pq.live_count, 10)
+            self.assertLessEqual(pq.stale_count, 5)
+            self.assertGreater(pq.compactions, 0)
+            self.assertLessEqual(len(self.container(pq)), 15)
+            self.assertEqual(
+                [pq.pop()[0] for _ in range(10)], list(range(10)), pq_class.__name__
+            )
+
+    def test_stale_count_tracks_discarded_entries(self):
+        pq = AdaptablePQ(compaction_threshold=None)
+        for i in range(5):
+            pq.add(i, i)
+        pq.remove(0)
+        pq.remove(3)
+        self.assertEqual(pq.stale_count, 2)
+
+        pq.pop()
+        self.assertEqual(pq.stale_count, 1)
+        self.assertEqual(pq.compactions, 0)
+
+        pq.compact()
+        self.assertEqual(pq.stale_count, 0)
+        self.assertEqual(len(pq.heap), pq.live_count)
+
+
+class TestSimplePQ(unittest.TestCase):
+    def test_add_many_keeps_duplicates(self):
+        pq = SimplePQ.from_items([("Task 1", 5), ("Task 2", 3), ("Task 1", 2)])
+
+        self.assertEqual(len(pq), 3)
+        self.assertEqual(pq.pop_many(3), [("Task 1", 2), ("Task 2", 3), ("Task 1", 5)])
+
+
+class TestIndexedAdaptablePQ(TestAdaptablePQ):
+    def setUp(self):
+        self.pq = IndexedAdaptablePQ()
+
+    def test_heap_size_bounded_by_live_tasks(self):
+        for i in range(10):
+            self.pq.add(f"Task {i}", 100)
+        for round in range(5):
+            for i in range(10):
+                self.pq.update_priority(f"Task {i}", 100 - round * 10 - i)
+
+        self.assertEqual(len(self.pq.heap), 10)
+
+        popped = [self.pq.pop()[1] for _ in range(10)]
+        self.assertEqual(popped, sorted(popped))
+
+    def test_equal_priorities_pop_in_insertion_order(self):
+        self.pq.add("Task 1", 5)
+        self.pq.add("Task 2", 5)
+        self.pq.add("Task 3", 5)
+        self.pq.update_priority("Task 1", 5)
+
+        self.assertEqual(
+            [self.pq.pop()[0] for _ in range(3)], ["Task 2", "Task 3", "Task 1"]
+        )
+
+
+class TestRadixHeapPQ(TestAdaptablePQ):
+    def setUp(self):
+        self.pq = RadixHeapPQ()
+
+    def test_monotone_pops(self):
+        for i, priority in enumerate([40, 3, 17, 3, 1000, 8, 0, 65]):
+            self.pq.add(f"Task {i}", priority)
+        self.pq.update_priority("Task 4", 9)
+
+        popped = [self.pq.pop()[1] for _ in range(len(self.pq))]
+        self.assertEqual(popped, [0, 3, 3, 8, 9, 17, 40, 65])
+
+    def test_priority_below_last_popped(self):
+        self.pq.add("Task 1", 5)
+        self.pq.pop()
+
+        with self.assertRaises(ValueError):
+            self.pq.add("Task 2", 4)
+
+    def test_non_integer_priority(self):
+        with self.assertRaises(TypeError):
+            self.pq.add("Task 1", 2.5)
+
+    def test_infinite_priority(self):
+        self.pq.add("Task 1", float("inf"))
+        self.pq.add("Task 2", 7)
+
+        self.assertEqual(self.pq.pop(), ("Task 2", 7))
+        self.pq.update_priority("Task 1", 9)
+        self.assertEqual(self.pq.pop(), ("Task 1", 9))
+
+
+class TestDaryHeapPQ(TestIndexedAdaptablePQ):
+    def setUp(self):
+        self.pq = DaryHeapPQ()
+
+
+class TestPairingHeapPQ(TestAdaptablePQ):
+    def setUp(self):
+        self.pq = PairingHeapPQ()
+
+    def test_random_updates_and_removals(self):
+        rng = random.Random(7)
+        expected = {}
+        for i in range(200):
+            priority = rng.randint(0, 1000)
+            self.pq.add(i, priority)
+            expected[i] = priority
+        for _ in range(300):
+            task = rng.choice(list(expected))
+            if rng.random() < 0.2:
+                self.pq.remove(task)
+                del expected[task]
+            else:
+                expected[task] = rng.randint(0, 1000)
+                self.pq.update_priority(task, expected[task])
+
+        self.assertEqual(len(self.pq), len(expected))
+        popped = [self.pq.pop() for _ in range(len(expected))]
+        self.assertEqual(dict(popped), expected)
+        self.assertEqual([p for _, p in popped], sorted(expected.values()))
+
 
 if __name__ == "__main__":
     unittest.main()
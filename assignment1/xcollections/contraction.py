@@ -0,0 +1,208 @@
+import heapq
+
+from xcollections.csr import CSRGraph
+from xcollections.graph import Graph, Vertex
+
+# settled vertex budget of one witness search; when it runs out the shortcut
+# is added anyway, which is always correct, just not always necessary
+WITNESS_SEARCH_LIMIT = 60
+
+
+class ContractionHierarchy:
+    """Contraction hierarchies for fast point-to-point queries on a static Graph.
+
+    Vertices are contracted one by one in order of importance (edge
+    difference plus the number of already contracted neighbours). Contracting
+    v adds a shortcut u - w between two of its remaining neighbours unless a
+    witness search finds a path at least as short that avoids v. A query is a
+    bidirectional Dijkstra that only follows edges towards higher ranked
+    vertices; shortcuts on the resulting path are unpacked through the vertex
+    they bypass.
+
+    Works on vertex ids of the CSR view taken at build time; rebuild after
+    changing the graph.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self.csr: CSRGraph = graph.freeze()
+        n = self.csr.num_vertices()
+        self.rank = [0] * n
+        # up[v]: (neighbour, weight) pairs towards higher ranked vertices
+        self.up: list[list[tuple[int, int | float]]] = [[] for _ in range(n)]
+        # (min(u, w), max(u, w)) -> vertex bypassed by the shortcut u - w
+        self.middle: dict[tuple[int, int], int] = {}
+        self.num_shortcuts = 0
+        self._contract()
+
+    def _contract(self) -> None:
+        csr = self.csr
+        n = csr.num_vertices()
+        indptr = csr.indptr.tolist()
+        indices = csr.indices.tolist()
+        weights = csr.weights.tolist()
+
+        # live adjacency of the uncontracted part, keeping the lightest parallel edge
+        adj: list[dict[int, int | float]] = [{} for _ in range(n)]
+        for u in range(n):
+            for pos in range(indptr[u], indptr[u + 1]):
+                v, weight = indices[pos], weights[pos]
+                if v != u and weight < adj[u].get(v, float("inf")):
+                    adj[u][v] = weight
+        self._adj = adj
+        contracted_neighbours = [0] * n
+
+        heap = [(self._priority(v, contracted_neighbours)[0], v) for v in range(n)]
+        heapq.heapify(heap)
+        next_rank = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            # lazy update: neighbours' contractions may have changed v's priority
+            priority, shortcuts = self._priority(v, contracted_neighbours)
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, v))
+                continue
+
+            self.rank[v] = next_rank
+            next_rank += 1
+            neighbours = adj[v]
+            self.up[v] = list(neighbours.items())
+            for u in neighbours:
+                del adj[u][v]
+                contracted_neighbours[u] += 1
+            for u, w, weight in shortcuts:
+                if weight < adj[u].get(w, float("inf")):
+                    adj[u][w] = adj[w][u] = weight
+                    self.middle[(min(u, w), max(u, w))] = v
+                    self.num_shortcuts += 1
+            adj[v] = {}
+        del self._adj
+
+    def _priority(
+        self, v: int, contracted_neighbours: list[int]
+    ) -> tuple[int, list[tuple[int, int, int | float]]]:
+        shortcuts = self._shortcuts(v)
+        edge_difference = len(shortcuts) - len(self._adj[v])
+        return edge_difference + contracted_neighbours[v], shortcuts
+
+    def _shortcuts(self, v: int) -> list[tuple[int, int, int | float]]:
+        """Shortcuts u - w needed if v were contracted now."""
+        adj = self._adj
+        neighbours = list(adj[v].items())
+        shortcuts = []
+        for i, (u, u_weight) in enumerate(neighbours):
+            targets = {w: u_weight + w_weight for w, w_weight in neighbours[i + 1 :]}
+            if not targets:
+                continue
+            witness = self._witness_search(u, v, targets)
+            for w, via_v in targets.items():
+                if witness.get(w, float("inf")) > via_v:
+                    shortcuts.append((u, w, via_v))
+        return shortcuts
+
+    def _witness_search(
+        self, src: int, avoid: int, targets: dict[int, int | float]
+    ) -> dict[int, int | float]:
+        """Bounded Dijkstra from src that never passes through avoid.
+
+        Stops once every target is settled, the distance passes the longest
+        path through avoid, or the settled budget runs out.
+        """
+        adj = self._adj
+        max_dist = max(targets.values())
+        remaining = len(targets)
+        dist = {src: 0}
+        heap = [(0, src)]
+        settled = 0
+        while heap and settled < WITNESS_SEARCH_LIMIT:
+            u_dist, u = heapq.heappop(heap)
+            if u_dist > dist[u]:
+                continue
+            if u_dist > max_dist:
+                break
+            if u in targets:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            settled += 1
+            for v, weight in adj[u].items():
+                if v == avoid:
+                    continue
+                alt_dist = u_dist + weight
+                if alt_dist < dist.get(v, float("inf")):
+                    dist[v] = alt_dist
+                    heapq.heappush(heap, (alt_dist, v))
+        return dist
+
+    def query_ids(self, src: int, dest: int) -> tuple[list[int], int | float]:
+        """Shortest path between two vertex ids, with shortcuts unpacked."""
+        if src == dest:
+            return [src], 0
+        up = self.up
+        inf = float("inf")
+        dist = ({src: 0}, {dest: 0})
+        prev: tuple[dict[int, int], dict[int, int]] = ({src: -1}, {dest: -1})
+        heaps = ([(0, src)], [(0, dest)])
+        best = inf
+        meet = -1
+
+        while heaps[0] or heaps[1]:
+            # expand the side with the smaller minimum; a side whose minimum
+            # reaches best cannot improve it any more and is dropped
+            side = 0 if heaps[0] and (not heaps[1] or heaps[0][0] <= heaps[1][0]) else 1
+            heap = heaps[side]
+            u_dist, u = heapq.heappop(heap)
+            if u_dist >= best:
+                heap.clear()
+                continue
+            own_dist, own_prev = dist[side], prev[side]
+            if u_dist > own_dist[u]:
+                continue
+
+            other_dist = dist[1 - side].get(u)
+            if other_dist is not None and u_dist + other_dist < best:
+                best = u_dist + other_dist
+                meet = u
+
+            for v, weight in up[u]:
+                alt_dist = u_dist + weight
+                if alt_dist < own_dist.get(v, inf):
+                    own_dist[v] = alt_dist
+                    own_prev[v] = u
+                    heapq.heappush(heap, (alt_dist, v))
+
+        if meet == -1:
+            return [], inf
+
+        packed = []
+        current = meet
+        while current != -1:
+            packed.append(current)
+            current = prev[0][current]
+        packed.reverse()
+        current = prev[1][meet]
+        while current != -1:
+            packed.append(current)
+            current = prev[1][current]
+
+        path = [packed[0]]
+        for a, b in zip(packed, packed[1:]):
+            self._unpack(a, b, path)
+        return path, best
+
+    def _unpack(self, a: int, b: int, path: list[int]) -> None:
+        # appends the original vertices after a up to and including b
+        stack = [(a, b)]
+        while stack:
+            u, w = stack.pop()
+            v = self.middle.get((min(u, w), max(u, w)))
+            if v is None:
+                path.append(w)
+            else:
+                stack.append((v, w))
+                stack.append((u, v))
+
+    def shortest_path(self, src: Vertex, dest: Vertex) -> tuple[list[Vertex], float]:
+        index = self.csr.index
+        path, distance = self.query_ids(index[src], index[dest])
+        return [self.csr.vertices[i] for i in path], distance
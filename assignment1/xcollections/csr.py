@@ -0,0 +1,272 @@
+import heapq
+from typing import TYPE_CHECKING, Callable, Iterable, MutableSequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from xcollections.graph import Graph, Vertex
+
+
+def edge_positions(
+    indptr: np.ndarray, frontier: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of all edges out of the frontier ids, and each vertex's degree.
+
+    Positions come frontier vertex by frontier vertex, so np.repeat(x, counts)
+    lines any per-vertex array x up with them.
+    """
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    offsets = np.arange(int(counts.sum())) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    return np.repeat(starts, counts) + offsets, counts
+
+
+def heap_dijkstra(
+    neighbours: Callable[[int], Iterable[tuple[int, int | float]]],
+    src: int,
+    dist: MutableSequence,
+    prev: MutableSequence,
+    stop: Iterable[int] | None = None,
+) -> None:
+    """Dijkstra over integer ids with a plain heapq, filling dist and prev.
+
+    neighbours(u) gives the (id, weight) pairs of u. dist must start out
+    larger than any real distance (inf or a sentinel) everywhere; prev is
+    only written for reached ids. With stop, the search ends as soon as
+    every id in it is settled.
+    """
+    remaining = None if stop is None else set(stop)
+    dist[src] = 0
+    heap = [(0, src)]
+
+    while heap and (remaining is None or remaining):
+        u_dist, u = heapq.heappop(heap)
+        if u_dist > dist[u]:
+            continue  # stale entry, u was settled with a smaller distance
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+
+        for v, weight in neighbours(u):
+            alt_dist = u_dist + weight
+            if alt_dist < dist[v]:
+                dist[v] = alt_dist
+                prev[v] = u
+                heapq.heappush(heap, (alt_dist, v))
+
+
+class CSRGraph:
+    """Immutable compressed sparse row view of a Graph.
+
+    Vertices are renumbered 0..n-1 (in Graph insertion order). The neighbours
+    of vertex i are indices[indptr[i]:indptr[i + 1]] and the matching edge
+    weights sit at the same positions in weights. Every undirected edge is
+    stored once per direction. vertices[i] maps an id back to its Vertex and
+    index[v] maps a Vertex to its id.
+
+    Built with Graph.freeze(). Later changes to the Graph are not reflected.
+    """
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        vertices: list["Vertex"],
+    ) -> None:
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.vertices = vertices
+        self.index: dict["Vertex", int] = {v: i for i, v in enumerate(vertices)}
+        for array in (indptr, indices, weights):
+            array.setflags(write=False)
+
+    @classmethod
+    def from_graph(cls, graph: "Graph") -> "CSRGraph":
+        vertices = list(graph.graph)
+        index = {v: i for i, v in enumerate(vertices)}
+
+        indptr = np.zeros(len(vertices) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(graph.graph[v]) for v in vertices])
+
+        indices = np.empty(indptr[-1], dtype=np.int64)
+        weight_dtype = np.int64 if graph.small_int_weights else np.float64
+        weights = np.empty(indptr[-1], dtype=weight_dtype)
+        pos = 0
+        for v in vertices:
+            for w, e in graph.graph[v].items():
+                indices[pos] = index[w]
+                weights[pos] = e.element()
+                pos += 1
+
+        return cls(indptr, indices, weights, vertices)
+
+    def num_vertices(self) -> int:
+        return len(self.vertices)
+
+    def num_edges(self) -> int:
+        return len(self.indices) // 2
+
+    def degree(self, i: int) -> int:
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def neighbours(self, i: int) -> tuple[np.ndarray, np.ndarray]:
+        """Neighbour ids and edge weights of i, as read-only views (no copy)."""
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        return self.indices[lo:hi], self.weights[lo:hi]
+
+    def dijkstra_ids(
+        self,
+        src: int,
+        dest: int | None = None,
+        targets: Iterable[int] | None = None,
+    ) -> tuple[list[float], list[int]]:
+        """Dijkstra over vertex ids.
+
+        Returns (dist, prev) as lists indexed by id, with inf / -1 for
+        vertices that were not reached. Stops once dest is settled, or once
+        every id in targets is, if given.
+        """
+        n = len(self.vertices)
+        indptr = self.indptr
+        indices = self.indices
+        weights = self.weights
+
+        def neighbours(u: int) -> Iterable[tuple[int, int | float]]:
+            lo, hi = indptr[u], indptr[u + 1]
+            return zip(indices[lo:hi].tolist(), weights[lo:hi].tolist())
+
+        dist = [float("inf")] * n
+        prev = [-1] * n
+        stop = [dest] if dest is not None else targets
+        heap_dijkstra(neighbours, src, dist, prev, stop)
+        return dist, prev
+
+    def distances_to(self, src: int, targets: list[int]) -> list[float]:
+        """Distances from src to each of targets, in order, inf if unreachable.
+
+        One Dijkstra run that stops as soon as every target is settled.
+        """
+        dist, _ = self.dijkstra_ids(src, targets=targets)
+        return [dist[t] for t in targets]
+
+    def dijkstra(
+        self, src: "Vertex", dest: "Vertex", early_stop=True
+    ) -> tuple[list["Vertex"], float]:
+        s, t = self.index[src], self.index[dest]
+        dist, prev = self.dijkstra_ids(s, t if early_stop else None)
+        if dist[t] == float("inf"):
+            return [], float("inf")
+        return [self.vertices[i] for i in self.path_ids(prev, t)], dist[t]
+
+    @staticmethod
+    def path_ids(prev: list[int], dest: int) -> list[int]:
+        path = []
+        current = dest
+        while current != -1:
+            path.append(current)
+            current = prev[current]
+        path.reverse()
+        return path
+
+    def breadthfirstsearch(
+        self, src: int, vectorised=False, max_depth: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """BFS from src. Returns (parent, level) arrays indexed by id.
+
+        parent[src] is src and both arrays hold -1 for unreachable vertices
+        (and, with max_depth, for vertices more than max_depth hops away).
+        With vectorised=True every level is expanded by a handful of NumPy
+        operations over the whole frontier instead of a Python loop per
+        edge. Levels are the same; parents form an equally valid BFS tree
+        but may differ where a vertex has several parents one level up.
+        """
+        if max_depth is None:
+            max_depth = len(self.vertices)
+        if vectorised:
+            return self._breadthfirstsearch_vectorised(src, max_depth)
+        n = len(self.vertices)
+        indptr = self.indptr.tolist()
+        indices = self.indices
+        parent = [-1] * n
+        level = [-1] * n
+        parent[src] = src
+        level[src] = 0
+
+        frontier = [src]
+        depth = 0
+        while frontier and depth < max_depth:
+            depth += 1
+            next_frontier = []
+            for u in frontier:
+                for v in indices[indptr[u] : indptr[u + 1]].tolist():
+                    if parent[v] == -1:
+                        parent[v] = u
+                        level[v] = depth
+                        next_frontier.append(v)
+            frontier = next_frontier
+
+        return np.array(parent, dtype=np.int64), np.array(level, dtype=np.int64)
+
+    def _breadthfirstsearch_vectorised(
+        self, src: int, max_depth: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        n = len(self.vertices)
+        parent = np.full(n, -1, dtype=np.int64)
+        level = np.full(n, -1, dtype=np.int64)
+        # scratch array to drop duplicate targets without sorting
+        slot = np.empty(n, dtype=np.int64)
+        parent[src] = src
+        level[src] = 0
+
+        frontier = np.array([src], dtype=np.int64)
+        depth = 0
+        while frontier.size and depth < max_depth:
+            depth += 1
+            positions, counts = edge_positions(self.indptr, frontier)
+            targets = self.indices[positions]
+            fresh = level[targets] == -1
+            targets = targets[fresh]
+            sources = np.repeat(frontier, counts)[fresh]
+            # of several edges into the same vertex, the last one written wins
+            order = np.arange(targets.size)
+            slot[targets] = order
+            keep = slot[targets] == order
+            frontier = targets[keep]
+            parent[frontier] = sources[keep]
+            level[frontier] = depth
+
+        return parent, level
+
+    def depthfirstsearch(self, src: int) -> np.ndarray:
+        """DFS from src, visiting neighbours in the same order as Graph.
+
+        Returns the DFS tree as a parent array indexed by id, with parent[src]
+        equal to src and -1 for unreachable vertices. Uses an explicit stack
+        so it works on graphs of any depth.
+        """
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        parent = [-1] * len(self.vertices)
+        parent[src] = src
+
+        # stack of (vertex, position of the next neighbour to look at)
+        stack = [(src, indptr[src])]
+        while stack:
+            u, pos = stack[-1]
+            end = indptr[u + 1]
+            while pos < end and parent[indices[pos]] != -1:
+                pos += 1
+            if pos == end:
+                stack.pop()
+                continue
+            v = indices[pos]
+            parent[v] = u
+            stack[-1] = (u, pos + 1)
+            stack.append((v, indptr[v]))
+
+        return np.array(parent, dtype=np.int64)
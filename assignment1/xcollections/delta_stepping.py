@@ -0,0 +1,179 @@
+import numpy as np
+
+from xcollections.csr import CSRGraph, edge_positions
+from xcollections.parallel import SharedArrays, worker_arrays
+
+# frontiers with fewer outgoing edges than this are relaxed in the calling
+# process, as shipping them to the pool costs more than it saves
+PARALLEL_MIN_EDGES = 4096
+
+LIGHT, HEAVY = 0, 1
+
+
+def _edge_requests(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    dist: np.ndarray,
+    frontier: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(target, tentative distance) of every edge out of frontier that improves dist."""
+    positions, counts = edge_positions(indptr, frontier)
+    targets = indices[positions]
+    candidates = np.repeat(dist[frontier], counts) + weights[positions]
+    improving = candidates < dist[targets]
+    return targets[improving], candidates[improving]
+
+
+def _worker_requests(task: tuple[int, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    kind, frontier = task
+    prefix = "light" if kind == LIGHT else "heavy"
+    arrays = worker_arrays()
+    return _edge_requests(
+        arrays[f"{prefix}_indptr"],
+        arrays[f"{prefix}_indices"],
+        arrays[f"{prefix}_weights"],
+        arrays["dist"],
+        frontier,
+    )
+
+
+class DeltaStepping:
+    """Delta-stepping single source shortest paths over a CSRGraph.
+
+    Tentative distances are grouped into buckets of width delta. The lowest
+    non-empty bucket is emptied by repeatedly relaxing the light edges
+    (weight <= delta) of its vertices, which may put vertices back into it;
+    after that the heavy edges of every vertex removed from the bucket are
+    relaxed once. All relaxations of one step are independent, so they are
+    computed as vectorised NumPy batches and, with workers > 1, split
+    across a process pool that reads the adjacency and the distance array
+    from shared memory. Only the calling process writes distances.
+
+    The light and heavy edge lists are split once per instance. Use it as a
+    context manager, or call close(), to shut the pool down and free the
+    shared memory.
+    """
+
+    def __init__(
+        self, csr: CSRGraph, delta: float | None = None, workers: int = 1
+    ) -> None:
+        weights = csr.weights
+        if weights.size and weights.min() < 0:
+            raise ValueError("delta-stepping needs non-negative edge weights")
+        if delta is None:
+            # mean edge weight, a reasonable default on grid-like graphs; with
+            # no edges or only zero weights any positive width will do
+            delta = float(weights.mean()) if weights.size else 0.0
+            if delta == 0:
+                delta = 1.0
+        if delta <= 0:
+            raise ValueError(f"delta must be positive, got {delta}")
+        self.csr = csr
+        self.delta = delta
+        self.workers = workers
+
+        light = weights <= delta
+        self._arrays = {"dist": np.empty(csr.num_vertices(), dtype=np.float64)}
+        for prefix, mask in (("light", light), ("heavy", ~light)):
+            # kept edges before each position, read off at the old row starts
+            kept = np.zeros(len(mask) + 1, dtype=np.int64)
+            np.cumsum(mask, out=kept[1:])
+            self._arrays[f"{prefix}_indptr"] = kept[csr.indptr]
+            self._arrays[f"{prefix}_indices"] = csr.indices[mask]
+            self._arrays[f"{prefix}_weights"] = weights[mask].astype(np.float64)
+
+        self._shared: SharedArrays | None = None
+        self._pool = None
+        if workers > 1:
+            self._shared = SharedArrays(self._arrays)
+            self._arrays = self._shared.arrays
+            self._pool = self._shared.pool(workers)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._arrays.clear()
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def __enter__(self) -> "DeltaStepping":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _requests(
+        self, kind: int, frontier: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        prefix = "light" if kind == LIGHT else "heavy"
+        arrays = self._arrays
+        indptr = arrays[f"{prefix}_indptr"]
+        if self._pool is not None:
+            num_edges = int((indptr[frontier + 1] - indptr[frontier]).sum())
+            if num_edges >= PARALLEL_MIN_EDGES:
+                chunks = np.array_split(frontier, self.workers)
+                results = self._pool.map(
+                    _worker_requests, [(kind, chunk) for chunk in chunks]
+                )
+                return (
+                    np.concatenate([targets for targets, _ in results]),
+                    np.concatenate([candidates for _, candidates in results]),
+                )
+        return _edge_requests(
+            indptr,
+            arrays[f"{prefix}_indices"],
+            arrays[f"{prefix}_weights"],
+            arrays["dist"],
+            frontier,
+        )
+
+    def _relax(self, kind: int, frontier: np.ndarray, active: np.ndarray) -> None:
+        targets, candidates = self._requests(kind, frontier)
+        if targets.size:
+            np.minimum.at(self._arrays["dist"], targets, candidates)
+            active[targets] = True
+
+    def run(self, src: int) -> np.ndarray:
+        """Distances from vertex id src, indexed by id, inf if unreachable."""
+        if not self._arrays:
+            raise ValueError("DeltaStepping instance has been closed")
+        dist = self._arrays["dist"]
+        dist.fill(np.inf)
+        dist[src] = 0
+        # vertices whose distance changed since they were last expanded
+        active = np.zeros(len(dist), dtype=bool)
+        active[src] = True
+        delta = self.delta
+
+        while True:
+            pending = np.flatnonzero(active)
+            if pending.size == 0:
+                break
+            upper = (np.floor(dist[pending].min() / delta) + 1) * delta
+
+            removed = []
+            while pending.size:
+                frontier = pending[dist[pending] < upper]
+                if frontier.size == 0:
+                    break
+                active[frontier] = False
+                removed.append(frontier)
+                self._relax(LIGHT, frontier, active)
+                pending = np.flatnonzero(active)
+
+            # every vertex below upper is final now; heavy edges lead past it
+            self._relax(HEAVY, np.unique(np.concatenate(removed)), active)
+
+        return dist.copy()
+
+
+def delta_stepping(
+    csr: CSRGraph, src: int, delta: float | None = None, workers: int = 1
+) -> np.ndarray:
+    """One-off delta-stepping run, see DeltaStepping."""
+    with DeltaStepping(csr, delta, workers) as engine:
+        return engine.run(src)
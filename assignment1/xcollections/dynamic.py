@@ -0,0 +1,126 @@
+from typing import Any, Iterable
+
+from xcollections.graph import Graph, ShortestPathTree, Vertex
+from xcollections.pq import IndexedAdaptablePQ
+
+# marks an edge removal in a batch of changes
+REMOVED = None
+
+
+class DynamicShortestPaths(ShortestPathTree):
+    """Shortest path tree from src, repaired locally as edges change through it.
+
+    last_repair_size is the number of vertices the last change recomputed.
+    """
+
+    def __init__(self, graph: Graph, src: Vertex) -> None:
+        tree = graph.shortest_path_tree(src)
+        # copies, the tree may be shared through the graph's cache
+        super().__init__(src, dict(tree.dist), dict(tree.prev))
+        self.graph = graph
+        self.children: dict[Vertex, set[Vertex]] = {}
+        for v, p in self.prev.items():
+            if p is not None:
+                self.children.setdefault(p, set()).add(v)
+        self.last_repair_size = 0
+
+    def add_edge(self, u: Vertex, v: Vertex, element: Any) -> None:
+        self.apply([(u, v, element)])
+
+    def remove_edge(self, u: Vertex, v: Vertex) -> None:
+        self.apply([(u, v, REMOVED)])
+
+    def update_weight(self, u: Vertex, v: Vertex, element: Any) -> None:
+        self.apply([(u, v, element)])
+
+    def apply(self, changes: Iterable[tuple[Vertex, Vertex, Any]]) -> None:
+        """Apply a batch of (u, v, weight) changes and repair the tree once.
+
+        A weight of REMOVED (None) removes the edge, a pair without an edge
+        gets one. All changes hit the graph before the single repair pass.
+        """
+        graph = self.graph
+        dist, prev = self.dist, self.prev
+        changed = []
+        invalid_roots = []
+        for u, v, element in changes:
+            if element is REMOVED:
+                graph.remove_edge(u, v)
+            elif v in graph.graph[u]:
+                graph.update_weight(u, v, element)
+            else:
+                graph.add_edge(u, v, element)
+            changed.append((u, v))
+
+            # a tree edge that no longer supports its child's distance
+            for parent, child in ((u, v), (v, u)):
+                if prev.get(child) is parent and (
+                    element is REMOVED or dist[parent] + element > dist[child]
+                ):
+                    invalid_roots.append(child)
+
+        # repair in the style of Ramalingam and Reps: the subtrees below
+        # invalid tree edges take the best offer from the valid rest of the
+        # tree, lighter or new edges offer their improvement, and a Dijkstra
+        # that only follows improvements settles both. Heavier non-tree
+        # edges need no work
+        pq = IndexedAdaptablePQ()
+        affected = self._invalidate(invalid_roots)
+        for v in affected:
+            # best offer from the part of the tree that is still valid
+            for w, e in graph.graph[v].items():
+                if w in dist:
+                    self._offer(pq, w, v, dist[w] + e.element())
+        for u, v in changed:
+            e = graph.graph[u].get(v)
+            if e is not None:
+                for a, b in ((u, v), (v, u)):
+                    if a in dist:
+                        self._offer(pq, a, b, dist[a] + e.element())
+
+        settled = self._settle(pq)
+        self.last_repair_size = settled + sum(1 for v in affected if v not in dist)
+
+    def _invalidate(self, roots: list[Vertex]) -> list[Vertex]:
+        # drop the subtrees below roots from the tree, returning their vertices
+        affected = []
+        seen = set()
+        stack = [r for r in roots if r in self.dist]
+        while stack:
+            v = stack.pop()
+            if v in seen:
+                continue
+            seen.add(v)
+            affected.append(v)
+            stack.extend(self.children.get(v, ()))
+        for v in affected:
+            self._set_parent(v, None)
+            del self.dist[v]
+            del self.prev[v]
+        return affected
+
+    def _set_parent(self, v: Vertex, parent: Vertex | None) -> None:
+        old = self.prev.get(v)
+        if old is not None:
+            self.children[old].discard(v)
+        if parent is not None:
+            self.children.setdefault(parent, set()).add(v)
+        self.prev[v] = parent
+
+    def _offer(
+        self, pq: IndexedAdaptablePQ, parent: Vertex, v: Vertex, v_dist: float
+    ) -> None:
+        if v_dist < self.dist.get(v, float("inf")):
+            self.dist[v] = v_dist
+            self._set_parent(v, parent)
+            pq.add(v, v_dist)
+
+    def _settle(self, pq: IndexedAdaptablePQ) -> int:
+        # Dijkstra from the offered vertices, only following improvements
+        settled = 0
+        while len(pq) > 0:
+            u, u_dist = pq.pop()
+            settled += 1
+            for w, e in self.graph.graph[u].items():
+                self._offer(pq, u, w, u_dist + e.element())
+        return settled
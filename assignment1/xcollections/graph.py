@@ -1,9 +1,67 @@
 import uuid
+from collections import OrderedDict, deque
 from typing import cast
-from typing import Any
-from xcollections.pq import AdaptablePQ, AdaptablePQUnsortedList, SimplePQ
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+from xcollections import metrics
+from xcollections.csr import CSRGraph
+from xcollections.parallel import distance_matrix as parallel_distance_matrix
+from xcollections.pq import (
+    AdaptablePQ,
+    AdaptablePQUnsortedList,
+    IndexedAdaptablePQ,
+    RadixHeapPQ,
+    SimplePQ,
+)
 import random
 
+import numpy as np
+
+# largest edge weight still counted as a small integer (see small_int_weights)
+RADIX_HEAP_MAX_WEIGHT = 1 << 32
+
+# queue behind shortest_path, shortest_path_tree and multi_source_dijkstra.
+# Chosen by measurement (lazy full runs on seeded grids, make pq_backends):
+# the heapq-backed SimplePQ beats the pure Python adaptable and radix heaps
+# for any weights, e.g. 0.52s against 0.75s (AdaptablePQ) and 1.11s
+# (RadixHeapPQ) on 300x300
+SEARCH_PQ = SimplePQ
+
+# number of shortest path trees a Graph keeps by default
+DEFAULT_TREE_CACHE_SIZE = 16
+
+
+def is_small_int_weight(weight: Any) -> bool:
+    return (
+        isinstance(weight, int)
+        and not isinstance(weight, bool)
+        and 0 <= weight <= RADIX_HEAP_MAX_WEIGHT
+    )
+
+
+def random_grid_weights(
+    n: int, m: int, seed: int | np.random.Generator | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Weights for an n x m grid, drawn from [1, max(n, m) // 2] in one call.
+
+    Returns (horizontal, vertical) with shapes (n, m - 1) and (n - 1, m), the
+    layout used by Graph.add_grid and GridGraph. The same seed always gives
+    the same weights.
+    """
+    rng = np.random.default_rng(seed)
+    max_weight = max(max(n, m) // 2, 1)
+    num_horizontal = n * (m - 1)
+    weights = rng.integers(
+        1,
+        max_weight,
+        size=num_horizontal + (n - 1) * m,
+        endpoint=True,
+        dtype=np.int32,
+    )
+    return (
+        weights[:num_horizontal].reshape(n, m - 1),
+        weights[num_horizontal:].reshape(n - 1, m),
+    )
+
 
 class Vertex:
     def __init__(self, label: Any, id: uuid.UUID | str | None = None) -> None:
@@ -42,10 +100,177 @@ class Edge:
         return self.__str__()
 
 
+class ShortestPathTree:
+    """All shortest paths from one source, as left behind by a full Dijkstra run.
+
+    dist and prev only hold the vertices reachable from src. Paths are
+    rebuilt from prev on demand, so a tree answers any number of queries
+    for the price of one search. It is a snapshot: later changes to the
+    graph are not reflected.
+    """
+
+    def __init__(
+        self,
+        src: Vertex,
+        dist: dict[Vertex, float],
+        prev: dict[Vertex, Vertex | None],
+    ) -> None:
+        self.src = src
+        self.dist = dist
+        self.prev = prev
+
+    def __contains__(self, v: Vertex) -> bool:
+        return v in self.dist
+
+    def __len__(self) -> int:
+        return len(self.dist)
+
+    def distance(self, dest: Vertex) -> float:
+        return self.dist.get(dest, float("inf"))
+
+    def path(self, dest: Vertex) -> list[Vertex]:
+        """Vertices from src to dest, or [] if dest is unreachable."""
+        if dest not in self.prev:
+            return []
+        path = []
+        current = dest
+        while current is not None:
+            path.append(current)
+            current = self.prev[current]
+        path.reverse()
+        return path
+
+    def shortest_path(self, dest: Vertex) -> tuple[list[Vertex], float]:
+        """Same result format as Graph.dijkstra."""
+        return self.path(dest), self.distance(dest)
+
+
+class DijkstraSearch(ShortestPathTree):
+    """A Dijkstra search from src that advances as it is iterated.
+
+    Iterating yields (vertex, distance) in settle order, driven by
+    Graph._dijkstra_search. dist only holds the vertices settled so far, so
+    path() and distance() answer for those and treat the rest as not
+    reached yet; settle(dest) advances the search until dest is settled.
+    len() and `in` likewise only count settled vertices, but a search is
+    always true, even before it starts. Vertices farther than max_dist are
+    never queued, and the search ends after max_settled vertices.
+    """
+
+    def __init__(
+        self,
+        graph: "Graph",
+        src: Vertex,
+        max_dist: float = float("inf"),
+        pq_factory: Callable[[], Any] = SimplePQ,
+        max_settled: int | None = None,
+    ) -> None:
+        # SimplePQ is the default: it beats the adaptable and radix queues on
+        # the small searches that are stopped early, which is what this is for
+        super().__init__(src, {}, {})
+        self.max_settled = max_settled
+        # prev also gets the tentative parents of queued vertices
+        self._steps = graph._dijkstra_search(
+            src, pq_factory, True, {}, self.prev, max_dist
+        )
+
+    def __iter__(self) -> "DijkstraSearch":
+        return self
+
+    def __bool__(self) -> bool:
+        # not len(), which is 0 until the first vertex is settled
+        return True
+
+    def __next__(self) -> tuple[Vertex, float]:
+        if self.max_settled is not None and len(self.dist) >= self.max_settled:
+            raise StopIteration
+        v, v_dist = next(self._steps)
+        self.dist[v] = v_dist
+        return v, v_dist
+
+    def path(self, dest: Vertex) -> list[Vertex]:
+        if dest not in self.dist:
+            return []
+        return super().path(dest)
+
+    def settle(self, dest: Vertex) -> float:
+        """Run the search until dest is settled and return its distance.
+
+        inf if dest is out of reach (or beyond max_dist).
+        """
+        if dest not in self.dist:
+            for v, _ in self:
+                if v is dest:
+                    break
+        return self.distance(dest)
+
+
+class VoronoiPartition(ShortestPathTree):
+    """Shortest path forest grown from several sources at once.
+
+    owner[v] is the source closest to v and dist[v] the distance to it;
+    path(v) runs from owner[v] to v. src is None, as there is no single
+    source.
+    """
+
+    def __init__(
+        self,
+        sources: list[Vertex],
+        dist: dict[Vertex, float],
+        prev: dict[Vertex, Vertex | None],
+        owner: dict[Vertex, Vertex],
+    ) -> None:
+        super().__init__(cast(Vertex, None), dist, prev)
+        self.sources = sources
+        self.owner = owner
+
+    def nearest(self, v: Vertex) -> Vertex | None:
+        """Source closest to v, None if no source reaches it."""
+        return self.owner.get(v)
+
+    def cells(self) -> dict[Vertex, list[Vertex]]:
+        """The vertices owned by each source, the source itself included."""
+        cells: dict[Vertex, list[Vertex]] = {s: [] for s in self.sources}
+        for v, s in self.owner.items():
+            cells[s].append(v)
+        return cells
+
+
+class TreeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _no_estimate(v: Vertex, dest: Vertex) -> float:
+    # the zero heuristic, A* without one is Dijkstra
+    return 0
+
+
 class Graph:
-    def __init__(self) -> None:
+    def __init__(self, tree_cache_size: int = DEFAULT_TREE_CACHE_SIZE) -> None:
         self.graph: dict[Vertex, dict[Vertex, Edge]] = {}
-        pass
+        # stays True while every edge weight is a small non-negative integer
+        self.small_int_weights = True
+        # optional position of each vertex, e.g. (row, col) for grid graphs
+        self.coordinates: dict[Vertex, tuple[int | float, ...]] = {}
+        # True while every vertex has coordinates and every edge joins two
+        # vertices one Manhattan step apart, as in the generated grids. Set by
+        # generate_random_graph / add_grid on an empty graph, cleared by any
+        # vertex or edge that breaks it
+        self.unit_grid = False
+        # smallest edge weight in the graph, scales the A* heuristics
+        self.min_weight = float("inf")
+        # edge counts behind the two statistics above, so removing or
+        # reweighting an edge can update them without a scan
+        self._non_small_int_weights = 0
+        self._min_weight_count = 0
+        # least recently used shortest path trees, keyed by source
+        self.tree_cache_size = tree_cache_size
+        self._tree_cache: OrderedDict[Vertex, ShortestPathTree] = OrderedDict()
+        self._tree_cache_hits = 0
+        self._tree_cache_misses = 0
 
     def vertices(self) -> list[Vertex]:
         return list(self.graph.keys())
@@ -76,22 +301,127 @@ class Graph:
     def get_edges(self, x: Vertex):
         return list(self.graph[x].values())
 
-    def add_vertex(self, label: str) -> Vertex:
+    def add_vertex(
+        self, label: str, coordinates: tuple[int | float, ...] | None = None
+    ) -> Vertex:
         v = Vertex(label)
         self.graph[v] = {}
+        self._tree_cache.clear()
+        if coordinates is not None:
+            self.coordinates[v] = coordinates
+        else:
+            self.unit_grid = False
         return v
 
     def add_edge(self, u: Vertex, v: Vertex, element: Any) -> Edge:
+        self._tree_cache.clear()
+        if self.unit_grid and not self._is_unit_step(u, v):
+            self.unit_grid = False
+        return self._insert_edge(u, v, element)
+
+    def _insert_edge(self, u: Vertex, v: Vertex, element: Any) -> Edge:
+        # add_edge minus the cache and unit_grid upkeep, for bulk builders
+        # that take care of both themselves
         e = Edge(u, v, element)
+        old = self.graph[u].get(v)
         self.graph[u][v] = e
         self.graph[v][u] = e
+        self._count_weight(element, 1)
+        if old is not None:
+            self._count_weight(old.element(), -1)
+            self._refresh_weight_stats()
+        return e
+
+    def _is_unit_step(self, u: Vertex, v: Vertex) -> bool:
+        a, b = self.coordinates.get(u), self.coordinates.get(v)
+        if a is None or b is None:
+            return False
+        if len(a) == 2 == len(b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+        return sum(abs(x - y) for x, y in zip(a, b)) == 1
+
+    def remove_edge(self, u: Vertex, v: Vertex) -> Edge:
+        """Remove the edge between u and v, raising KeyError if there is none."""
+        e = self.graph[u].pop(v)
+        if v is not u:
+            del self.graph[v][u]
+        held_min = e.element() == self.min_weight
+        self._count_weight(e.element(), -1)
+        self._tree_cache.clear()
+        if held_min:
+            self._refresh_weight_stats()
         return e
 
+    def update_weight(self, u: Vertex, v: Vertex, element: Any) -> Edge:
+        """Change the weight of the existing edge between u and v."""
+        return self.update_weights([(u, v, element)])[0]
+
+    def update_weights(
+        self, updates: Iterable[tuple[Vertex, Vertex, Any]]
+    ) -> list[Edge]:
+        """Change the weights of several existing edges at once.
+
+        The cache and the weight statistics are refreshed once for the whole
+        batch. Raises KeyError if one of the edges does not exist, after
+        applying the updates before it.
+        """
+        edges = []
+        # only losing an edge of the smallest weight can leave min_weight stale
+        held_min = False
+        try:
+            for u, v, element in updates:
+                e = self.graph[u][v]
+                held_min = held_min or e.element() == self.min_weight
+                self._count_weight(e.element(), -1)
+                self._count_weight(element, 1)
+                e.label = element
+                edges.append(e)
+        finally:
+            self._tree_cache.clear()
+            if held_min:
+                self._refresh_weight_stats()
+        return edges
+
+    def _count_weight(self, element: Any, sign: int) -> None:
+        # sign is 1 for a weight entering the graph and -1 for one leaving it
+        if not is_small_int_weight(element):
+            self._non_small_int_weights += sign
+            self.small_int_weights = self._non_small_int_weights == 0
+        if isinstance(element, (int, float)):
+            if element < self.min_weight:
+                self.min_weight = element
+                self._min_weight_count = sign
+            elif element == self.min_weight:
+                self._min_weight_count += sign
+
+    def _refresh_weight_stats(self) -> None:
+        if self._min_weight_count > 0 or self.min_weight == float("inf"):
+            return
+        # the last edge of the smallest weight is gone, only now is a scan needed
+        min_weight = float("inf")
+        count = 0
+        for u, adjacency in self.graph.items():
+            for v, e in adjacency.items():
+                element = e.element()
+                if isinstance(element, (int, float)):
+                    if element < min_weight:
+                        min_weight = element
+                        count = 0
+                    if element == min_weight:
+                        # every edge is seen from both ends, a self-loop only once
+                        count += 2 if v is u else 1
+        self.min_weight = min_weight
+        self._min_weight_count = count // 2
+
+    def freeze(self) -> CSRGraph:
+        """Immutable CSR snapshot of the graph for read-mostly workloads."""
+        return CSRGraph.from_graph(self)
+
     BreadthFirstSearchResult = tuple[dict[Vertex, tuple[Edge, int] | None], int]
 
     def breadthfirstsearch(self, v: Vertex) -> BreadthFirstSearchResult:
         marked: dict[Vertex, tuple[Edge, int] | None] = {v: None}
-        queue = [v]  # TODO: fix this to use a proper q
+        queue = deque([v])
         level = 0
         max_level = 0
 
@@ -100,9 +430,8 @@ class Graph:
             level += 1
 
             for _ in range(level_size):
-                current = queue.pop(0)
-                for e in self.get_edges(current):
-                    w = e.opposite(current)
+                current = queue.popleft()
+                for w, e in self.graph[current].items():
                     if w not in marked:
                         marked[w] = (e, level)
                         max_level = (
@@ -113,16 +442,80 @@ class Graph:
         return (marked, max_level)
 
     def depthfirstsearch(self, v: Vertex) -> dict[Vertex, Edge | None]:
-        marked: dict[Vertex, Edge | None] = {v: None}
-        self._depthfirstsearch(v, marked)
-        return marked
-
-    def _depthfirstsearch(self, v: Vertex, marked: dict[Vertex, None | Edge]):
-        for e in self.get_edges(v):
-            w = e.opposite(v)
-            if w not in marked:
-                marked[w] = e
-                self._depthfirstsearch(w, marked)
+        return {w: e for w, e, _ in self.iter_dfs(v)}
+
+    def eccentricity(self, v: Vertex) -> int:
+        """Hops from v to the farthest vertex it can reach."""
+        return self.breadthfirstsearch(v)[1]
+
+    def eccentricities(self, sources: list[Vertex] | None = None) -> dict[Vertex, int]:
+        """Eccentricity of every source (all vertices by default).
+
+        Uses bit-parallel multi-source BFS, 64 sources per sweep, see
+        xcollections.metrics.eccentricities.
+        """
+        csr = self.freeze()
+        ids = None if sources is None else [csr.index[v] for v in sources]
+        result = metrics.eccentricities(csr, ids)
+        vertices = csr.vertices if sources is None else sources
+        return dict(zip(vertices, result.tolist()))
+
+    def hop_distances(self, sources: list[Vertex], targets: list[Vertex]) -> np.ndarray:
+        """len(sources) x len(targets) matrix of hop counts, -1 where unreachable."""
+        csr = self.freeze()
+        matrix = metrics.hop_distances(csr, [csr.index[v] for v in sources])
+        return matrix[:, [csr.index[v] for v in targets]]
+
+    def diameter(self) -> int:
+        """Largest eccentricity, see xcollections.metrics.diameter."""
+        return metrics.diameter(self.freeze())
+
+    def radius(self) -> int:
+        """Smallest eccentricity, see xcollections.metrics.radius_and_center."""
+        return metrics.radius_and_center(self.freeze())[0]
+
+    def center(self) -> list[Vertex]:
+        """Every vertex whose eccentricity equals the radius."""
+        csr = self.freeze()
+        _, ids = metrics.radius_and_center(csr)
+        return [csr.vertices[i] for i in ids.tolist()]
+
+    TraversalStep = tuple[Vertex, Edge | None, int]
+
+    def iter_dfs(self, src: Vertex) -> Iterator[TraversalStep]:
+        """Lazily yield (vertex, parent_edge, depth) in depth-first discovery order.
+
+        Visits vertices in the same order as the recursive search it
+        replaces, but keeps an explicit stack of edge iterators, so the
+        depth of the graph is not limited by the recursion limit. Stop
+        iterating to end the search early.
+        """
+        marked = {src}
+        yield src, None, 0
+        stack = [(src, iter(self.graph[src].items()))]
+        while stack:
+            u, remaining = stack[-1]
+            for w, e in remaining:
+                if w not in marked:
+                    marked.add(w)
+                    yield w, e, len(stack)
+                    stack.append((w, iter(self.graph[w].items())))
+                    break
+            else:
+                stack.pop()
+
+    def iter_bfs(self, src: Vertex) -> Iterator[TraversalStep]:
+        """Lazily yield (vertex, parent_edge, depth) in breadth-first order."""
+        marked = {src}
+        yield src, None, 0
+        queue = deque([(src, 0)])
+        while queue:
+            u, depth = queue.popleft()
+            for w, e in self.graph[u].items():
+                if w not in marked:
+                    marked.add(w)
+                    yield w, e, depth + 1
+                    queue.append((w, depth + 1))
 
     # str repestentation of the graph is taken from stackoverflow
     def __str__(self) -> str:
@@ -136,186 +529,458 @@ class Graph:
             result += ", ".join(connections) + "\n"
         return result
 
-    def dijkstra_simple_non_adaptable_pq(
-        self, src: Vertex, dest: Vertex, print_result=False, early_stop=True
-    ):
-        dist = {v: float("inf") for v in self.graph}
-        dist[src] = 0
-        prev = {v: None for v in self.graph}  # used to reconstruct the path
-
-        pq = SimplePQ()
-
-        for v in self.graph:
-            priority = 0 if v == src else float("inf")
-            dist[v] = priority
-            prev[v] = None
-            pq.add(v, priority)
-
-        while len(pq) > 0:
-            u, u_dist = pq.pop()
-
+    def dijkstra(
+        self,
+        src: Vertex,
+        dest: Vertex,
+        print_result=False,
+        early_stop=True,
+        pq_factory: Callable[[], Any] = AdaptablePQ,
+        lazy=False,
+    ) -> tuple[list[Vertex], float]:
+        """Dijkstra's algorithm with a pluggable priority queue.
+
+        pq_factory is any class (or callable) from xcollections.pq. Adaptable
+        queues get their entries updated in place, non-adaptable ones
+        (adaptable = False) get a duplicate entry and stale pops are skipped.
+        The default AdaptablePQ runs on heapq; the pure Python indexed heaps
+        save memory on updates but are slower (see make pq_backends).
+
+        With lazy=True no per-vertex state is set up front: vertices enter
+        dist/prev and the queue only when they are first reached, so an
+        early-stop query costs time proportional to the region it explores
+        rather than to the whole graph.
+        """
+        dist: dict[Vertex, float] = {}
+        prev: dict[Vertex, Vertex | None] = {}
+        for u, _ in self._dijkstra_search(src, pq_factory, lazy, dist, prev):
             if early_stop and u == dest:
                 break
+        inf = float("inf")
 
-            for e in self.get_edges(u):
-                v = e.opposite(u)
-                weight = e.element()
-                alt_dist = u_dist + weight
+        if prev.get(dest) is None and dest != src:
+            return [], inf
 
-                if alt_dist < dist[v]:
-                    dist[v] = alt_dist
-                    prev[v] = u
-                    # instead of updating the priority just add a new item. The smaller priority will always be first
-                    pq.add(v, alt_dist)
+        path = self._reconstruct_path(prev, dest)
 
-        path = []
-        current = dest
+        if print_result:  # TODO: Maybe move this out ?
+            self._print_path(path, dist[dest])
 
-        if prev[dest] is None and dest != src:
-            return [], float("inf")
+        return path, dist[dest]
 
-        while current is not None:
-            path.append(current)
-            current = prev[current]
+    def _dijkstra_search(
+        self,
+        src: Vertex | list[Vertex],
+        pq_factory: Callable[[], Any],
+        lazy: bool,
+        dist: dict[Vertex, float],
+        prev: dict[Vertex, Vertex | None],
+        max_dist: float = float("inf"),
+    ) -> Iterator[tuple[Vertex, float]]:
+        """The Dijkstra engine behind every Graph search.
+
+        Yields (vertex, distance) as each vertex is settled, so callers stop
+        whenever they have what they need. dist and prev are filled in place
+        and also hold the tentative entries of queued vertices. A list of
+        sources searches from all of them at once; vertices farther than
+        max_dist are never queued.
+        """
+        pq = pq_factory()
+        adaptable = pq.adaptable
+        inf = float("inf")
+
+        sources = src if isinstance(src, list) else [src]
+        if lazy:
+            for s in sources:
+                dist[s] = 0
+                prev[s] = None
+            pq.add_many((s, 0) for s in sources)
+        else:
+            for v in self.graph:
+                dist[v] = inf
+                prev[v] = None
+            for s in sources:
+                dist[s] = 0
+            pq.add_many(dist.items())
 
-        path.reverse()
+        while len(pq) > 0:
+            u, u_dist = pq.pop()
+            if u_dist > dist[u]:
+                continue  # stale duplicate left behind by a non-adaptable queue
+            if u_dist == inf or u_dist > max_dist:
+                break  # only unreachable (or too distant) vertices are left
+            yield u, u_dist
 
-        if print_result:  # TODO: Maybe move this out ?
-            print("\n=== DIJKSTRA RESULT ===")
-            print(
-                f"Shortest path from {src.element()} to {dest.element()}: {' -> '.join([v.element() for v in path])}"
-            )
-            print(f"Total distance: {dist[dest]}")
+            for v, e in self.graph[u].items():
+                alt_dist = u_dist + e.element()
 
-            print("\nDetailed path:")
-            for i in range(len(path) - 1):
-                edge = self.get_edge(path[i], path[i + 1])
-                print(
-                    f"{path[i].element()} to {path[i + 1].element()} (weight: {edge.element()})"
-                )
-            print("=== END RESULT ===\n")
+                if alt_dist < dist.get(v, inf) and alt_dist <= max_dist:
+                    dist[v] = alt_dist
+                    prev[v] = u
+                    if adaptable and not lazy:
+                        pq.update_priority(v, alt_dist)
+                    else:
+                        # insert on discovery; adaptable queues update an existing entry,
+                        # a non-adaptable one keeps both and the smaller priority is popped first
+                        pq.add(v, alt_dist)
+
+    def _search_all(
+        self, src: Vertex | list[Vertex], pq_factory: Callable[[], Any]
+    ) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+        # runs a lazy search to the end, returning its dist and prev maps
+        dist: dict[Vertex, float] = {}
+        prev: dict[Vertex, Vertex | None] = {}
+        for _ in self._dijkstra_search(src, pq_factory, True, dist, prev):
+            pass
+        return dist, prev
 
-        return path, dist[dest]
+    def dijkstra_simple_non_adaptable_pq(
+        self, src: Vertex, dest: Vertex, print_result=False, early_stop=True
+    ):
+        return self.dijkstra(src, dest, print_result, early_stop, SimplePQ)
 
     def dijkstra_list_apq(
         self, src: Vertex, dest: Vertex, print_result=False, early_stop=True
     ):
-        dist = {v: float("inf") for v in self.graph}
-        dist[src] = 0
-        prev = {v: None for v in self.graph}  # used to reconstruct the path
+        return self.dijkstra(
+            src, dest, print_result, early_stop, AdaptablePQUnsortedList
+        )
 
-        pq = AdaptablePQUnsortedList()
+    def dijkstra_radix_heap(
+        self, src: Vertex, dest: Vertex, print_result=False, early_stop=True
+    ) -> tuple[list[Vertex], float]:
+        """Dijkstra backed by a radix heap. Only valid for non-negative integer weights."""
+        return self.dijkstra(src, dest, print_result, early_stop, RadixHeapPQ)
 
-        for v in self.graph:
-            priority = 0 if v == src else float("inf")
-            dist[v] = priority
-            prev[v] = None
-            pq.add(v, priority)
+    def shortest_path(
+        self, src: Vertex, dest: Vertex, print_result=False, early_stop=True
+    ) -> tuple[list[Vertex], float]:
+        """Lazy Dijkstra on SEARCH_PQ, the queue that measured fastest."""
+        return self.dijkstra(src, dest, print_result, early_stop, SEARCH_PQ, lazy=True)
+
+    def shortest_path_tree(self, src: Vertex) -> ShortestPathTree:
+        """Shortest paths from src to every reachable vertex.
+
+        Trees are kept in an LRU cache of tree_cache_size sources, so repeated
+        queries from the same source only rebuild a path. add_vertex and
+        add_edge clear the cache.
+        """
+        cache = self._tree_cache
+        tree = cache.get(src)
+        if tree is not None:
+            self._tree_cache_hits += 1
+            cache.move_to_end(src)
+            return tree
+
+        self._tree_cache_misses += 1
+        dist, prev = self._search_all(src, SEARCH_PQ)
+        tree = ShortestPathTree(src, dist, prev)
+        if self.tree_cache_size > 0:
+            cache[src] = tree
+            if len(cache) > self.tree_cache_size:
+                cache.popitem(last=False)
+        return tree
+
+    def dijkstra_iter(
+        self, src: Vertex, pq_factory: Callable[[], Any] = SimplePQ
+    ) -> DijkstraSearch:
+        """Dijkstra from src as an iterator of settled (vertex, distance) pairs.
+
+        Nothing is searched up front: each next() settles one more vertex, so
+        the caller can stop on any condition. The returned DijkstraSearch
+        also rebuilds paths to settled vertices on demand, and settle(dest)
+        runs the search just far enough to answer for dest.
+        """
+        return DijkstraSearch(self, src, pq_factory=pq_factory)
+
+    def within_radius(
+        self, src: Vertex, radius: float, pq_factory: Callable[[], Any] = SimplePQ
+    ) -> DijkstraSearch:
+        """(vertex, distance) of every vertex at most radius from src, in settle order.
+
+        Nothing beyond radius is ever queued, so the search only touches the
+        ball it returns plus the edges leaving it. Like dijkstra_iter, the
+        result also rebuilds paths to what it has settled.
+        """
+        return DijkstraSearch(self, src, radius, pq_factory)
+
+    def k_nearest(
+        self, src: Vertex, k: int, pq_factory: Callable[[], Any] = SimplePQ
+    ) -> DijkstraSearch:
+        """(vertex, distance) of the k vertices closest to src, src itself first.
+
+        Stops after the k-th settled vertex; fewer come out if src reaches
+        fewer than k vertices. Like within_radius, the result also rebuilds
+        paths to what it has settled.
+        """
+        return DijkstraSearch(self, src, pq_factory=pq_factory, max_settled=k)
+
+    def multi_source_dijkstra(self, sources: list[Vertex]) -> VoronoiPartition:
+        """Nearest source, distance and predecessor of every vertex in one search.
+
+        All sources start at distance 0 in the same queue, so this costs one
+        Dijkstra run however many sources there are. Each vertex ends up in
+        the tree of a closest source (a graph Voronoi diagram). A vertex at
+        the same distance from several sources may go to any of them, which
+        one depends on the order the search reaches it in.
+        """
+        if not sources:
+            raise ValueError("multi_source_dijkstra needs at least one source")
+        sources = list(dict.fromkeys(sources))
+        dist, prev = self._search_all(sources, SEARCH_PQ)
+        # every vertex belongs to the source at the root of its prev chain
+        owner = {s: s for s in sources}
+        for v in dist:
+            chain = []
+            root = v
+            while root not in owner:
+                chain.append(root)
+                root = prev[root]
+            for w in chain:
+                owner[w] = owner[root]
+        return VoronoiPartition(sources, dist, prev, owner)
+
+    def k_nearest_facilities(
+        self, facilities: list[Vertex], k: int
+    ) -> dict[Vertex, list[tuple[Vertex, float]]]:
+        """The k closest facilities of every vertex, nearest first.
+
+        One search in which every vertex may be settled once per facility,
+        for at most k different facilities; a label (vertex, facility) is
+        only expanded while the vertex still has room. The work is about k
+        Dijkstra runs for any number of facilities. Vertices that reach fewer
+        than k facilities get a shorter list, unreachable ones are left out.
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        nearest: dict[Vertex, list[tuple[Vertex, float]]] = {}
+        pq = SimplePQ()
+        pq.add_many(((f, f), 0) for f in dict.fromkeys(facilities))
 
         while len(pq) > 0:
-            u, u_dist = pq.pop()
+            (u, facility), u_dist = pq.pop()
+            labels = nearest.setdefault(u, [])
+            if len(labels) == k or any(f is facility for f, _ in labels):
+                continue  # full, or already settled from this facility
+            labels.append((facility, u_dist))
+
+            for v, e in self.graph[u].items():
+                v_labels = nearest.get(v, ())
+                if len(v_labels) < k and all(f is not facility for f, _ in v_labels):
+                    pq.add((v, facility), u_dist + e.element())
+
+        return nearest
+
+    def tree_cache_info(self) -> TreeCacheInfo:
+        """Hit/miss statistics of the shortest path tree cache."""
+        return TreeCacheInfo(
+            self._tree_cache_hits,
+            self._tree_cache_misses,
+            self.tree_cache_size,
+            len(self._tree_cache),
+        )
+
+    def clear_tree_cache(self) -> None:
+        """Drop every cached tree and reset the statistics."""
+        self._tree_cache.clear()
+        self._tree_cache_hits = 0
+        self._tree_cache_misses = 0
+
+    def distance_matrix(
+        self,
+        sources: list[Vertex],
+        targets: list[Vertex],
+        workers: int | None = None,
+    ) -> np.ndarray:
+        """Shortest distances from every source to every target as a NumPy matrix.
+
+        result[i, j] is the distance from sources[i] to targets[j] (inf if
+        unreachable). The graph is frozen once and the rows are computed in
+        parallel, see xcollections.parallel.distance_matrix.
+        """
+        csr = self.freeze()
+        index = csr.index
+        return parallel_distance_matrix(
+            csr, [index[v] for v in sources], [index[v] for v in targets], workers
+        )
+
+    def bidirectional_dijkstra(
+        self,
+        src: Vertex,
+        dest: Vertex,
+        print_result=False,
+        pq_factory: Callable[[], Any] = IndexedAdaptablePQ,
+    ) -> tuple[list[Vertex], float]:
+        """Point-to-point Dijkstra that grows one search from each end.
+
+        The side with the smaller queue minimum is expanded next. Every edge
+        relaxed into a vertex the other side has reached gives a candidate
+        path, and the search stops once top_f + top_b >= best, as no path
+        through unsettled vertices can be shorter than that.
+        """
+        inf = float("inf")
+        if src == dest:
+            return [src], 0
+
+        dist = ({src: 0}, {dest: 0})
+        prev: tuple[dict[Vertex, Vertex | None], ...] = ({src: None}, {dest: None})
+        pqs = (pq_factory(), pq_factory())
+        pqs[0].add(src, 0)
+        pqs[1].add(dest, 0)
+        best = inf
+        meet = None
+
+        while True:
+            tops = (
+                self._queue_min(pqs[0], dist[0]),
+                self._queue_min(pqs[1], dist[1]),
+            )
+            if tops[0] + tops[1] >= best:
+                break  # also covers one side running out, as its top is inf
 
-            if early_stop and u == dest:
-                break
+            side = 0 if tops[0] <= tops[1] else 1
+            own_dist, own_prev, pq = dist[side], prev[side], pqs[side]
+            other_dist = dist[1 - side]
+            u, u_dist = pq.pop()
 
             for e in self.get_edges(u):
                 v = e.opposite(u)
-                weight = e.element()
-                alt_dist = u_dist + weight
-
-                if alt_dist < dist[v]:
-                    dist[v] = alt_dist
-                    prev[v] = u
-                    pq.update_priority(v, alt_dist)
-
-        path = []
-        current = dest
+                alt_dist = u_dist + e.element()
+                if alt_dist < own_dist.get(v, inf):
+                    own_dist[v] = alt_dist
+                    own_prev[v] = u
+                    pq.add(v, alt_dist)
+                if v in other_dist and own_dist[v] + other_dist[v] < best:
+                    best = own_dist[v] + other_dist[v]
+                    meet = v
 
-        if prev[dest] is None and dest != src:
-            return [], float("inf")
+        if meet is None:
+            return [], inf
 
+        path = self._reconstruct_path(prev[0], meet)
+        current = prev[1][meet]
         while current is not None:
             path.append(current)
-            current = prev[current]
+            current = prev[1][current]
 
-        path.reverse()
-
-        if print_result:  # TODO: Maybe move this out ?
-            print("\n=== DIJKSTRA RESULT ===")
-            print(
-                f"Shortest path from {src.element()} to {dest.element()}: {' -> '.join([v.element() for v in path])}"
-            )
-            print(f"Total distance: {dist[dest]}")
-
-            print("\nDetailed path:")
-            for i in range(len(path) - 1):
-                edge = self.get_edge(path[i], path[i + 1])
-                print(
-                    f"{path[i].element()} to {path[i + 1].element()} (weight: {edge.element()})"
-                )
-            print("=== END RESULT ===\n")
+        if print_result:
+            self._print_path(path, best)
 
-        return path, dist[dest]
+        return path, best
 
-    def dijkstra(
-        self, src: Vertex, dest: Vertex, print_result=False, early_stop=True
+    def astar(
+        self,
+        src: Vertex,
+        dest: Vertex,
+        heuristic: Callable[[Vertex, Vertex], float] | None = None,
+        print_result=False,
+        pq_factory: Callable[[], Any] = IndexedAdaptablePQ,
     ) -> tuple[list[Vertex], float]:
-        dist = {}
-        prev = {}
-        pq = AdaptablePQ()
-
-        for v in self.graph:
-            priority = 0 if v == src else float("inf")
-            dist[v] = priority
-            prev[v] = None
-            pq.add(v, priority)
+        """A* search, ordering the queue by distance so far + heuristic(v, dest).
+
+        The heuristic must never overestimate the remaining distance for the
+        result to be a shortest path. It defaults to manhattan_heuristic() on
+        a unit_grid graph, where that is admissible, and to 0 otherwise,
+        which makes the search plain Dijkstra.
+        Vertices whose distance improves after they were popped are simply
+        queued again, so admissible but inconsistent heuristics work too.
+        """
+        if heuristic is None:
+            heuristic = self.manhattan_heuristic() if self.unit_grid else _no_estimate
+        inf = float("inf")
+
+        dist = {src: 0}
+        prev: dict[Vertex, Vertex | None] = {src: None}
+        estimate = {src: heuristic(src, dest)}
+        pq = pq_factory()
+        pq.add(src, estimate[src])
 
         while len(pq) > 0:
-            u, u_dist = pq.pop()
-
-            if early_stop and u == dest:
+            u, u_priority = pq.pop()
+            if u == dest:
                 break
+            u_dist = dist[u]
+            if u_priority > u_dist + estimate[u]:
+                continue  # stale duplicate left behind by a non-adaptable queue
 
             for e in self.get_edges(u):
                 v = e.opposite(u)
-                weight = e.element()
-                alt_dist = u_dist + weight
-
-                if alt_dist < dist[v]:
+                alt_dist = u_dist + e.element()
+                if alt_dist < dist.get(v, inf):
                     dist[v] = alt_dist
                     prev[v] = u
-                    pq.update_priority(v, alt_dist)
+                    if v not in estimate:
+                        estimate[v] = heuristic(v, dest)
+                    pq.add(v, alt_dist + estimate[v])
 
-        path = []
-        current = dest
+        if dest not in dist:
+            return [], inf
+
+        path = self._reconstruct_path(prev, dest)
 
-        if prev[dest] is None and dest != src:
-            return [], float("inf")
+        if print_result:
+            self._print_path(path, dist[dest])
 
+        return path, dist[dest]
+
+    def manhattan_heuristic(self) -> Callable[[Vertex, Vertex], float]:
+        """Manhattan distance between coordinates, scaled by the smallest weight.
+
+        Admissible whenever edges only join vertices whose coordinates are one
+        Manhattan step apart, as in the generated grids (see unit_grid): any
+        path needs at least that many edges and none of them is lighter than
+        min_weight.
+        """
+        coordinates = self.coordinates
+        scale = self.min_weight if self.min_weight != float("inf") else 0
+
+        def heuristic(v: Vertex, dest: Vertex) -> float:
+            a, b = coordinates[v], coordinates[dest]
+            if len(a) == 2:
+                return scale * (abs(a[0] - b[0]) + abs(a[1] - b[1]))
+            return scale * sum(abs(x - y) for x, y in zip(a, b))
+
+        return heuristic
+
+    @staticmethod
+    def _queue_min(pq: Any, dist: dict[Vertex, float]) -> float:
+        # drop entries a non-adaptable queue left behind for improved vertices
+        while len(pq) > 0:
+            u, u_dist = pq.peek()
+            if u_dist <= dist[u]:
+                return u_dist
+            pq.pop()
+        return float("inf")
+
+    def _reconstruct_path(
+        self, prev: dict[Vertex, Vertex | None], dest: Vertex
+    ) -> list[Vertex]:
+        path = []
+        current = dest
         while current is not None:
             path.append(current)
             current = prev[current]
-
         path.reverse()
-
-        if print_result:  # TODO: Maybe move this out ?
-            print("\n=== DIJKSTRA RESULT ===")
+        return path
+
+    def _print_path(self, path: list[Vertex], distance: float) -> None:
+        src, dest = path[0], path[-1]
+        print("\n=== DIJKSTRA RESULT ===")
+        print(
+            f"Shortest path from {src.element()} to {dest.element()}: {' -> '.join([v.element() for v in path])}"
+        )
+        print(f"Total distance: {distance}")
+
+        print("\nDetailed path:")
+        for i in range(len(path) - 1):
+            edge = self.get_edge(path[i], path[i + 1])
             print(
-                f"Shortest path from {src.element()} to {dest.element()}: {' -> '.join([v.element() for v in path])}"
+                f"{path[i].element()} to {path[i + 1].element()} (weight: {edge.element()})"
             )
-            print(f"Total distance: {dist[dest]}")
-
-            print("\nDetailed path:")
-            for i in range(len(path) - 1):
-                edge = self.get_edge(path[i], path[i + 1])
-                print(
-                    f"{path[i].element()} to {path[i + 1].element()} (weight: {edge.element()})"
-                )
-            print("=== END RESULT ===\n")
-
-        return path, dist[dest]
+        print("=== END RESULT ===\n")
 
     def generate_random_graph(self, n: int, m: int) -> list[list[Vertex]]:
+        self.unit_grid = self.unit_grid or not self.graph
         node_matrix: list[list[Vertex | None]] = [
             [None for _ in range(m)] for _ in range(n)
         ]
@@ -327,15 +992,17 @@ class Graph:
                 node_matrix[i][j] = v
                 # Add vertex by insantance. Might move it to a method ?
                 self.graph[v] = {}
+                self.coordinates[v] = (i, j)
+        self._tree_cache.clear()
 
-        # create the edges
+        # create the edges, grid neighbours only, so unit_grid still holds
         for i in range(n):
             for j in range(m):
                 if i + 1 < n:
                     v1 = node_matrix[i][j]
                     v2 = node_matrix[i + 1][j]
                     if v1 is not None and v2 is not None:
-                        self.add_edge(
+                        self._insert_edge(
                             v1,
                             v2,
                             random.randint(1, max(n, m) // 2),
@@ -344,7 +1011,7 @@ class Graph:
                     v1 = node_matrix[i][j]
                     v2 = node_matrix[i][j + 1]
                     if v1 is not None and v2 is not None:
-                        self.add_edge(
+                        self._insert_edge(
                             v1,
                             v2,
                             random.randint(1, max(n, m) // 2),
@@ -352,3 +1019,70 @@ class Graph:
         # done for the sake of the lsp
         node_matrix_casted = cast(list[list[Vertex]], node_matrix)
         return node_matrix_casted
+
+    def generate_seeded_random_graph(
+        self, n: int, m: int, seed: int | np.random.Generator | None = None
+    ) -> list[list[Vertex]]:
+        """Vectorised, reproducible version of generate_random_graph.
+
+        All weights come from a single NumPy draw (see random_grid_weights), so
+        the same seed always builds the same graph.
+        """
+        horizontal, vertical = random_grid_weights(n, m, seed)
+        return self.add_grid(horizontal, vertical)
+
+    def add_grid(
+        self, horizontal: np.ndarray, vertical: np.ndarray
+    ) -> list[list[Vertex]]:
+        """Add an n x m grid of vertices labelled v{row}_{col} in bulk.
+
+        horizontal[row, col] weighs (row, col) - (row, col + 1) and
+        vertical[row, col] weighs (row, col) - (row + 1, col). Edges are
+        inserted in the same order as generate_random_graph. Vertex ids are
+        the labels, which skips a uuid4 call per cell.
+        """
+        n, m = vertical.shape[0] + 1, horizontal.shape[1] + 1
+        node_matrix = [
+            [Vertex(f"v{i}_{j}", f"v{i}_{j}") for j in range(m)] for i in range(n)
+        ]
+        adjacency = [[{} for _ in range(m)] for _ in range(n)]
+        horizontal_rows = horizontal.tolist()
+        vertical_rows = vertical.tolist()
+
+        for i in range(n):
+            row = node_matrix[i]
+            row_adjacency = adjacency[i]
+            for j in range(m):
+                v1 = row[j]
+                if i + 1 < n:
+                    v2 = node_matrix[i + 1][j]
+                    e = Edge(v1, v2, vertical_rows[i][j])
+                    row_adjacency[j][v2] = e
+                    adjacency[i + 1][j][v1] = e
+                if j + 1 < m:
+                    v2 = row[j + 1]
+                    e = Edge(v1, v2, horizontal_rows[i][j])
+                    row_adjacency[j][v2] = e
+                    row_adjacency[j + 1][v1] = e
+
+        self._tree_cache.clear()
+        self.unit_grid = self.unit_grid or not self.graph
+        for i in range(n):
+            self.graph.update(zip(node_matrix[i], adjacency[i]))
+            self.coordinates.update((v, (i, j)) for j, v in enumerate(node_matrix[i]))
+        for weights in (horizontal, vertical):
+            if not weights.size:
+                continue
+            if np.issubdtype(weights.dtype, np.integer):
+                small = (weights >= 0) & (weights <= RADIX_HEAP_MAX_WEIGHT)
+                self._non_small_int_weights += int(weights.size - small.sum())
+            else:
+                self._non_small_int_weights += weights.size
+            lightest = weights.min().item()
+            if lightest < self.min_weight:
+                self.min_weight = lightest
+                self._min_weight_count = 0
+            if lightest == self.min_weight:
+                self._min_weight_count += int((weights == lightest).sum())
+        self.small_int_weights = self._non_small_int_weights == 0
+        return node_matrix
@@ -0,0 +1,162 @@
+from array import array
+
+import numpy as np
+
+from xcollections.csr import heap_dijkstra
+from xcollections.graph import Graph, Vertex, random_grid_weights
+
+Cell = tuple[int, int]
+
+# stands in for infinity in the int64 distance array of integer weights
+UNREACHED = 1 << 62
+
+
+class GridGraph:
+    """Implicit n x m grid graph that never creates Vertex or Edge objects.
+
+    Cell (row, col) has id row * m + col. horizontal[row, col] is the weight of
+    the edge (row, col) - (row, col + 1) and vertical[row, col] the weight of
+    (row, col) - (row + 1, col). Neighbours are computed arithmetically and are
+    visited up, left, down, right, the same order in which
+    Graph.generate_random_graph ends up storing them, so traversals produce
+    the same trees as on an equivalent Graph.
+    """
+
+    def __init__(self, horizontal: np.ndarray, vertical: np.ndarray) -> None:
+        n, m = vertical.shape[0] + 1, horizontal.shape[1] + 1
+        if horizontal.shape != (n, m - 1) or vertical.shape != (n - 1, m):
+            raise ValueError(
+                f"weight arrays of shape {horizontal.shape} and {vertical.shape} "
+                "do not describe the same grid"
+            )
+        self.n = n
+        self.m = m
+        self.horizontal = horizontal
+        self.vertical = vertical
+        self.integral = np.issubdtype(horizontal.dtype, np.integer) and np.issubdtype(
+            vertical.dtype, np.integer
+        )
+        self.unreached: int | float = UNREACHED if self.integral else float("inf")
+
+    @classmethod
+    def random(cls, n: int, m: int, seed: int | None = None) -> "GridGraph":
+        """Random weights in [1, max(n, m) // 2], as Graph.generate_seeded_random_graph."""
+        return cls(*random_grid_weights(n, m, seed))
+
+    def num_vertices(self) -> int:
+        return self.n * self.m
+
+    def num_edges(self) -> int:
+        return self.horizontal.size + self.vertical.size
+
+    def vertex_id(self, cell: Cell) -> int:
+        row, col = cell
+        if not (0 <= row < self.n and 0 <= col < self.m):
+            raise IndexError(f"cell {cell} is outside the {self.n}x{self.m} grid")
+        return row * self.m + col
+
+    def cell(self, i: int) -> Cell:
+        return divmod(i, self.m)
+
+    def neighbours(self, u: int) -> list[tuple[int, int]]:
+        """(neighbour id, edge weight) pairs of u."""
+        n, m = self.n, self.m
+        row, col = divmod(u, m)
+        result = []
+        if row > 0:
+            result.append((u - m, self.vertical.item(row - 1, col)))
+        if col > 0:
+            result.append((u - 1, self.horizontal.item(row, col - 1)))
+        if row < n - 1:
+            result.append((u + m, self.vertical.item(row, col)))
+        if col < m - 1:
+            result.append((u + 1, self.horizontal.item(row, col)))
+        return result
+
+    def dijkstra_ids(self, src: int, dest: int | None = None) -> tuple[array, array]:
+        """Dijkstra over cell ids.
+
+        Returns (dist, prev) as compact arrays indexed by id, holding
+        self.unreached / -1 for cells that were not reached. dist is int64
+        with UNREACHED for integer weights and float64 with inf otherwise.
+        Stops once dest is settled, if given.
+        """
+        size = self.n * self.m
+        typecode = "q" if self.integral else "d"
+        dist = array(typecode, [self.unreached]) * size
+        prev = array("q", [-1]) * size
+        heap_dijkstra(
+            self.neighbours, src, dist, prev, None if dest is None else [dest]
+        )
+        return dist, prev
+
+    def dijkstra(
+        self, src: Cell, dest: Cell, early_stop=True
+    ) -> tuple[list[Cell], float]:
+        s, t = self.vertex_id(src), self.vertex_id(dest)
+        dist, prev = self.dijkstra_ids(s, t if early_stop else None)
+        if dist[t] == self.unreached:
+            return [], float("inf")
+
+        path = []
+        current = t
+        while current != -1:
+            path.append(self.cell(current))
+            current = prev[current]
+        path.reverse()
+        return path, dist[t]
+
+    def breadthfirstsearch(self, src: Cell) -> tuple[np.ndarray, np.ndarray]:
+        """BFS from src. Returns (parent, level) id arrays, parent[src] being src."""
+        s = self.vertex_id(src)
+        size = self.n * self.m
+        parent = array("q", [-1]) * size
+        level = array("q", [-1]) * size
+        parent[s] = s
+        level[s] = 0
+
+        frontier = [s]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for u in frontier:
+                for v, _ in self.neighbours(u):
+                    if parent[v] == -1:
+                        parent[v] = u
+                        level[v] = depth
+                        next_frontier.append(v)
+            frontier = next_frontier
+
+        return np.frombuffer(parent, dtype=np.int64), np.frombuffer(
+            level, dtype=np.int64
+        )
+
+    def depthfirstsearch(self, src: Cell) -> np.ndarray:
+        """DFS tree from src as a parent id array, parent[src] being src.
+
+        Uses an explicit stack, so any grid size is fine.
+        """
+        s = self.vertex_id(src)
+        parent = array("q", [-1]) * (self.n * self.m)
+        parent[s] = s
+
+        # stack of (vertex, neighbours not looked at yet)
+        stack = [(s, iter(self.neighbours(s)))]
+        while stack:
+            u, remaining = stack[-1]
+            for v, _ in remaining:
+                if parent[v] == -1:
+                    parent[v] = u
+                    stack.append((v, iter(self.neighbours(v))))
+                    break
+            else:
+                stack.pop()
+
+        return np.frombuffer(parent, dtype=np.int64)
+
+    def to_graph(self) -> tuple[Graph, list[list[Vertex]]]:
+        """Materialise the grid as a Graph, returning it with its node_matrix."""
+        g = Graph()
+        node_matrix = g.add_grid(self.horizontal, self.vertical)
+        return g, node_matrix
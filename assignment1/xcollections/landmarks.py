@@ -0,0 +1,129 @@
+import numpy as np
+
+from xcollections.csr import CSRGraph
+from xcollections.graph import Graph, Vertex
+
+# marks a vertex a landmark cannot reach in integer distance tables
+NO_PATH = -1
+
+
+class Landmarks:
+    """ALT (A*, landmarks, triangle inequality) preprocessing for a Graph.
+
+    For a landmark L, |d(L, dest) - d(L, v)| never exceeds d(v, dest), so the
+    maximum of that over all landmarks is an admissible (and consistent) A*
+    heuristic. distances[i] holds the full distance array of landmarks[i],
+    indexed by CSR vertex id, as int32 when the weights allow it.
+
+    The tables describe the graph at build time; rebuild after changing it.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        landmarks: np.ndarray,
+        distances: np.ndarray,
+        csr: CSRGraph | None = None,
+    ):
+        self.graph = graph
+        self.csr = csr if csr is not None else graph.freeze()
+        if distances.shape != (len(landmarks), self.csr.num_vertices()):
+            raise ValueError(
+                f"distance table of shape {distances.shape} does not match "
+                f"{len(landmarks)} landmarks on {self.csr.num_vertices()} vertices"
+            )
+        self.landmarks = landmarks
+        self.distances = distances
+        # row i holds the distances of vertex i to every landmark
+        self._by_vertex = np.ascontiguousarray(distances.T)
+
+    @classmethod
+    def build(cls, graph: Graph, k: int = 8, seed: int | None = None) -> "Landmarks":
+        """Pick k landmarks by farthest-point selection and store their distances.
+
+        The first landmark is the vertex farthest from a random start vertex,
+        every next one the vertex farthest from all landmarks chosen so far
+        (unreachable vertices count as infinitely far, so every connected
+        component gets a landmark as long as k allows).
+        """
+        csr = graph.freeze()
+        n = csr.num_vertices()
+        if n == 0:
+            raise ValueError("cannot pick landmarks in an empty graph")
+        k = min(k, n)
+        rng = np.random.default_rng(seed)
+
+        closest = cls._distances_from(csr, int(rng.integers(n)))
+        landmarks = []
+        distances = []
+        for i in range(k):
+            landmark = int(np.argmax(closest))
+            landmarks.append(landmark)
+            distances.append(cls._distances_from(csr, landmark))
+            closest = distances[-1] if i == 0 else np.minimum(closest, distances[-1])
+
+        table = cls._compact(np.array(distances, dtype=np.float64))
+        return cls(graph, np.array(landmarks, dtype=np.int64), table, csr)
+
+    @staticmethod
+    def _distances_from(csr: CSRGraph, src: int) -> np.ndarray:
+        dist, _ = csr.dijkstra_ids(src)
+        return np.array(dist, dtype=np.float64)
+
+    @staticmethod
+    def _compact(table: np.ndarray) -> np.ndarray:
+        finite = table[np.isfinite(table)]
+        integral = np.array_equal(finite, np.round(finite))
+        if integral and (finite.size == 0 or finite.max() <= np.iinfo(np.int32).max):
+            return np.where(np.isfinite(table), table, NO_PATH).astype(np.int32)
+        return table
+
+    def save(self, path: str) -> None:
+        """Write the landmarks and their distance tables to an .npz file."""
+        np.savez_compressed(
+            path,
+            landmarks=self.landmarks,
+            distances=self.distances,
+            num_edges=self.csr.num_edges(),
+        )
+
+    @classmethod
+    def load(cls, path: str, graph: Graph) -> "Landmarks":
+        """Load tables written by save() for the same graph.
+
+        Vertex ids follow the graph's vertex insertion order, so the graph
+        must be built the same way as when the tables were saved.
+        """
+        with np.load(path) as data:
+            landmarks = data["landmarks"]
+            distances = data["distances"]
+            num_edges = int(data["num_edges"])
+        result = cls(graph, landmarks, distances)
+        if result.csr.num_edges() != num_edges:
+            raise ValueError(
+                f"saved landmarks were built for {num_edges} edges, "
+                f"the graph has {result.csr.num_edges()}"
+            )
+        return result
+
+    def heuristic(self, v: Vertex, dest: Vertex) -> float:
+        index = self.csr.index
+        by_vertex = self._by_vertex
+        unreachable = NO_PATH if self.distances.dtype == np.int32 else float("inf")
+        bound = 0
+        for a, b in zip(by_vertex[index[v]].tolist(), by_vertex[index[dest]].tolist()):
+            if a == b:
+                continue
+            if a == unreachable or b == unreachable:
+                # the landmark reaches only one of them, so there is no path
+                return float("inf")
+            diff = abs(a - b)
+            if diff > bound:
+                bound = diff
+        return bound
+
+    def shortest_path(
+        self, src: Vertex, dest: Vertex, print_result=False
+    ) -> tuple[list[Vertex], float]:
+        """A* query guided by the landmark lower bounds."""
+        return self.graph.astar(src, dest, self.heuristic, print_result)
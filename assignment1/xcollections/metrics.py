@@ -0,0 +1,341 @@
+import numpy as np
+
+from xcollections.csr import CSRGraph, edge_positions
+
+# BFS sweeps picking the iFUB start vertex of every component
+DIAMETER_SWEEPS = 4
+
+# sources one multi-source BFS sweep carries, one per bit of a uint64
+MS_BFS_WIDTH = 64
+
+# radius_and_center gets exact eccentricities of components up to this size
+# from batched multi-source BFS instead of running its bounds loop on each
+SMALL_COMPONENT = 64
+
+# Eccentricities here count hops and, like the max_level returned by
+# Graph.breadthfirstsearch, only look at the vertices a vertex can reach, so
+# on a disconnected graph every component is measured on its own.
+
+
+class _Sweeper:
+    """Vectorised BFS over one CSRGraph that reuses its n-sized scratch arrays.
+
+    levels() resets what it wrote before returning, so a search costs time
+    proportional to the part of the graph it reaches, not to the graph.
+    """
+
+    def __init__(self, csr: CSRGraph) -> None:
+        n = csr.num_vertices()
+        self.indptr, self.indices = csr.indptr, csr.indices
+        self.level = np.full(n, -1, dtype=np.int64)
+        # drops duplicate targets without sorting, as in CSRGraph's BFS
+        self.slot = np.empty(n, dtype=np.int64)
+
+    def levels(
+        self, src: int, max_depth: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Ids reached from src in BFS order, and their hop distances."""
+        level, slot = self.level, self.slot
+        level[src] = 0
+        reached = [np.array([src], dtype=np.int64)]
+        frontier = reached[0]
+        depth = 0
+        while frontier.size and (max_depth is None or depth < max_depth):
+            depth += 1
+            positions, _ = edge_positions(self.indptr, frontier)
+            targets = self.indices[positions]
+            targets = targets[level[targets] == -1]
+            order = np.arange(targets.size)
+            slot[targets] = order
+            frontier = targets[slot[targets] == order]
+            level[frontier] = depth
+            reached.append(frontier)
+        vertices = np.concatenate(reached)
+        distances = level[vertices]
+        level[vertices] = -1
+        return vertices, distances
+
+
+def eccentricity(csr: CSRGraph, v: int) -> int:
+    """Number of hops from v to the farthest vertex it can reach."""
+    return int(_Sweeper(csr).levels(v)[1].max())
+
+
+def _ms_bfs(csr: CSRGraph, sources: np.ndarray):
+    """Bit-parallel BFS from up to MS_BFS_WIDTH sources at once.
+
+    Bit i of seen[v] says whether sources[i] has reached v. Every sweep ORs
+    the bits of the whole frontier into its neighbours, advancing all
+    sources by one level for the cost of a single BFS level. Yields
+    (depth, vertices, bits) for every level, bits[j] holding the sources
+    that first reached vertices[j] at that depth.
+    """
+    n = csr.num_vertices()
+    indptr, indices = csr.indptr, csr.indices
+    has_edges = np.diff(indptr) > 0
+    # neighbour bits in edge order, plus a zero that keeps reduceat in
+    # bounds for trailing vertices without edges
+    pulled = np.zeros(len(indices) + 1, dtype=np.uint64)
+    seen = np.zeros(n, dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), np.arange(len(sources), dtype=np.uint64))
+    np.bitwise_or.at(seen, sources, bits)
+    visit = seen.copy()
+    frontier = np.unique(sources)
+    yield 0, frontier, visit[frontier]
+
+    depth = 0
+    while frontier.size:
+        depth += 1
+        if indptr[frontier + 1].sum() - indptr[frontier].sum() < len(indices) // 2:
+            # small frontier: push its bits along its own edges
+            positions, counts = edge_positions(indptr, frontier)
+            reached = np.zeros(n, dtype=np.uint64)
+            np.bitwise_or.at(
+                reached, indices[positions], np.repeat(visit[frontier], counts)
+            )
+        else:
+            # large frontier: every vertex pulls the bits of all its
+            # neighbours in one pass over the edge array
+            np.take(visit, indices, out=pulled[:-1])
+            reached = np.bitwise_or.reduceat(pulled, indptr[:-1])
+            reached[~has_edges] = 0
+        visit = reached & ~seen
+        frontier = np.flatnonzero(visit)
+        seen |= visit
+        if frontier.size:
+            yield depth, frontier, visit[frontier]
+
+
+def _unpack(bits: np.ndarray, width: int) -> np.ndarray:
+    # (len(bits), width) boolean matrix, column i for bit i
+    as_bytes = bits.astype("<u8").view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1, bitorder="little")[:, :width].astype(bool)
+
+
+def hop_distances(csr: CSRGraph, sources: list[int]) -> np.ndarray:
+    """len(sources) x n matrix of hop distances, -1 where unreachable.
+
+    Runs one bit-parallel sweep (see _ms_bfs) per MS_BFS_WIDTH sources.
+    """
+    result = np.full((len(sources), csr.num_vertices()), -1, dtype=np.int64)
+    for start in range(0, len(sources), MS_BFS_WIDTH):
+        batch = np.asarray(sources[start : start + MS_BFS_WIDTH], dtype=np.int64)
+        for depth, vertices, bits in _ms_bfs(csr, batch):
+            rows, columns = np.nonzero(_unpack(bits, len(batch)))
+            result[start + columns, vertices[rows]] = depth
+    return result
+
+
+def eccentricities(csr: CSRGraph, sources: list[int] | None = None) -> np.ndarray:
+    """Eccentricity of each source (every vertex by default) by bit-parallel BFS.
+
+    Unlike hop_distances this keeps no distance matrix: a source's
+    eccentricity is the last depth at which its bit reaches a new vertex.
+    """
+    if sources is None:
+        sources = list(range(csr.num_vertices()))
+    result = np.zeros(len(sources), dtype=np.int64)
+    for start in range(0, len(sources), MS_BFS_WIDTH):
+        batch = np.asarray(sources[start : start + MS_BFS_WIDTH], dtype=np.int64)
+        for depth, _, bits in _ms_bfs(csr, batch):
+            active = _unpack(np.bitwise_or.reduce(bits, keepdims=True), len(batch))[0]
+            result[start + np.flatnonzero(active)] = depth
+    return result
+
+
+def components(csr: CSRGraph) -> np.ndarray:
+    """Connected component label of every vertex id, numbered by lowest id from 0."""
+    # hooking and pointer jumping over the whole edge array labels every
+    # component at once in a few passes
+    n = csr.num_vertices()
+    owner = np.repeat(np.arange(n), np.diff(csr.indptr))
+    label = np.arange(n)
+    while True:
+        # hook the larger label of every edge onto the smaller one
+        hooked = label.copy()
+        lowest = np.minimum(label[owner], label[csr.indices])
+        np.minimum.at(hooked, label[owner], lowest)
+        # then jump until every label points at a root
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, label):
+            # no edge joins two labels any more
+            return np.unique(label, return_inverse=True)[1]
+        label = hooked
+
+
+class _Components:
+    """Vertex ids grouped by component, for per-component bound arrays.
+
+    members(c) lists the ids of component c in ascending order and local[v]
+    is v's position in that list.
+    """
+
+    def __init__(self, csr: CSRGraph) -> None:
+        label = components(csr)
+        self.label = label
+        self.order = np.argsort(label, kind="stable")
+        self.sizes = np.bincount(label)
+        self.starts = np.zeros(len(self.sizes) + 1, dtype=np.int64)
+        np.cumsum(self.sizes, out=self.starts[1:])
+        self.local = np.empty(len(label), dtype=np.int64)
+        self.local[self.order] = np.arange(len(label)) - self.starts[label[self.order]]
+
+    def members(self, c: int) -> np.ndarray:
+        return self.order[self.starts[c] : self.starts[c + 1]]
+
+    def levels(
+        self, sweeper: _Sweeper, src: int, size: int, max_depth: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # local positions reached from src and their levels, plus the levels
+        # of the whole component (-1 where max_depth cut the search off)
+        vertices, distances = sweeper.levels(src, max_depth)
+        level = np.full(size, -1, dtype=np.int64)
+        positions = self.local[vertices]
+        level[positions] = distances
+        return positions, level
+
+
+def diameter(csr: CSRGraph) -> int:
+    """Largest eccentricity of any vertex, by iFUB on each component."""
+    if csr.num_vertices() == 0:
+        raise ValueError("the diameter of an empty graph is undefined")
+    degrees = np.diff(csr.indptr)
+    groups = _Components(csr)
+    sweeper = _Sweeper(csr)
+    best = 0
+    # largest component first, with bound arrays the size of the component
+    for component in np.argsort(-groups.sizes, kind="stable").tolist():
+        members = groups.members(component)
+        size = members.size
+        if size - 1 <= best:
+            break  # too small to hold a longer shortest path, as is the rest
+        member_degrees = degrees[members]
+        # double sweep, continued: start farthest from a highest degree
+        # vertex, then go farthest from all earlier sweeps. Each sweep's
+        # eccentricity bounds the diameter from below
+        r = int(members[np.argmax(member_degrees)])
+        _, level = groups.levels(sweeper, r, size)
+        source = int(members[np.argmax(level)])
+        lower = 0
+        farthest = np.zeros(size, dtype=np.int64)
+        nearest = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+        for _ in range(DIAMETER_SWEEPS):
+            _, level = groups.levels(sweeper, source, size)
+            lower = max(lower, int(level.max()))
+            np.maximum(farthest, level, out=farthest)
+            np.minimum(nearest, level, out=nearest)
+            # farthest from every sweep so far, then from the farthest one
+            source = int(members[np.lexsort((farthest, nearest))[-1]])
+        # the vertex closest to all sweep sources is usually near the center
+        order = np.lexsort((-member_degrees, farthest))
+        best = max(best, _ifub(sweeper, int(members[order[0]]), lower))
+    return best
+
+
+def _ifub(sweeper: _Sweeper, u: int, lower: int) -> int:
+    # vertices at level i from u have an eccentricity of at most 2 * i, so
+    # the fringes are scanned from the deepest level inwards.
+    # BFS order is level order, so each fringe is a contiguous slice
+    by_level, level = sweeper.levels(u)
+    i = int(level[-1])
+    lower = max(lower, i)
+    bounds = np.searchsorted(level, np.arange(i + 2))
+    # pairs that both sit above level i are at most 2 * i apart, so once the
+    # fringe at level i is done the upper bound drops to 2 * (i - 1)
+    while 2 * i > lower:
+        for x in by_level[bounds[i] : bounds[i + 1]].tolist():
+            lower = max(lower, int(sweeper.levels(x)[1][-1]))
+            if lower == 2 * i:
+                return lower
+        i -= 1
+    return lower
+
+
+def radius_and_center(csr: CSRGraph) -> tuple[int, np.ndarray]:
+    """Smallest eccentricity and the sorted ids of every vertex that attains it."""
+    n = csr.num_vertices()
+    if n == 0:
+        raise ValueError("the radius of an empty graph is undefined")
+    degrees = np.diff(csr.indptr)
+    groups = _Components(csr)
+    sweeper = _Sweeper(csr)
+    # hubs are adjacent to every other vertex of their component, so they
+    # are its center (single vertices, edges, stars, cliques) without a BFS
+    owner = np.repeat(np.arange(n), degrees)
+    self_loops = np.bincount(owner[csr.indices == owner], minlength=n)
+    component_size = groups.sizes[groups.label]
+    hub = degrees - self_loops == component_size - 1
+    hub_ecc = np.minimum(component_size[hub], 2) - 1
+    # (exact eccentricity, id) arrays of the possible center vertices
+    exact_ecc = [hub_ecc]
+    exact_ids = [np.flatnonzero(hub)]
+    best = int(hub_ecc.min()) if hub_ecc.size else int(np.iinfo(np.int64).max)
+
+    has_hub = np.zeros(len(groups.sizes), dtype=bool)
+    has_hub[groups.label[hub]] = True
+    small = groups.sizes <= SMALL_COMPONENT
+    if best >= 2:
+        # without a hub no vertex is within one hop of all others, so these
+        # only matter while the best radius is 2 or more
+        batch = np.flatnonzero((small & ~has_hub)[groups.label])
+        if batch.size:
+            exact_ecc.append(eccentricities(csr, batch.tolist()))
+            exact_ids.append(batch)
+            best = min(best, int(exact_ecc[-1].min()))
+
+    # the rest keep a lower and an upper bound on every eccentricity, one
+    # component at a time, smallest first so the best radius drops early.
+    # Without a hub the radius is at least 2
+    for component in np.argsort(groups.sizes, kind="stable").tolist():
+        if has_hub[component] or small[component]:
+            continue
+        if best < 2:
+            break
+        members = groups.members(component)
+        size = members.size
+        member_degrees = degrees[members]
+        lower = np.zeros(size, dtype=np.int64)
+        upper = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+        pick_lowest = True
+
+        # done once every vertex that could still beat best is exact
+        while True:
+            candidates = np.flatnonzero((lower < upper) & (lower <= best))
+            if candidates.size == 0:
+                break
+            # alternate a likely center vertex (smallest lower bound) with a
+            # peripheral one (largest upper bound), which tightens the lower
+            # bounds of everything else
+            if pick_lowest:
+                # most promising first, ties broken towards well connected vertices
+                order = np.lexsort((-member_degrees[candidates], lower[candidates]))
+            else:
+                order = np.lexsort((-member_degrees[candidates], -upper[candidates]))
+            w = int(candidates[order[0]])
+
+            # a likely center that does not reach its whole component within
+            # the best radius cannot beat it, so its BFS stops there
+            max_depth = best if pick_lowest and best < n else None
+            reached, level = groups.levels(sweeper, int(members[w]), size, max_depth)
+            pick_lowest = not pick_lowest
+            if reached.size < size:
+                lower[w] = best + 1  # cut off at the best radius, so worse than it
+                continue
+            # v at distance d from w: max(d, e - d) <= ecc(v) <= e + d
+            e = int(level.max())
+            np.maximum(lower, np.maximum(level, e - level), out=lower)
+            np.minimum(upper, e + level, out=upper)
+            best = min(best, int(upper.min()))
+
+        exact = (lower == upper) & (lower <= best)
+        exact_ecc.append(lower[exact])
+        exact_ids.append(members[exact])
+
+    ecc = np.concatenate(exact_ecc)
+    ids = np.concatenate(exact_ids)
+    radius = int(ecc.min())
+    return radius, np.sort(ids[ecc == radius])
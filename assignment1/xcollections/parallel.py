@@ -0,0 +1,134 @@
+import os
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable
+
+import numpy as np
+
+from xcollections.csr import CSRGraph
+
+# name -> (shared memory block, shape, dtype) of every shared array
+ArrayLayout = dict[str, tuple[str, tuple[int, ...], str]]
+
+# set in every worker process by _init_worker
+_worker_arrays: dict[str, np.ndarray] = {}
+_worker_blocks: list[SharedMemory] = []
+_worker_state: Any = None
+
+
+def _init_worker(
+    layout: ArrayLayout, setup: Callable[[dict[str, np.ndarray]], Any] | None
+) -> None:
+    # workers attach to the shared blocks once and keep them for their lifetime
+    global _worker_state
+    for key, (name, shape, dtype) in layout.items():
+        block = SharedMemory(name=name)
+        _worker_blocks.append(block)
+        _worker_arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    if setup is not None:
+        _worker_state = setup(_worker_arrays)
+
+
+def worker_arrays() -> dict[str, np.ndarray]:
+    """The arrays shared with the pool this worker process belongs to, by name."""
+    return _worker_arrays
+
+
+def worker_state() -> Any:
+    """Whatever the pool's setup function built from the arrays in this worker."""
+    return _worker_state
+
+
+class SharedArrays:
+    """NumPy arrays copied once into shared memory and read by a process pool.
+
+    arrays holds views of the shared copies, so the creating process can keep
+    writing to them and workers see the changes. Workers of pool() attach to
+    every block when they start, read them through worker_arrays() and, with
+    a setup function, get setup(arrays) once through worker_state(). close()
+    frees the memory; shut the pool down first.
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]) -> None:
+        self.arrays: dict[str, np.ndarray] = {}
+        self.layout: ArrayLayout = {}
+        self._blocks: list[SharedMemory] = []
+        for key, array in arrays.items():
+            block = SharedMemory(create=True, size=max(array.nbytes, 1))
+            self._blocks.append(block)
+            shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            shared[:] = array
+            self.arrays[key] = shared
+            self.layout[key] = (block.name, array.shape, array.dtype.str)
+
+    def pool(
+        self,
+        workers: int,
+        setup: Callable[[dict[str, np.ndarray]], Any] | None = None,
+    ) -> PoolType:
+        return Pool(workers, initializer=_init_worker, initargs=(self.layout, setup))
+
+    def close(self) -> None:
+        # drop the views before the blocks they point into
+        self.arrays.clear()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+
+def _distance_setup(arrays: dict[str, np.ndarray]) -> tuple[CSRGraph, list[int]]:
+    # workers only need ids, not Vertex objects
+    n = len(arrays["indptr"]) - 1
+    csr = CSRGraph(
+        arrays["indptr"], arrays["indices"], arrays["weights"], list(range(n))
+    )
+    return csr, arrays["targets"].tolist()
+
+
+def _distance_row(src: int) -> list[float]:
+    csr, targets = worker_state()
+    return csr.distances_to(src, targets)
+
+
+def distance_matrix(
+    csr: CSRGraph,
+    sources: list[int],
+    targets: list[int],
+    workers: int | None = None,
+) -> np.ndarray:
+    """len(sources) x len(targets) float64 matrix of shortest distances by id.
+
+    Each row is one multi-target Dijkstra run (CSRGraph.distances_to).
+    Rows are spread over a pool of workers processes (default: one per
+    core) that read the graph from shared memory; workers=1 computes
+    everything in this process. Unreachable pairs are inf.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    result = np.empty((len(sources), len(targets)), dtype=np.float64)
+    if not sources:
+        return result
+
+    if workers <= 1:
+        for i, src in enumerate(sources):
+            result[i] = csr.distances_to(src, targets)
+        return result
+
+    chunksize = max(1, len(sources) // (workers * 4))
+    shared = SharedArrays(
+        {
+            "indptr": csr.indptr,
+            "indices": csr.indices,
+            "weights": csr.weights,
+            "targets": np.asarray(targets, dtype=np.int64),
+        }
+    )
+    try:
+        with shared.pool(workers, _distance_setup) as pool:
+            for i, row in enumerate(pool.imap(_distance_row, sources, chunksize)):
+                result[i] = row
+    finally:
+        shared.close()
+    return result
@@ -1,66 +1,157 @@
 import heapq
 import itertools
 
-from dataclasses import dataclass, field
-
 # python doesn't yet support any and iterator as built-in types
-from typing import Any, Iterator
-
+from typing import Any, Iterable, Iterator
 
 # inspired by https://docs.python.org/3/library/heapq.html
-@dataclass(order=True)
-class PrioritizedItem:
-    priority: int | float
-    count: int = field(compare=True)  # tie braker when two items have the same priority
-    item: Any = field(compare=False)
-    REMOVED: bool = field(default=False, compare=False)
-
-
-class AdaptablePQ:
-    def __init__(self):
+# Entries are plain lists [priority, count, item, removed] instead of objects
+# (the indexed heaps drop the removed flag, SimplePQ uses immutable tuples).
+# Lists are compared element by element in C, so heap operations never call
+# back into Python, and count (the tie braker when two items have the same
+# priority) is unique, so item and the removed flag are never compared.
+PrioritizedItem = list
+PRIORITY, COUNT, ITEM, REMOVED = range(4)
+# RadixHeapPQ entries hold their bucket index and position in that bucket
+# where the others keep the removed flag
+BUCKET, SLOT = 3, 4
+
+
+# compact once stale entries outnumber live ones by this factor
+DEFAULT_COMPACTION_THRESHOLD = 1.0
+
+
+class BulkOpsMixin:
+    """Batch construction and popping shared by every queue below.
+
+    add_many falls back to one add per item; heap based queues override it to
+    heapify the whole batch in linear time.
+    """
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[Any, int | float]], *args, **kwargs):
+        pq = cls(*args, **kwargs)
+        pq.add_many(items)
+        return pq
+
+    def add_many(self, items: Iterable[tuple[Any, int | float]]) -> None:
+        for task, priority in items:
+            self.add(task, priority)
+
+    def pop_many(self, k: int) -> list[tuple[Any, int | float]]:
+        """Pop up to k items in priority order. Stops early once the queue is empty."""
+        popped = []
+        while len(popped) < k and len(self) > 0:
+            popped.append(self.pop())
+        return popped
+
+
+def _latest_priorities(
+    items: Iterable[tuple[Any, int | float]],
+) -> dict[Any, int | float]:
+    # a task repeated in a batch keeps its last priority and is ordered by its
+    # last occurrence, exactly as if the items had been added one by one
+    latest = {}
+    for task, priority in items:
+        latest.pop(task, None)
+        latest[task] = priority
+    return latest
+
+
+class AdaptablePQ(BulkOpsMixin):
+    """Binary heap with lazy deletion.
+
+    Removed entries are only flagged and stay in the heap until popped. Once
+    the number of stale entries passes compaction_threshold * live entries the
+    heap is rebuilt without them (pass None to never compact).
+    """
+
+    adaptable = True
+
+    def __init__(
+        self, compaction_threshold: float | None = DEFAULT_COMPACTION_THRESHOLD
+    ):
         self.heap: list[PrioritizedItem] = []
         self.entry_finder: dict[Any, PrioritizedItem] = {}
         self.counter = itertools.count()
+        self.compaction_threshold = compaction_threshold
+        self.stale_count = 0
+        self.compactions = 0
 
     def __len__(self) -> int:
         return len(self.entry_finder)
 
+    @property
+    def live_count(self) -> int:
+        return len(self.entry_finder)
+
     def __str__(self) -> str:
-        active_entries = [entry for entry in self.heap if not entry.REMOVED]
+        active_entries = [entry for entry in self.heap if not entry[REMOVED]]
         return str(active_entries)
 
     def __iter__(self) -> Iterator[PrioritizedItem]:
-        return (entry for entry in self.heap if not entry.REMOVED)
+        return (entry for entry in self.heap if not entry[REMOVED])
 
     def add(self, task: Any, priority: int | float = 0) -> PrioritizedItem:
         if task in self.entry_finder:
             self.remove(task)
 
         count = next(self.counter)
-        entry = PrioritizedItem(priority=priority, count=count, item=task)
+        entry = [priority, count, task, False]
         self.entry_finder[task] = entry
         heapq.heappush(self.heap, entry)
         return entry
 
+    def add_many(self, items: Iterable[tuple[Any, int | float]]) -> None:
+        entries = []
+        for task, priority in _latest_priorities(items).items():
+            if task in self.entry_finder:
+                self.remove(task)
+            entry = [priority, next(self.counter), task, False]
+            self.entry_finder[task] = entry
+            entries.append(entry)
+
+        if len(entries) >= len(self.heap):
+            self.heap.extend(entries)
+            heapq.heapify(self.heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self.heap, entry)
+
     def remove(self, task: Any) -> None:
         entry = self.entry_finder.pop(task)
-        entry.REMOVED = True
+        entry[REMOVED] = True
+        self.stale_count += 1
+        if (
+            self.compaction_threshold is not None
+            and self.stale_count > self.compaction_threshold * len(self.entry_finder)
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop every removed entry and restore the heap in linear time."""
+        self.heap = [entry for entry in self.heap if not entry[REMOVED]]
+        heapq.heapify(self.heap)
+        self.stale_count = 0
+        self.compactions += 1
 
     def pop(self) -> tuple[Any, int | float]:
         while self.heap:
             entry = heapq.heappop(self.heap)
-            if not entry.REMOVED:
-                del self.entry_finder[entry.item]
-                return entry.item, entry.priority
+            if not entry[REMOVED]:
+                del self.entry_finder[entry[ITEM]]
+                return entry[ITEM], entry[PRIORITY]
+            self.stale_count -= 1
         raise IndexError("pop from an empty priority queue")
 
     def peek(self) -> tuple[Any, int | float]:
         while self.heap:
             entry = self.heap[0]
-            if entry.REMOVED:
+            if entry[REMOVED]:
                 heapq.heappop(self.heap)
+                self.stale_count -= 1
             else:
-                return entry.item, entry.priority
+                return entry[ITEM], entry[PRIORITY]
         raise IndexError("peek from an empty priority queue")
 
     def update_priority(self, task: Any, new_priority: int) -> PrioritizedItem:
@@ -70,34 +161,405 @@ class AdaptablePQ:
         return self.add(task, new_priority)
 
 
-class AdaptablePQUnsortedList:
+class IndexedAdaptablePQ(BulkOpsMixin):
+    """Binary heap that remembers where every task lives in the heap.
+
+    Unlike AdaptablePQ, updating a priority sifts the existing entry in place
+    instead of leaving a removed entry behind, so the heap never holds more
+    entries than there are live tasks.
+    """
+
+    adaptable = True
+
     def __init__(self):
+        self.heap: list[PrioritizedItem] = []
+        self.position: dict[Any, int] = {}  # task -> index in self.heap
+        self.counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __str__(self) -> str:
+        return str(self.heap)
+
+    def __iter__(self) -> Iterator[PrioritizedItem]:
+        return iter(self.heap)
+
+    def add(self, task: Any, priority: int | float = 0) -> PrioritizedItem:
+        if task in self.position:
+            return self.update_priority(task, priority)
+
+        count = next(self.counter)
+        entry = [priority, count, task]
+        self.heap.append(entry)
+        self._sift_up(len(self.heap) - 1)
+        return entry
+
+    def add_many(self, items: Iterable[tuple[Any, int | float]]) -> None:
+        items = list(items)
+        heap = self.heap
+        if len(items) < len(heap):
+            for task, priority in items:
+                self.add(task, priority)
+            return
+
+        for task, priority in items:
+            if task in self.position:
+                entry = heap[self.position[task]]
+                entry[PRIORITY] = priority
+                entry[COUNT] = next(self.counter)
+            else:
+                self.position[task] = len(heap)
+                heap.append([priority, next(self.counter), task])
+
+        # bottom-up heap construction touches every entry once, so it is O(n)
+        for pos in reversed(range(len(heap))):
+            self._sift_down(pos)
+
+    def remove(self, task: Any) -> None:
+        pos = self.position.pop(task)
+        last = self.heap.pop()
+        if pos < len(self.heap):
+            # move the last entry into the hole and restore the heap invariant
+            self.heap[pos] = last
+            self._sift_down(self._sift_up(pos))
+
+    def pop(self) -> tuple[Any, int | float]:
+        if not self.heap:
+            raise IndexError("pop from an empty priority queue")
+        entry = self.heap[0]
+        del self.position[entry[ITEM]]
+        last = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last
+            self._sift_down(0)
+        return entry[ITEM], entry[PRIORITY]
+
+    def peek(self) -> tuple[Any, int | float]:
+        if not self.heap:
+            raise IndexError("peek from an empty priority queue")
+        entry = self.heap[0]
+        return entry[ITEM], entry[PRIORITY]
+
+    def update_priority(self, task: Any, new_priority: int | float) -> PrioritizedItem:
+        if task not in self.position:
+            raise KeyError(f"Task {task} not found")
+        pos = self.position[task]
+        entry = self.heap[pos]
+        entry[PRIORITY] = new_priority
+        # a fresh count keeps the same FIFO tie breaking as remove + add
+        entry[COUNT] = next(self.counter)
+        self._sift_down(self._sift_up(pos))
+        return entry
+
+    def _sift_up(self, pos: int) -> int:
+        heap = self.heap
+        position = self.position
+        entry = heap[pos]
+        while pos > 0:
+            parent_pos = (pos - 1) >> 1
+            parent = heap[parent_pos]
+            if not entry < parent:
+                break
+            heap[pos] = parent
+            position[parent[ITEM]] = pos
+            pos = parent_pos
+        heap[pos] = entry
+        position[entry[ITEM]] = pos
+        return pos
+
+    def _sift_down(self, pos: int) -> int:
+        heap = self.heap
+        position = self.position
+        size = len(heap)
+        entry = heap[pos]
+        child_pos = 2 * pos + 1
+        while child_pos < size:
+            right_pos = child_pos + 1
+            if right_pos < size and heap[right_pos] < heap[child_pos]:
+                child_pos = right_pos
+            child = heap[child_pos]
+            if not child < entry:
+                break
+            heap[pos] = child
+            position[child[ITEM]] = pos
+            pos = child_pos
+            child_pos = 2 * pos + 1
+        heap[pos] = entry
+        position[entry[ITEM]] = pos
+        return pos
+
+
+class DaryHeapPQ(IndexedAdaptablePQ):
+    """Indexed d-ary heap, 4-ary by default.
+
+    A wider heap is shallower, so sifting touches fewer levels and the
+    children of a node sit next to each other in the list, which makes
+    updates (the common operation in Dijkstra) cheaper than in a binary heap.
+    """
+
+    def __init__(self, arity: int = 4):
+        super().__init__()
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+
+    def _sift_up(self, pos: int) -> int:
+        heap = self.heap
+        position = self.position
+        arity = self.arity
+        entry = heap[pos]
+        while pos > 0:
+            parent_pos = (pos - 1) // arity
+            parent = heap[parent_pos]
+            if not entry < parent:
+                break
+            heap[pos] = parent
+            position[parent[ITEM]] = pos
+            pos = parent_pos
+        heap[pos] = entry
+        position[entry[ITEM]] = pos
+        return pos
+
+    def _sift_down(self, pos: int) -> int:
+        heap = self.heap
+        position = self.position
+        arity = self.arity
+        size = len(heap)
+        entry = heap[pos]
+        first_child = arity * pos + 1
+        while first_child < size:
+            child_pos = first_child
+            child = heap[child_pos]
+            for i in range(first_child + 1, min(first_child + arity, size)):
+                if heap[i] < child:
+                    child_pos = i
+                    child = heap[i]
+            if not child < entry:
+                break
+            heap[pos] = child
+            position[child[ITEM]] = pos
+            pos = child_pos
+            first_child = arity * pos + 1
+        heap[pos] = entry
+        position[entry[ITEM]] = pos
+        return pos
+
+
+class PairingHeapNode:
+    __slots__ = ("priority", "count", "item", "child", "sibling", "prev")
+
+    def __init__(self, priority: int | float, count: int, item: Any) -> None:
+        self.priority = priority
+        self.count = count
+        self.item = item
+        self.child: PairingHeapNode | None = None
+        self.sibling: PairingHeapNode | None = None
+        # parent if this is the leftmost child, left sibling otherwise
+        self.prev: PairingHeapNode | None = None
+
+    def __lt__(self, other: "PairingHeapNode") -> bool:
+        if self.priority != other.priority:
+            return self.priority < other.priority
+        return self.count < other.count
+
+    def __repr__(self) -> str:
+        return f"PairingHeapNode(priority={self.priority!r}, count={self.count}, item={self.item!r})"
+
+
+class PairingHeapPQ(BulkOpsMixin):
+    """Pairing heap with O(1) add and amortized o(log n) decrease-key.
+
+    Decreasing a priority cuts the node's subtree off and melds it back into
+    the root instead of sifting, which suits graphs where edges are relaxed
+    much more often than vertices are settled.
+    """
+
+    adaptable = True
+
+    def __init__(self):
+        self.root: PairingHeapNode | None = None
+        self.entry_finder: dict[Any, PairingHeapNode] = {}
+        self.counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.entry_finder)
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __iter__(self) -> Iterator[PairingHeapNode]:
+        return iter(self.entry_finder.values())
+
+    def add(self, task: Any, priority: int | float = 0) -> PairingHeapNode:
+        if task in self.entry_finder:
+            self.remove(task)
+
+        node = PairingHeapNode(priority, next(self.counter), task)
+        self.entry_finder[task] = node
+        self.root = node if self.root is None else self._meld(self.root, node)
+        return node
+
+    def remove(self, task: Any) -> None:
+        node = self.entry_finder.pop(task)
+        if node is self.root:
+            self.root = self._merge_pairs(node.child)
+            return
+
+        self._cut(node)
+        rest = self._merge_pairs(node.child)
+        if rest is not None:
+            self.root = self._meld(self.root, rest)
+
+    def pop(self) -> tuple[Any, int | float]:
+        if self.root is None:
+            raise IndexError("pop from an empty priority queue")
+        node = self.root
+        del self.entry_finder[node.item]
+        self.root = self._merge_pairs(node.child)
+        return node.item, node.priority
+
+    def peek(self) -> tuple[Any, int | float]:
+        if self.root is None:
+            raise IndexError("peek from an empty priority queue")
+        return self.root.item, self.root.priority
+
+    def update_priority(self, task: Any, new_priority: int | float) -> PairingHeapNode:
+        if task not in self.entry_finder:
+            raise KeyError(f"Task {task} not found")
+        node = self.entry_finder[task]
+        if not new_priority < node.priority:
+            # increasing a key can break the heap order below the node
+            return self.add(task, new_priority)
+
+        node.priority = new_priority
+        node.count = next(self.counter)
+        if node is not self.root:
+            self._cut(node)
+            self.root = self._meld(self.root, node)
+        return node
+
+    @staticmethod
+    def _meld(a: PairingHeapNode, b: PairingHeapNode) -> PairingHeapNode:
+        if b < a:
+            a, b = b, a
+        # b becomes the leftmost child of a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        a.prev = None
+        return a
+
+    @staticmethod
+    def _cut(node: PairingHeapNode) -> None:
+        prev = node.prev
+        if prev is not None:
+            if prev.child is node:
+                prev.child = node.sibling
+            else:
+                prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = prev
+        node.prev = None
+        node.sibling = None
+
+    def _merge_pairs(self, first: PairingHeapNode | None) -> PairingHeapNode | None:
+        # two pass merge: meld siblings pairwise left to right, then fold right to left
+        pairs = []
+        node = first
+        while node is not None:
+            a = node
+            b = a.sibling
+            node = b.sibling if b is not None else None
+            a.sibling = a.prev = None
+            if b is not None:
+                b.sibling = b.prev = None
+                a = self._meld(a, b)
+            pairs.append(a)
+
+        if not pairs:
+            return None
+        merged = pairs.pop()
+        while pairs:
+            merged = self._meld(pairs.pop(), merged)
+        return merged
+
+
+class AdaptablePQUnsortedList(BulkOpsMixin):
+    """Unsorted list with lazy deletion, compacted like AdaptablePQ."""
+
+    adaptable = True
+
+    def __init__(
+        self, compaction_threshold: float | None = DEFAULT_COMPACTION_THRESHOLD
+    ):
         self.items: list[PrioritizedItem] = []
         self.entry_finder: dict[Any, PrioritizedItem] = {}
         self.counter = itertools.count()
+        self.compaction_threshold = compaction_threshold
+        self.stale_count = 0
+        self.compactions = 0
 
     def __len__(self) -> int:
         return len(self.entry_finder)
 
+    @property
+    def live_count(self) -> int:
+        return len(self.entry_finder)
+
     def __str__(self) -> str:
-        active_entries = [entry for entry in self.items if not entry.REMOVED]
+        active_entries = [entry for entry in self.items if not entry[REMOVED]]
         return str(active_entries)
 
     def __iter__(self) -> Iterator[PrioritizedItem]:
-        return (entry for entry in self.items if not entry.REMOVED)
+        return (entry for entry in self.items if not entry[REMOVED])
 
     def add(self, task: Any, priority: int | float = 0) -> PrioritizedItem:
         if task in self.entry_finder:
             self.remove(task)
         count = next(self.counter)
-        entry = PrioritizedItem(priority=priority, count=count, item=task)
+        entry = [priority, count, task, False]
         self.entry_finder[task] = entry
         self.items.append(entry)
         return entry
 
+    def add_many(self, items: Iterable[tuple[Any, int | float]]) -> None:
+        for task, priority in _latest_priorities(items).items():
+            if task in self.entry_finder:
+                self.remove(task)
+            entry = [priority, next(self.counter), task, False]
+            self.entry_finder[task] = entry
+            self.items.append(entry)
+
+    def pop_many(self, k: int) -> list[tuple[Any, int | float]]:
+        # one scan selects the k smallest instead of k scans of the whole list
+        live = [entry for entry in self.items if not entry[REMOVED]]
+        chosen = heapq.nsmallest(k, live)
+        chosen_ids = {id(entry) for entry in chosen}
+        self.items = [entry for entry in live if id(entry) not in chosen_ids]
+        self.stale_count = 0
+        for entry in chosen:
+            del self.entry_finder[entry[ITEM]]
+        return [(entry[ITEM], entry[PRIORITY]) for entry in chosen]
+
     def remove(self, task: Any) -> None:
         entry = self.entry_finder.pop(task)
-        entry.REMOVED = True
+        entry[REMOVED] = True
+        self.stale_count += 1
+        if (
+            self.compaction_threshold is not None
+            and self.stale_count > self.compaction_threshold * len(self.entry_finder)
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop every removed entry so pop and peek only scan live ones."""
+        self.items = [entry for entry in self.items if not entry[REMOVED]]
+        self.stale_count = 0
+        self.compactions += 1
 
     def pop(self) -> tuple[Any, int | float]:
         if not self.items:
@@ -107,17 +569,18 @@ class AdaptablePQUnsortedList:
         min_entry = None
 
         for i, entry in enumerate(self.items):
-            if not entry.REMOVED and (min_entry is None or entry < min_entry):
+            if not entry[REMOVED] and (min_entry is None or entry < min_entry):
                 min_idx = i
                 min_entry = entry
 
         if min_entry is None:
             self.items = []
+            self.stale_count = 0
             raise IndexError("pop from an empty priority queue")
 
         self.items.pop(min_idx)
-        del self.entry_finder[min_entry.item]
-        return min_entry.item, min_entry.priority
+        del self.entry_finder[min_entry[ITEM]]
+        return min_entry[ITEM], min_entry[PRIORITY]
 
     def peek(self) -> tuple[Any, int | float]:
         if not self.items:
@@ -126,13 +589,13 @@ class AdaptablePQUnsortedList:
         min_entry = None
 
         for entry in self.items:
-            if not entry.REMOVED and (min_entry is None or entry < min_entry):
+            if not entry[REMOVED] and (min_entry is None or entry < min_entry):
                 min_entry = entry
 
         if min_entry is None:
             raise IndexError("peek from an empty priority queue")
 
-        return min_entry.item, min_entry.priority
+        return min_entry[ITEM], min_entry[PRIORITY]
 
     def update_priority(self, task: Any, new_priority: int) -> PrioritizedItem:
         if task not in self.entry_finder:
@@ -141,9 +604,127 @@ class AdaptablePQUnsortedList:
         return self.add(task, new_priority)
 
 
-class SimplePQ:
+class RadixHeapPQ(BulkOpsMixin):
+    """Monotone priority queue for non-negative integer priorities (radix heap).
+
+    Entries live in buckets keyed by the highest bit in which their priority
+    differs from the last popped priority, which gives O(1) amortized add and
+    update and O(log C) amortized pop, where C is the largest edge weight.
+    Priorities may never drop below the last popped priority, which is always
+    the case in Dijkstra with non-negative weights. float("inf") is accepted
+    and kept aside so unreachable vertices can still be inserted up front.
+    Ties are broken arbitrarily.
+    """
+
+    adaptable = True
+
+    # entry layout: [PRIORITY, COUNT, ITEM, BUCKET, SLOT]
+    INFINITE = -1
+
     def __init__(self):
-        self.heap: list[PrioritizedItem] = []
+        self.buckets: list[list[list]] = [[]]
+        self.infinite: list[list] = []
+        self.entry_finder: dict[Any, list] = {}
+        self.counter = itertools.count()
+        self.last = 0
+
+    def __len__(self) -> int:
+        return len(self.entry_finder)
+
+    def __str__(self) -> str:
+        return str([(entry[PRIORITY], entry[ITEM]) for entry in self])
+
+    def __iter__(self) -> Iterator[list]:
+        return iter(self.entry_finder.values())
+
+    def add(self, task: Any, priority: int | float = 0) -> list:
+        if task in self.entry_finder:
+            self.remove(task)
+        self._check_priority(priority)
+
+        entry = [priority, next(self.counter), task, 0, 0]
+        self.entry_finder[task] = entry
+        self._place(entry)
+        return entry
+
+    def remove(self, task: Any) -> None:
+        entry = self.entry_finder.pop(task)
+        self._unplace(entry)
+
+    def pop(self) -> tuple[Any, int | float]:
+        entry = self._min_entry("pop")
+        self._unplace(entry)
+        del self.entry_finder[entry[ITEM]]
+        return entry[ITEM], entry[PRIORITY]
+
+    def peek(self) -> tuple[Any, int | float]:
+        entry = self._min_entry("peek")
+        return entry[ITEM], entry[PRIORITY]
+
+    def update_priority(self, task: Any, new_priority: int | float) -> list:
+        if task not in self.entry_finder:
+            raise KeyError(f"Task {task} not found")
+        return self.add(task, new_priority)
+
+    def _check_priority(self, priority: int | float) -> None:
+        if priority == float("inf"):
+            return
+        if not isinstance(priority, int) or isinstance(priority, bool):
+            raise TypeError(f"priority must be an integer, got {priority!r}")
+        if priority < self.last:
+            raise ValueError(
+                f"priority {priority} is smaller than the last popped priority {self.last}"
+            )
+
+    def _place(self, entry: list) -> None:
+        if entry[PRIORITY] == float("inf"):
+            bucket_idx = self.INFINITE
+            bucket = self.infinite
+        else:
+            bucket_idx = (entry[PRIORITY] ^ self.last).bit_length()
+            while bucket_idx >= len(self.buckets):
+                self.buckets.append([])
+            bucket = self.buckets[bucket_idx]
+        entry[BUCKET] = bucket_idx
+        entry[SLOT] = len(bucket)
+        bucket.append(entry)
+
+    def _unplace(self, entry: list) -> None:
+        bucket_idx = entry[BUCKET]
+        bucket = (
+            self.infinite if bucket_idx == self.INFINITE else self.buckets[bucket_idx]
+        )
+        last = bucket.pop()
+        if last is not entry:
+            # swap the last entry of the bucket into the hole
+            bucket[entry[SLOT]] = last
+            last[SLOT] = entry[SLOT]
+
+    def _min_entry(self, op: str) -> list:
+        buckets = self.buckets
+        if not buckets[0]:
+            # find the first non-empty bucket and redistribute it around its minimum
+            for bucket_idx in range(1, len(buckets)):
+                bucket = buckets[bucket_idx]
+                if bucket:
+                    break
+            else:
+                if self.infinite:
+                    return self.infinite[-1]
+                raise IndexError(f"{op} from an empty priority queue")
+
+            buckets[bucket_idx] = []
+            self.last = min(entry[PRIORITY] for entry in bucket)
+            for entry in bucket:
+                self._place(entry)
+        return buckets[0][-1]
+
+
+class SimplePQ(BulkOpsMixin):
+    adaptable = False
+
+    def __init__(self):
+        self.heap: list[tuple[int | float, int, Any]] = []
         self.counter = itertools.count()
 
     def __len__(self) -> int:
@@ -152,23 +733,32 @@ class SimplePQ:
     def __str__(self) -> str:
         return str(self.heap)
 
-    def __iter__(self) -> Iterator[PrioritizedItem]:
+    def __iter__(self) -> Iterator[tuple[int | float, int, Any]]:
         return iter(self.heap)
 
-    def add(self, task: Any, priority: int | float = 0) -> PrioritizedItem:
+    def add(self, task: Any, priority: int | float = 0) -> tuple[int | float, int, Any]:
         count = next(self.counter)
-        entry = PrioritizedItem(priority=priority, count=count, item=task)
+        entry = (priority, count, task)
         heapq.heappush(self.heap, entry)
         return entry
 
+    def add_many(self, items: Iterable[tuple[Any, int | float]]) -> None:
+        entries = [(priority, next(self.counter), task) for task, priority in items]
+        if len(entries) >= len(self.heap):
+            self.heap.extend(entries)
+            heapq.heapify(self.heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self.heap, entry)
+
     def pop(self) -> tuple[Any, int | float]:
         if not self.heap:
             raise IndexError("pop from an empty priority queue")
         entry = heapq.heappop(self.heap)
-        return entry.item, entry.priority
+        return entry[ITEM], entry[PRIORITY]
 
     def peek(self) -> tuple[Any, int | float]:
         if not self.heap:
             raise IndexError("peek from an empty priority queue")
         entry = self.heap[0]
-        return entry.item, entry.priority
+        return entry[ITEM], entry[PRIORITY]